@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Daily Report System
+Headless batch PDF generation for saved report JSON files.
+
+Usage:
+    python batch_generate.py reports/ -o pdfs/
+    python batch_generate.py "reports/2025-03-*.json" -c high -j 4
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Tuple, Dict, Any
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.report_model import Report
+from services.pdf_generator import generate_pdf, CompressionLevel
+
+
+COMPRESSION_CHOICES = [
+    CompressionLevel.LOW, CompressionLevel.MEDIUM, CompressionLevel.HIGH, CompressionLevel.TARGET_SIZE
+]
+
+
+def collect_report_files(inputs: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Expand folders and glob patterns into a list of JSON files.
+
+    Args:
+        inputs: Folders, glob patterns or file paths
+
+    Returns:
+        Tuple[List[str], List[str]]: (unique JSON file paths in input order,
+        inputs that matched no file)
+    """
+    files = []
+    unmatched = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = sorted(glob.glob(os.path.join(item, '*.json')))
+        else:
+            matches = sorted(glob.glob(item)) or ([item] if os.path.isfile(item) else [])
+
+        if not matches:
+            unmatched.append(item)
+        for path in matches:
+            if path not in files:
+                files.append(path)
+    return files, unmatched
+
+
+def output_paths(files: List[str], output_dir: Optional[str]) -> Dict[str, str]:
+    """
+    Choose the PDF path for every report file.
+
+    Without an output folder each PDF goes next to its JSON file. With one,
+    the folders below the inputs' common parent are kept, so files with the
+    same name in different folders don't overwrite each other (files from a
+    single folder all go straight into output_dir).
+
+    Args:
+        files: Report JSON files
+        output_dir: Folder for the PDFs (None = next to each JSON file)
+
+    Returns:
+        Dict[str, str]: PDF path per JSON file
+    """
+    paths = {}
+    absolute = [os.path.abspath(path) for path in files]
+    common_dir = os.path.commonpath([os.path.dirname(path) for path in absolute]) if absolute else ''
+    for json_path, absolute_path in zip(files, absolute):
+        pdf_name = os.path.splitext(absolute_path)[0] + '.pdf'
+        if output_dir:
+            pdf_name = os.path.join(output_dir, os.path.relpath(pdf_name, common_dir))
+        paths[json_path] = pdf_name
+    return paths
+
+
+def generate_one(
+    json_path: str,
+    output_path: str,
+    compression_level: str,
+    include_signatures: bool,
+    use_cache: bool,
+    target_size_bytes: Optional[int] = None
+) -> Tuple[str, bool, str, float, Dict[str, Any]]:
+    """
+    Generate the PDF for a single report file.
+
+    Args:
+        json_path: Report JSON file
+        output_path: PDF file to write
+        compression_level: "low", "medium", "high" or "target_size"
+        include_signatures: Whether to include signature fields
+        use_cache: Whether to reuse compressed images from the on-disk cache
+        target_size_bytes: Total PDF budget for "target_size"
+
+    Returns:
+        Tuple[str, bool, str, float, Dict]: (json_path, success, message, seconds, stats)
+        where stats holds phase timings and image totals from the generator events
+    """
+    start = time.perf_counter()
+    stats = empty_stats()
+
+    def collect(event: Dict[str, Any]):
+        if event['event'] == 'phase':
+            stats['phases'][event['phase']] = event['seconds']
+        elif event['event'] == 'image':
+            stats['images'] += 1
+            stats['cached'] += event['source'] == 'cache'
+            stats['bytes_in'] += event['bytes_in']
+            stats['bytes_out'] += event['bytes_out']
+        elif event['event'] == 'finished':
+            stats['pdf_bytes'] = event['output_bytes']
+
+    report, message = Report.from_json(json_path)
+    if not report:
+        return json_path, False, message, time.perf_counter() - start, stats
+
+    try:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # One image thread per process, the process pool already uses every core
+        success, message = generate_pdf(
+            report, output_path, compression_level, include_signatures,
+            max_workers=1, use_cache=use_cache, in_memory=True,
+            event_callback=collect, target_size_bytes=target_size_bytes
+        )
+    except Exception as e:
+        success, message = False, f"Error generating PDF: {str(e)}"
+
+    return json_path, success, message, time.perf_counter() - start, stats
+
+
+def empty_stats() -> Dict[str, Any]:
+    """Generation stats before any event was received."""
+    return {'phases': {}, 'images': 0, 'cached': 0, 'bytes_in': 0, 'bytes_out': 0, 'pdf_bytes': 0}
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """Format generation stats for verbose output."""
+    phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in stats['phases'].items())
+    return (
+        f"{phases}; {stats['images']} images ({stats['cached']} cached), "
+        f"{stats['bytes_in'] / 1024:.0f}KB -> {stats['bytes_out'] / 1024:.0f}KB, "
+        f"PDF {stats['pdf_bytes'] / 1024:.0f}KB"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Batch generation entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate PDFs for saved report JSON files without starting the GUI."
+    )
+    parser.add_argument('inputs', nargs='+', help="Folders, glob patterns or JSON files")
+    parser.add_argument('-o', '--output-dir', help="Folder for generated PDFs (default: next to each JSON)")
+    parser.add_argument('-c', '--compression', choices=COMPRESSION_CHOICES, default=CompressionLevel.MEDIUM,
+                        help="Image compression level (default: medium)")
+    parser.add_argument('--target-kb', type=int, default=100,
+                        help="PDF size budget in KB for -c target_size (default: 100)")
+    parser.add_argument('-s', '--signatures', action='store_true', help="Include signature fields")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: number of CPUs)")
+    parser.add_argument('--no-cache', action='store_true', help="Do not use the compressed image cache")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Show phase timings and image sizes per file")
+    args = parser.parse_args(argv)
+
+    files, unmatched = collect_report_files(args.inputs)
+    for item in unmatched:
+        print(f"Warning: no report files match '{item}'", file=sys.stderr)
+    if not files:
+        print("No report files found.", file=sys.stderr)
+        return 1
+
+    pdf_paths = output_paths(files, args.output_dir)
+    job_args = (args.compression, args.signatures, not args.no_cache, args.target_kb * 1024)
+    results = []
+    batch_start = time.perf_counter()
+
+    def report_result(result: Tuple[str, bool, str, float, Dict[str, Any]]):
+        json_path, success, message, seconds, stats = result
+        status = "OK  " if success else "FAIL"
+        print(f"[{status}] {seconds:7.2f}s  {json_path}" + ("" if success else f"\n         {message}"))
+        if args.verbose and success:
+            print(f"         {format_stats(stats)}")
+        results.append(result)
+
+    jobs = max(1, min(args.jobs, len(files)))
+    if jobs == 1:
+        for json_path in files:
+            report_result(generate_one(json_path, pdf_paths[json_path], *job_args))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(generate_one, json_path, pdf_paths[json_path], *job_args): json_path
+                for json_path in files
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:  # Worker died (BrokenProcessPool) or the result couldn't be sent back
+                    result = (futures[future], False, f"Worker failed: {type(e).__name__}: {e}", 0.0, empty_stats())
+                report_result(result)
+
+    failures = [r for r in results if not r[1]]
+    total = time.perf_counter() - batch_start
+    print(f"\n{len(results) - len(failures)}/{len(results)} PDFs generated in {total:.2f}s "
+          f"({len(failures)} failed, {jobs} process{'es' if jobs != 1 else ''})")
+    if unmatched:
+        print(f"{len(unmatched)} input{'s' if len(unmatched) != 1 else ''} matched no report files", file=sys.stderr)
+
+    return 1 if failures or unmatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for Daily Report System
+Run as modules, e.g. python -m benchmarks.pdf_benchmark
+"""
\ No newline at end of file
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+PDF generation benchmark for Daily Report System.
+
+Synthesizes reports with generated photos, times PDFGenerator.generate for
+every compression level and generator mode and saves wall time, peak RSS
+and PDF size to JSON.
+
+Usage:
+    python -m benchmarks.pdf_benchmark
+    python -m benchmarks.pdf_benchmark --sizes small,medium,large -o after.json --compare before.json
+    python -m benchmarks.pdf_benchmark --sizes large --levels medium --modes standard,streaming,in_memory,in_memory_streaming
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+from typing import Dict, List, Optional, Any
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.activity_model import Activity
+from models.report_model import Report
+
+
+# Report sizes: (activities, images per activity)
+REPORT_SIZES = {
+    'small': (5, 3),
+    'medium': (30, 5),
+    'large': (100, 5),
+}
+
+DEFAULT_RESOLUTIONS = ['1600x1200', '4032x3024']  # HD and 12MP phone photos
+PDF_SIZE_GOAL = 100 * 1024  # "<100KB" goal from PDFGenerator.COMPRESSION_SETTINGS
+
+# Generator modes: PDFGenerator keyword arguments (in-memory modes never touch the disk)
+GENERATOR_MODES = {
+    'standard': {},
+    'streaming': {'streaming': True},
+    'in_memory': {'in_memory': True, 'use_cache': False},
+    'in_memory_streaming': {'in_memory': True, 'use_cache': False, 'streaming': True},
+}
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def make_images(fixtures_dir: str, resolution: str, count: int) -> List[str]:
+    """
+    Create (or reuse) distinct synthetic photos at a resolution.
+
+    Args:
+        fixtures_dir: Folder where fixtures are kept between runs
+        resolution: "WIDTHxHEIGHT"
+        count: Number of distinct images
+
+    Returns:
+        List[str]: Image paths
+    """
+    from PIL import Image, ImageDraw
+
+    width, height = (int(v) for v in resolution.split('x'))
+    folder = os.path.join(fixtures_dir, resolution)
+    os.makedirs(folder, exist_ok=True)
+
+    paths = [os.path.join(folder, f"photo_{i:03d}.jpg") for i in range(count)]
+    missing = [p for p in paths if not os.path.exists(p)]
+    if not missing:
+        return paths
+
+    # Noise over a gradient compresses like a real photo, not like a flat color
+    noise = Image.effect_noise((width, height), 40)
+    gradient = Image.linear_gradient('L').resize((width, height))
+    base = Image.merge('RGB', (
+        Image.blend(noise, gradient, 0.6),
+        gradient.rotate(90).resize((width, height)),
+        noise
+    ))
+
+    for path in missing:
+        # Every image differs so caches and deduplication can't skip work
+        index = paths.index(path)
+        img = base.copy()
+        draw = ImageDraw.Draw(img)
+        block = max(width, height) // 10
+        for k in range(8):
+            x = (index * 97 + k * 131) % max(1, width - block)
+            y = (index * 53 + k * 71) % max(1, height - block)
+            draw.rectangle([x, y, x + block, y + block], fill=((index * 37) % 256, (k * 29) % 256, 128))
+        img.save(path, 'JPEG', quality=90)
+
+    return paths
+
+
+def build_report(image_paths: List[str], activities: int, images_per_activity: int) -> Report:
+    """
+    Build a report whose activities use distinct images.
+
+    Args:
+        image_paths: Images to distribute (at least activities * images_per_activity)
+        activities: Number of activities
+        images_per_activity: Images attached to each activity
+
+    Returns:
+        Report: Synthetic report
+    """
+    report = Report(
+        responsible="Benchmark Responsible",
+        student="Benchmark Student",
+        report_date=date(2025, 1, 15),
+        entry_time="08:00",
+        exit_time="17:00"
+    )
+    for i in range(activities):
+        start = 8 * 60 + (i * 7) % (8 * 60)
+        end = start + 45
+        images = image_paths[i * images_per_activity:(i + 1) * images_per_activity]
+        report.activities.append(Activity(
+            title=f"Activity {i + 1}",
+            description=f"Synthetic benchmark activity number {i + 1}. " * 6,
+            start_time=f"{start // 60:02d}:{start % 60:02d}",
+            end_time=f"{end // 60:02d}:{end % 60:02d}",
+            images=images
+        ))
+    return report
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def peak_rss_bytes() -> Optional[int]:
+    """Get this process's peak resident set size, if the platform reports it."""
+    # Linux: VmHWM belongs to the current address space, unlike ru_maxrss
+    # which a spawned child inherits from the forked parent
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports KB
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss)
+    except ImportError:
+        return None
+
+
+def run_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a single benchmark case (in a fresh process, so peak RSS is per case).
+
+    The first generation starts with an empty image cache (cold); the second
+    reuses it (warm), like a preview followed by the real generation.
+
+    A third, untimed run records the peak Python heap (tracemalloc) of a
+    generation: the story, compressed images held in memory and ReportLab's
+    objects, which streaming mode reduces. Peak RSS is dominated by photo
+    decoding in the cold run, so it hardly shows that difference.
+    """
+    from services.pdf_generator import PDFGenerator
+    from services.image_cache import ImageCache
+
+    report = build_report(case['image_paths'], case['activities'], case['images_per_activity'])
+    result = {key: value for key, value in case.items() if key != 'image_paths'}
+
+    with tempfile.TemporaryDirectory(prefix='reportapp_bench_') as work_dir:
+        cache = ImageCache(os.path.join(work_dir, 'cache'))
+        output_path = os.path.join(work_dir, 'report.pdf')
+        timings = {}
+
+        for run in ('cold', 'warm'):
+            generator = PDFGenerator(
+                report, case['compression'], image_cache=cache, **GENERATOR_MODES[case['mode']]
+            )
+            start = time.perf_counter()
+            success, message = generator.generate(output_path)
+            timings[run] = time.perf_counter() - start
+            if not success:
+                result['error'] = message
+                return result
+
+        # Untimed run under tracemalloc (it slows generation down several times)
+        generator = PDFGenerator(
+            report, case['compression'], image_cache=cache, **GENERATOR_MODES[case['mode']]
+        )
+        tracemalloc.start()
+        generator.generate(output_path)
+        heap_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        pdf_bytes = os.path.getsize(output_path)
+
+    result.update({
+        'wall_seconds': round(timings['cold'], 4),
+        'warm_seconds': round(timings['warm'], 4),
+        'peak_rss_bytes': peak_rss_bytes(),
+        'heap_peak_bytes': heap_peak,
+        'pdf_bytes': pdf_bytes,
+        'under_100kb': pdf_bytes < PDF_SIZE_GOAL
+    })
+    return result
+
+
+def run_isolated(case: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a case in a freshly spawned process."""
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(run_case, (case,))
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def case_key(result: Dict[str, Any]) -> str:
+    """Identify a case across result files."""
+    return f"{result['size']}/{result['resolution']}/{result['compression']}/{result.get('mode', 'standard')}"
+
+
+def print_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]] = None):
+    """Print a results table, with deltas against a baseline if given."""
+    header = f"{'case':<52} {'cold s':>8} {'warm s':>8} {'peak MB':>8} {'heap MB':>8} {'PDF KB':>8}  <100KB"
+    print(header)
+    print("-" * len(header))
+
+    for result in results:
+        if 'error' in result:
+            print(f"{case_key(result):<52} ERROR: {result['error']}")
+            continue
+
+        rss = result['peak_rss_bytes']
+        heap = result.get('heap_peak_bytes')
+        line = (
+            f"{case_key(result):<52} {result['wall_seconds']:>8.2f} {result['warm_seconds']:>8.2f} "
+            f"{(rss / 1024 / 1024 if rss else 0):>8.1f} "
+            f"{(f'{heap / 1024 / 1024:.1f}' if heap is not None else '-'):>8} "
+            f"{result['pdf_bytes'] / 1024:>8.1f}  "
+            f"{'yes' if result['under_100kb'] else 'no'}"
+        )
+
+        previous = (baseline or {}).get(case_key(result))
+        if previous and 'error' not in previous and previous['wall_seconds']:
+            change = (result['wall_seconds'] - previous['wall_seconds']) / previous['wall_seconds'] * 100
+            line += f"  ({change:+.0f}% time)"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark entry point."""
+    from services.pdf_generator import PDFGenerator
+
+    parser = argparse.ArgumentParser(description="Benchmark PDF generation across report sizes and compression levels.")
+    parser.add_argument('--sizes', default='small,medium', help=f"Report sizes: {', '.join(REPORT_SIZES)}")
+    parser.add_argument('--resolutions', default=','.join(DEFAULT_RESOLUTIONS), help="Image resolutions, WIDTHxHEIGHT")
+    parser.add_argument('--levels', default=','.join(PDFGenerator.COMPRESSION_SETTINGS),
+                        help="Compression levels")
+    parser.add_argument('--modes', default='standard',
+                        help=f"Generator modes: {', '.join(GENERATOR_MODES)}")
+    parser.add_argument('--fixtures-dir', default=os.path.join(tempfile.gettempdir(), 'reportapp_bench_fixtures'),
+                        help="Where generated images are kept between runs")
+    parser.add_argument('-o', '--output', default='pdf_benchmark.json', help="Results JSON file")
+    parser.add_argument('--compare', help="Previous results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = [s for s in args.sizes.split(',') if s]
+    unknown = [s for s in sizes if s not in REPORT_SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)}")
+
+    resolutions = [r for r in args.resolutions.split(',') if r]
+    levels = [level for level in args.levels.split(',') if level]
+    modes = [mode for mode in args.modes.split(',') if mode]
+    unknown = [mode for mode in modes if mode not in GENERATOR_MODES]
+    if unknown:
+        parser.error(f"Unknown modes: {', '.join(unknown)}")
+
+    cases = []
+    for size in sizes:
+        activities, per_activity = REPORT_SIZES[size]
+        for resolution in resolutions:
+            print(f"Preparing {activities * per_activity} images at {resolution}...")
+            image_paths = make_images(args.fixtures_dir, resolution, activities * per_activity)
+            for level in levels:
+                for mode in modes:
+                    cases.append({
+                        'size': size,
+                        'activities': activities,
+                        'images_per_activity': per_activity,
+                        'resolution': resolution,
+                        'compression': level,
+                        'mode': mode,
+                        'image_paths': image_paths
+                    })
+
+    results = []
+    for case in cases:
+        print(f"Running {case_key(case)}...")
+        results.append(run_isolated(case))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = {case_key(r): r for r in json.load(f)['results']}
+
+    print()
+    print_results(results, baseline)
+
+    from PIL import __version__ as pillow_version
+    from reportlab import Version as reportlab_version
+
+    output = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'pillow': pillow_version,
+            'reportlab': reportlab_version
+        },
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    return 1 if any('error' in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark and import budget check for Daily Report System.
+
+Measures, in fresh processes, how long importing the main window takes and
+how long it takes until the window is shown. Fails (exit code 1) when the
+median exceeds its budget or when heavy modules that belong to the PDF
+pipeline (ReportLab, PIL, NumPy) are imported before the window is up.
+
+Usage:
+    python -m benchmarks.startup_benchmark
+    python -m benchmarks.startup_benchmark --runs 10 --import-budget-ms 600 -o startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Any
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must stay off the startup path (imported lazily or pre-warmed)
+FORBIDDEN_MODULES = ['reportlab', 'PIL', 'numpy']
+
+DEFAULT_IMPORT_BUDGET_MS = 800
+DEFAULT_SHOW_BUDGET_MS = 2000
+
+
+# Child process: imports the window (and optionally shows it) and prints JSON
+CHILD_CODE = r'''
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import ui.main_window
+imported = time.perf_counter()
+result = {{'import_ms': (imported - start) * 1000}}
+if {show!r}:
+    from PySide6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    window = ui.main_window.MainWindow()
+    window.show()
+    app.processEvents()
+    result['show_ms'] = (time.perf_counter() - start) * 1000
+result['modules'] = sorted({{name.split('.')[0] for name in sys.modules}})
+print(json.dumps(result))
+'''
+
+
+def run_child(show: bool) -> Dict[str, Any]:
+    """
+    Run one measurement in a fresh interpreter.
+
+    Args:
+        show: Also create and show the main window
+
+    Returns:
+        Dict: import_ms, show_ms (if shown) and top-level modules loaded
+    """
+    env = dict(os.environ)
+    if show and sys.platform.startswith('linux') and not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')  # Headless CI
+
+    completed = subprocess.run(
+        [sys.executable, '-c', CHILD_CODE.format(root=PROJECT_ROOT, show=show)],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip() or f"exit code {completed.returncode}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Startup benchmark entry point."""
+    parser = argparse.ArgumentParser(description="Measure startup time and check the import budget.")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh processes per measurement (default: 5)")
+    parser.add_argument('--import-budget-ms', type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                        help=f"Median budget for importing ui.main_window (default: {DEFAULT_IMPORT_BUDGET_MS})")
+    parser.add_argument('--show-budget-ms', type=float, default=DEFAULT_SHOW_BUDGET_MS,
+                        help=f"Median budget until the window is shown (default: {DEFAULT_SHOW_BUDGET_MS})")
+    parser.add_argument('--no-show', action='store_true', help="Only measure imports (no QApplication)")
+    parser.add_argument('-o', '--output', help="Save results to a JSON file")
+    args = parser.parse_args(argv)
+
+    # The first process warms the OS file cache; it isn't counted
+    run_child(show=False)
+
+    import_runs = [run_child(show=False) for _ in range(args.runs)]
+    show_runs = [] if args.no_show else [run_child(show=True) for _ in range(args.runs)]
+
+    import_ms = statistics.median(r['import_ms'] for r in import_runs)
+    show_ms = statistics.median(r['show_ms'] for r in show_runs) if show_runs else None
+    loaded = set()
+    for run in import_runs + show_runs:
+        loaded.update(run['modules'])
+    forbidden = [name for name in FORBIDDEN_MODULES if name in loaded]
+
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import took {import_ms:.0f}ms (budget {args.import_budget_ms:.0f}ms)")
+    if show_ms is not None and show_ms > args.show_budget_ms:
+        failures.append(f"window shown after {show_ms:.0f}ms (budget {args.show_budget_ms:.0f}ms)")
+    if forbidden:
+        failures.append(f"heavy modules imported at startup: {', '.join(forbidden)}")
+
+    print(f"import ui.main_window: {import_ms:7.1f} ms (median of {args.runs})")
+    if show_ms is not None:
+        print(f"window shown:          {show_ms:7.1f} ms (median of {args.runs})")
+    print(f"heavy modules loaded:  {', '.join(forbidden) or 'none'}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'import_ms': import_ms,
+                'show_ms': show_ms,
+                'runs': args.runs,
+                'forbidden_loaded': forbidden,
+                'python': sys.version.split()[0]
+            }, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
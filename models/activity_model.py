@@ -1,6 +1,80 @@
-from typing import Tuple
-from datetime import datetime, timedelta
+from typing import Tuple, Optional, Iterable
 import os 
+import weakref
+
+from models.time_values import parse_time, format_minutes, span_minutes, TIME_STRINGS
+
+
+class ImageList(list):
+    """
+    List of an activity's image paths that reports its own changes.
+
+    Activity.images is always an ImageList, so changing the list directly
+    (images.append(...), images[0] = ...) counts as an activity change,
+    like the image methods do.
+    """
+
+    __slots__ = ('_activity',)
+
+    def __init__(self, images: Iterable[str] = (), activity: Optional['Activity'] = None):
+        super().__init__(images)
+        self._activity = weakref.ref(activity) if activity is not None else None
+
+    def _changed(self):
+        activity = self._activity() if self._activity is not None else None
+        if activity is not None:
+            activity._changed()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._changed()
+        return result
+
+    def append(self, item):
+        super().append(item)
+        self._changed()
+
+    def extend(self, items):
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
 
 
 class Activity:
@@ -14,7 +88,22 @@ class Activity:
         end_time (str): End time in 24h format (HH:MM)
         duration (str): Automatically calculated duration (HH:MM)
         images (list[str]): List of image file paths
+    
+    Times are stored as minutes since midnight (start_minutes, end_minutes);
+    start_time, end_time and duration are derived from them. Slots keep
+    each instance small when large archives are loaded.
+    
+    Changing the times or the images (through the setters, the image
+    methods or the images list itself) is an activity change. It is sent
+    to the lists of activities holding this activity (their owners, see
+    ActivityList in report_model), so only the reports that contain it
+    know their statistics are out of date.
     """
+    
+    __slots__ = (
+        'title', 'description', '_images', '_start', '_end', '_start_text', '_end_text',
+        '_owners', '__weakref__'
+    )
 
     # Configuration constants
     MAX_IMAGES = 5
@@ -30,13 +119,93 @@ class Activity:
 
         self.title = title
         self.description = description
-        self.start_time = start_time
-        self.end_time = end_time
-        self.images = images if images is not None else []
-        self._duration = ""
+        self._owners = ()
+        self._set_start(start_time)
+        self._set_end(end_time)
+        self._images = ImageList(images if images is not None else (), self)
+
+    # ============================================================================
+    # TIME PROPERTIES
+    # ============================================================================
+
+    @property
+    def start_time(self) -> str:
+        """Start time in HH:MM format (the original text if it is invalid)."""
+        return TIME_STRINGS[self._start] if self._start is not None else self._start_text
+
+    @start_time.setter
+    def start_time(self, value: str):
+        self._set_start(value)
+        self._changed()
+
+    def _set_start(self, value: str):
+        self._start = parse_time(value)
+        self._start_text = None if self._start is not None else value
+
+    @property
+    def end_time(self) -> str:
+        """End time in HH:MM format (the original text if it is invalid)."""
+        return TIME_STRINGS[self._end] if self._end is not None else self._end_text
+
+    @end_time.setter
+    def end_time(self, value: str):
+        self._set_end(value)
+        self._changed()
 
-        if self.start_time and self.end_time:
-            self.calculate_duration()
+    def _set_end(self, value: str):
+        self._end = parse_time(value)
+        self._end_text = None if self._end is not None else value
+
+    @property
+    def start_minutes(self) -> Optional[int]:
+        """Start time in minutes since midnight, None if invalid."""
+        return self._start
+
+    @property
+    def end_minutes(self) -> Optional[int]:
+        """End time in minutes since midnight, None if invalid."""
+        return self._end
+
+    @property
+    def images(self) -> ImageList:
+        """Image file paths."""
+        return self._images
+
+    @images.setter
+    def images(self, value: Iterable[str]):
+        self._images = ImageList(value, self)
+        self._changed()
+
+    # ============================================================================
+    # CHANGE TRACKING METHODS
+    # ============================================================================
+
+    def _add_owner(self, owner: Tuple[weakref.ref]):
+        """
+        Registers a list holding this activity (once per time it holds it).
+
+        Args:
+            owner: The list's (weak reference,) tuple, shared by all its
+                activities so the usual single owner costs no memory
+        """
+        if not self._owners:
+            self._owners = owner
+        else:
+            self._owners = tuple(ref for ref in self._owners if ref() is not None) + owner
+
+    def _remove_owner(self, owner: Tuple[weakref.ref]):
+        """Unregisters one hold of a list on this activity."""
+        for position, ref in enumerate(self._owners):
+            if ref is owner[0]:
+                self._owners = self._owners[:position] + self._owners[position + 1:]
+                return
+
+    def _changed(self):
+        """Tells the lists holding this activity that its times or images changed."""
+        for ref in self._owners:
+            owner = ref()
+            if owner is not None:
+                owner._changed()
 
     # ============================================================================
     # CALCULATION METHODS
@@ -49,34 +218,14 @@ class Activity:
         Returns:
             str: Duration in format "HH:MM" or error message
         """
-        try:
-            # ✅ Fixed: Changed method name
-            if not self._validate_format_hour(self.start_time):
-                self._duration = "Invalid start time"
-                return self._duration
-
-            if not self._validate_format_hour(self.end_time):
-                self._duration = "Invalid end time"
-                return self._duration
-
-            start = datetime.strptime(self.start_time, "%H:%M")
-            end = datetime.strptime(self.end_time, "%H:%M")
+        if self._start is None:
+            return "Invalid start time"
 
-            # If end is before start, assume next day
-            if end <= start:
-                end += timedelta(days=1)
+        if self._end is None:
+            return "Invalid end time"
 
-            difference = end - start
-
-            hours = int(difference.total_seconds() // 3600)
-            minutes = int((difference.total_seconds() % 3600) // 60)
-
-            self._duration = f"{hours:02d}:{minutes:02d}"
-            return self._duration
-
-        except Exception as e:  # ✅ Fixed: Better exception handling
-            self._duration = "Calculate Error"
-            return self._duration
+        # If end is before start, assume next day
+        return format_minutes(span_minutes(self._start, self._end))
 
     def get_duration_in_minutes(self) -> int:  # ✅ Fixed: Better name
         """
@@ -85,18 +234,9 @@ class Activity:
         Returns:
             int: Total duration in minutes, 0 if error
         """
-        try:
-            if not self._duration or ":" not in self._duration:
-                self.calculate_duration()
-
-            if ":" not in self._duration:
-                return 0
-
-            hours, minutes = self._duration.split(":")
-            return int(hours) * 60 + int(minutes)
-
-        except (ValueError, AttributeError):
+        if self._start is None or self._end is None:
             return 0
+        return span_minutes(self._start, self._end)
 
     @property
     def duration(self) -> str:
@@ -107,9 +247,7 @@ class Activity:
         Returns:
             str: Duration in HH:MM format
         """
-        if not self._duration:
-            self.calculate_duration()
-        return self._duration
+        return self.calculate_duration()
 
     # ============================================================================
     # VALIDATION METHODS
@@ -122,27 +260,13 @@ class Activity:
         Returns:
             Tuple[bool, str]: (is_valid, error_message)
         """
-        # ✅ Fixed: Using correct attribute names
-        if not self._validate_format_hour(self.start_time):
+        # Parsing already checked format and range (00:00 - 23:59)
+        if self._start is None:
             return False, f"Invalid start time: '{self.start_time}'. Use HH:MM format (00:00 - 23:59)"
 
-        if not self._validate_format_hour(self.end_time):
+        if self._end is None:
             return False, f"Invalid end time: '{self.end_time}'. Use HH:MM format (00:00 - 23:59)"
 
-        try:
-            # ✅ Fixed: Using correct attribute names
-            h_start, m_start = map(int, self.start_time.split(":"))
-            h_end, m_end = map(int, self.end_time.split(":"))
-
-            if not (0 <= h_start <= 23 and 0 <= m_start <= 59):
-                return False, "Start time out of range (00:00 - 23:59)"
-
-            if not (0 <= h_end <= 23 and 0 <= m_end <= 59):
-                return False, "End time out of range (00:00 - 23:59)"
-
-        except ValueError:
-            return False, "Error processing times"
-
         return True, "Valid hours"
 
     def _validate_format_hour(self, hour: str) -> bool:
@@ -155,14 +279,7 @@ class Activity:
         Returns:
             bool: True if format is correct
         """
-        if not hour or not isinstance(hour, str):
-            return False
-
-        try:
-            datetime.strptime(hour, "%H:%M")
-            return True
-        except ValueError:
-            return False
+        return parse_time(hour) is not None
 
     def validate_required_fields(self) -> Tuple[bool, str]:
         """
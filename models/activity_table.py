@@ -0,0 +1,390 @@
+from typing import List, Tuple, Dict, Optional, Iterable, Sequence, Union, Any, TYPE_CHECKING
+from datetime import date
+import glob
+import json
+import os
+
+import numpy as np
+
+from models.time_values import MINUTES_PER_DAY, parse_time
+
+if TYPE_CHECKING:
+    from models.report_model import Report
+    from models.report_repository import ReportRepository
+
+
+class ActivityTable:
+    """
+    Column-oriented table of activities for archive-wide analytics.
+
+    Each column is a NumPy array with one row per activity:
+
+        report    (int32)           Report the activity belongs to
+        date      (datetime64[D])   Report date
+        student   (int32)           Index into the students list (sorted names)
+        start     (int16)           Start time, minutes since midnight
+        end       (int16)           End time, minutes since midnight
+        duration  (int16)           Minutes; an end at or before the start is on the next day
+        images    (int16)           Number of images
+
+    Activities with an invalid start or end time are left out.
+
+    The table is built in one pass over JSON files, Report objects or the
+    report database, after which group_by() and histogram() aggregate every
+    row with NumPy instead of looping over Report objects in Python. A year
+    of reports (tens of thousands of activities) rolls up in milliseconds.
+
+    Grouping keys: "student", "report", "day", "week" (starting on Monday),
+    "month", "year", "weekday" (0 = Monday) and "hour" (start hour).
+    Value columns: "duration", "images", "start" and "end".
+    """
+
+    COLUMNS = ('report', 'date', 'student', 'start', 'end', 'duration', 'images')
+    KEYS = ('student', 'report', 'day', 'week', 'month', 'year', 'weekday', 'hour')
+    VALUES = ('duration', 'images', 'start', 'end')
+
+    def __init__(self, columns: Dict[str, np.ndarray], students: Sequence[str]):
+        """
+        Wraps already built columns (use the from_* constructors).
+
+        Args:
+            columns: One array per name in COLUMNS, all the same length
+            students: Student names the "student" column indexes
+        """
+        self.columns = columns
+        self.students = list(students)
+
+    # ============================================================================
+    # CONSTRUCTION METHODS
+    # ============================================================================
+
+    @classmethod
+    def from_rows(
+        cls,
+        report_ids: Sequence[int],
+        dates: Sequence[Union[date, str]],
+        students: Sequence[str],
+        starts: Sequence[int],
+        ends: Sequence[int],
+        images: Sequence[int]
+    ) -> 'ActivityTable':
+        """
+        Builds the table from one list per column, converting them in bulk.
+
+        Args:
+            report_ids: Report of each activity
+            dates: Report date of each activity (date or ISO string)
+            students: Student name of each activity
+            starts: Start minutes of each activity (valid times only)
+            ends: End minutes of each activity (valid times only)
+            images: Image count of each activity
+
+        Returns:
+            ActivityTable: New table
+        """
+        student_names, student_codes = np.unique(np.array(students, dtype=str), return_inverse=True)
+        start = np.array(starts, dtype=np.int16)
+        end = np.array(ends, dtype=np.int16)
+
+        duration = (end - start) % MINUTES_PER_DAY
+        duration[duration == 0] = MINUTES_PER_DAY  # Same start and end: a full day
+
+        columns = {
+            'report': np.array(report_ids, dtype=np.int32),
+            'date': np.array(dates, dtype='datetime64[D]'),
+            'student': student_codes.astype(np.int32).reshape(-1),
+            'start': start,
+            'end': end,
+            'duration': duration.astype(np.int16),
+            'images': np.array(images, dtype=np.int16)
+        }
+        return cls(columns, student_names.tolist())
+
+    @classmethod
+    def from_reports(cls, reports: Iterable['Report']) -> 'ActivityTable':
+        """
+        Builds the table from Report objects.
+
+        Args:
+            reports: Reports to include (report ids are their positions)
+
+        Returns:
+            ActivityTable: New table
+        """
+        report_ids, dates, students, starts, ends, images = [], [], [], [], [], []
+        for report_id, report in enumerate(reports):
+            for activity in report.activities:
+                start, end = activity.start_minutes, activity.end_minutes
+                if start is None or end is None:
+                    continue
+                report_ids.append(report_id)
+                dates.append(report.date)
+                students.append(report.student)
+                starts.append(start)
+                ends.append(end)
+                images.append(len(activity.images))
+        return cls.from_rows(report_ids, dates, students, starts, ends, images)
+
+    @classmethod
+    def from_json(cls, inputs: Iterable[str]) -> Tuple['ActivityTable', List[Tuple[str, str]]]:
+        """
+        Builds the table straight from report JSON files written by
+        Report.to_json, without creating Report or Activity objects.
+
+        Args:
+            inputs: Folders (every *.json inside), glob patterns or file paths
+
+        Returns:
+            Tuple[ActivityTable, List[Tuple[str, str]]]: (table, [(path, error message)]);
+            report ids are the positions of the files read
+        """
+        files = []
+        for item in inputs:
+            if os.path.isdir(item):
+                files.extend(sorted(glob.glob(os.path.join(item, '*.json'))))
+            else:
+                files.extend(sorted(glob.glob(item)) or [item])
+
+        report_ids, dates, students, starts, ends, images = [], [], [], [], [], []
+        failures = []
+        for report_id, path in enumerate(dict.fromkeys(os.path.abspath(f) for f in files)):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                report_date = date.fromisoformat(data['date'])
+                student = data.get('student', '')
+                activities = data.get('activities') or []
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                failures.append((path, f"Error loading report: {str(e)}"))
+                continue
+
+            for activity in activities:
+                start = parse_time(activity.get('start_time'))
+                end = parse_time(activity.get('end_time'))
+                if start is None or end is None:
+                    continue
+                report_ids.append(report_id)
+                dates.append(report_date)
+                students.append(student)
+                starts.append(start)
+                ends.append(end)
+                images.append(len(activity.get('images') or ()))
+
+        return cls.from_rows(report_ids, dates, students, starts, ends, images), failures
+
+    @classmethod
+    def from_repository(
+        cls,
+        repository: 'ReportRepository',
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        student: Optional[str] = None,
+        responsible: Optional[str] = None
+    ) -> 'ActivityTable':
+        """
+        Builds the table from the report database with a single query.
+
+        Args:
+            repository: Report database
+            start_date: First report date included
+            end_date: Last report date included
+            student: Student name (ignoring case and accents)
+            responsible: Responsible name (ignoring case and accents)
+
+        Returns:
+            ActivityTable: New table; report ids are the database ids
+        """
+        report_ids, dates, students, starts, ends, images = [], [], [], [], [], []
+        for report_id, report_date, report_student, start_time, end_time, image_count in \
+                repository.iter_activity_stats(start_date, end_date, student, responsible):
+            start = parse_time(start_time)
+            end = parse_time(end_time)
+            if start is None or end is None:
+                continue
+            report_ids.append(report_id)
+            dates.append(report_date)
+            students.append(report_student)
+            starts.append(start)
+            ends.append(end)
+            images.append(image_count)
+        return cls.from_rows(report_ids, dates, students, starts, ends, images)
+
+    # ============================================================================
+    # SELECTION METHODS
+    # ============================================================================
+
+    def filter(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        student: Optional[str] = None
+    ) -> 'ActivityTable':
+        """
+        Selects the activities in a date range and/or of one student.
+
+        Args:
+            start_date: First report date included
+            end_date: Last report date included
+            student: Student name (exact)
+
+        Returns:
+            ActivityTable: New table with the matching rows
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if start_date is not None:
+            mask &= self.columns['date'] >= np.datetime64(start_date, 'D')
+        if end_date is not None:
+            mask &= self.columns['date'] <= np.datetime64(end_date, 'D')
+        if student is not None:
+            code = self.students.index(student) if student in self.students else -1
+            mask &= self.columns['student'] == code
+
+        return ActivityTable({name: column[mask] for name, column in self.columns.items()}, self.students)
+
+    # ============================================================================
+    # AGGREGATION METHODS
+    # ============================================================================
+
+    def group_by(self, by: Union[str, Sequence[str]] = (), value: str = 'duration') -> Dict[str, np.ndarray]:
+        """
+        Totals a value column per group.
+
+        For hours per student per week: group_by(("student", "week")) and
+        divide "total" by 60.
+
+        Args:
+            by: Grouping key or keys (see KEYS); none gives one overall group
+            value: Column to aggregate (see VALUES)
+
+        Returns:
+            Dict[str, np.ndarray]: One array per key (student names, dates of
+            the day/week start, months, years or numbers), plus "count",
+            "total" and "mean", one element per group sorted by key
+        """
+        keys = (by,) if isinstance(by, str) else tuple(by)
+        values = self._value(value)
+        inverse, labels = self._groups(keys)
+        group_count = len(labels[keys[0]]) if keys else (1 if len(self) else 0)
+
+        counts = np.bincount(inverse, minlength=group_count)
+        totals = np.bincount(inverse, weights=values, minlength=group_count)
+
+        result = dict(labels)
+        result['count'] = counts
+        result['total'] = totals.astype(np.int64)
+        result['mean'] = totals / np.maximum(counts, 1)
+        return result
+
+    def histogram(
+        self,
+        value: str = 'duration',
+        bins: Union[int, Sequence[float]] = 10,
+        value_range: Optional[Tuple[float, float]] = None,
+        by: Union[str, Sequence[str]] = ()
+    ) -> Dict[str, np.ndarray]:
+        """
+        Counts how a value column is distributed, overall or per group.
+
+        Bins follow numpy.histogram: all but the last are half-open, values
+        outside the range are not counted.
+
+        Args:
+            value: Column to count (see VALUES)
+            bins: Number of equal bins or the bin edges
+            value_range: (lower, upper) range for equal bins (default: min, max)
+            by: Grouping key or keys (see KEYS)
+
+        Returns:
+            Dict[str, np.ndarray]: "edges" and "counts" (one row of counts per
+            group when grouped, with one array per key like group_by)
+        """
+        keys = (by,) if isinstance(by, str) else tuple(by)
+        values = self._value(value)
+        edges = np.histogram_bin_edges(values, bins, value_range)
+        bin_count = len(edges) - 1
+
+        if not keys:
+            counts, _ = np.histogram(values, edges)
+            return {'edges': edges, 'counts': counts}
+
+        positions = np.searchsorted(edges, values, side='right') - 1
+        positions[values == edges[-1]] = bin_count - 1  # The last bin includes its upper edge
+        inside = (positions >= 0) & (positions < bin_count)
+
+        inverse, labels = self._groups(keys)
+        group_count = len(labels[keys[0]])
+        cells = np.bincount(
+            inverse[inside] * bin_count + positions[inside], minlength=group_count * bin_count
+        )
+
+        result = dict(labels)
+        result['edges'] = edges
+        result['counts'] = cells.reshape(group_count, bin_count)
+        return result
+
+    def _value(self, value: str) -> np.ndarray:
+        """Gets a value column, checking its name."""
+        if value not in self.VALUES:
+            raise ValueError(f"Unknown value column '{value}'. Use: {', '.join(self.VALUES)}")
+        return self.columns[value]
+
+    def _key(self, key: str) -> Tuple[np.ndarray, Any]:
+        """
+        Computes a grouping key for every row.
+
+        Returns:
+            Tuple: (int64 key per row, function turning unique keys into labels)
+        """
+        days = self.columns['date'].astype(np.int64)  # Days since 1970-01-01, a Thursday
+        if key == 'student':
+            names = np.array(self.students, dtype=str)
+            return self.columns['student'].astype(np.int64), lambda codes: names[codes]
+        if key == 'report':
+            return self.columns['report'].astype(np.int64), lambda codes: codes
+        if key == 'day':
+            return days, lambda codes: codes.astype('datetime64[D]')
+        if key == 'week':
+            return days - (days + 3) % 7, lambda codes: codes.astype('datetime64[D]')
+        if key == 'month':
+            months = self.columns['date'].astype('datetime64[M]').astype(np.int64)
+            return months, lambda codes: codes.astype('datetime64[M]')
+        if key == 'year':
+            years = self.columns['date'].astype('datetime64[Y]').astype(np.int64)
+            return years, lambda codes: codes + 1970
+        if key == 'weekday':
+            return (days + 3) % 7, lambda codes: codes
+        if key == 'hour':
+            return self.columns['start'].astype(np.int64) // 60, lambda codes: codes
+        raise ValueError(f"Unknown grouping key '{key}'. Use: {', '.join(self.KEYS)}")
+
+    def _groups(self, keys: Tuple[str, ...]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Assigns every row to its group.
+
+        Returns:
+            Tuple: (group number per row, {key: label per group}), groups
+            sorted by key
+        """
+        if not keys:
+            return np.zeros(len(self), dtype=np.int64), {}
+
+        # Number each key's distinct values, then combine them into one code per row
+        uniques, codes, to_labels = [], [], []
+        for key in keys:
+            row_keys, to_label = self._key(key)
+            unique, code = np.unique(row_keys, return_inverse=True)
+            uniques.append(unique)
+            codes.append(code.reshape(-1))
+            to_labels.append(to_label)
+
+        shape = tuple(max(len(unique), 1) for unique in uniques)
+        combined = np.ravel_multi_index(codes, shape)
+        groups, inverse = np.unique(combined, return_inverse=True)
+
+        labels = {}
+        for key, unique, to_label, positions in zip(keys, uniques, to_labels, np.unravel_index(groups, shape)):
+            labels[key] = to_label(unique[positions])
+        return inverse.reshape(-1), labels
+
+    def __len__(self) -> int:
+        return len(self.columns['report'])
@@ -0,0 +1,365 @@
+from typing import List, Tuple, Dict, Optional, Iterable, Any, TYPE_CHECKING
+from datetime import date, datetime
+from bisect import bisect_left, bisect_right
+import heapq
+
+from models.time_values import MINUTES_PER_DAY, parse_time, span_minutes
+
+if TYPE_CHECKING:
+    from models.report_model import Report
+    from models.report_repository import ReportRepository
+
+
+class ActivityIntervalIndex:
+    """
+    Centered interval tree over activity time ranges.
+
+    Every activity is placed on one absolute minute timeline
+    (date.toordinal() * 1440 + minutes), on its report's day. Only a shift
+    that crosses midnight moves times to the next day: its early hours are
+    the end of the shift (see to_timeline). Activities whose end is at or
+    before their start cross midnight, so night shifts keep their real
+    order and length. This also lets a single index cover a whole archive
+    of reports.
+
+    Each entry is a dict with "start" and "end" (absolute minutes, end
+    excluded), "window_start" and "window_end" (the report's shift, None if
+    its times are invalid), "group" (which report it belongs to) and
+    "index" (position in the report), plus "report" and "activity"
+    (from_reports) or "report_id" and "title" (from_repository). Queries
+    return these dicts.
+
+    Range queries run in O(log n + k) for k results; the activities outside
+    their shift window are precomputed, so listing them is O(k).
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]]):
+        """
+        Builds the index.
+
+        Args:
+            entries: Dicts with at least "start" and "end" (end > start);
+                "window_start", "window_end" and "group" are optional
+        """
+        self.entries = sorted(
+            (entry for entry in entries if entry['end'] > entry['start']),
+            key=lambda entry: (entry['start'], entry['end'])
+        )
+        self._starts = [entry['start'] for entry in self.entries]
+        self._root = self._build(self.entries)
+
+        # Activities starting before their shift or ending after it
+        self._outside = [
+            entry for entry in self.entries
+            if entry.get('window_start') is not None
+            and (entry['start'] < entry['window_start'] or entry['end'] > entry['window_end'])
+        ]
+
+    # ============================================================================
+    # CONSTRUCTION METHODS
+    # ============================================================================
+
+    @classmethod
+    def from_report(cls, report: 'Report') -> 'ActivityIntervalIndex':
+        """
+        Indexes the activities of one report.
+
+        Args:
+            report: Report to index
+
+        Returns:
+            ActivityIntervalIndex: Index over its activities
+        """
+        return cls.from_reports([report])
+
+    @classmethod
+    def from_reports(cls, reports: Iterable['Report']) -> 'ActivityIntervalIndex':
+        """
+        Indexes the activities of many reports (e.g. a folder of saved reports).
+
+        Activities with invalid times are skipped. Reports with an invalid
+        entry or exit time are indexed on their day, without a shift window.
+
+        Args:
+            reports: Reports to index
+
+        Returns:
+            ActivityIntervalIndex: Index over all their activities
+        """
+        entries = []
+        for group, report in enumerate(reports):
+            # Reports and activities keep their times as minutes: no parsing
+            shift = cls._shift_bounds(report.date, report.entry_minutes, report.exit_minutes)
+            placement = shift or cls._day_bounds(report.date)
+            window = shift or (None, None)
+            for index, activity in enumerate(report.activities):
+                span = cls._to_timeline(placement, activity.start_minutes, activity.end_minutes)
+                if span:
+                    entries.append({
+                        'start': span[0], 'end': span[1],
+                        'window_start': window[0], 'window_end': window[1],
+                        'group': group, 'index': index,
+                        'report': report, 'activity': activity
+                    })
+        return cls(entries)
+
+    @classmethod
+    def from_repository(
+        cls,
+        repository: 'ReportRepository',
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        student: Optional[str] = None,
+        responsible: Optional[str] = None
+    ) -> 'ActivityIntervalIndex':
+        """
+        Indexes the activities stored in a report database.
+
+        Only the times are read, no Report objects are built. Reports with
+        an invalid entry or exit time are indexed on their day, without a
+        shift window.
+
+        Args:
+            repository: Report database
+            start_date: First report date included
+            end_date: Last report date included
+            student: Student name (ignoring case and accents)
+            responsible: Responsible name (ignoring case and accents)
+
+        Returns:
+            ActivityIntervalIndex: Index over the matching activities
+        """
+        entries = []
+        shifts: Dict[int, Optional[Tuple[int, int]]] = {}
+        for report_id, report_date, entry_time, exit_time, index, title, start_time, end_time in \
+                repository.iter_activity_times(start_date, end_date, student, responsible):
+            if report_id not in shifts:
+                shifts[report_id] = cls.shift_bounds(report_date, entry_time, exit_time)
+            shift = shifts[report_id]
+            window = shift or (None, None)
+            span = cls.to_timeline(shift or cls._day_bounds(report_date), start_time, end_time)
+            if span:
+                entries.append({
+                    'start': span[0], 'end': span[1],
+                    'window_start': window[0], 'window_end': window[1],
+                    'group': report_id, 'index': index,
+                    'report_id': report_id, 'title': title
+                })
+        return cls(entries)
+
+    @staticmethod
+    def shift_bounds(day: date, entry_time: str, exit_time: str) -> Optional[Tuple[int, int]]:
+        """
+        Places a report's shift on the timeline.
+
+        Args:
+            day: Report date
+            entry_time: Entry time (HH:MM)
+            exit_time: Exit time (HH:MM), next day if not after entry
+
+        Returns:
+            Optional[Tuple[int, int]]: (start, end) minutes, or None if a time is invalid
+        """
+        return ActivityIntervalIndex._shift_bounds(day, parse_time(entry_time), parse_time(exit_time))
+
+    @staticmethod
+    def _shift_bounds(day: date, entry: Optional[int], exit_minutes: Optional[int]) -> Optional[Tuple[int, int]]:
+        """shift_bounds with the times already in minutes since midnight."""
+        if entry is None or exit_minutes is None:
+            return None
+        start = day.toordinal() * MINUTES_PER_DAY + entry
+        return start, start + span_minutes(entry, exit_minutes)
+
+    @staticmethod
+    def _day_bounds(day: date) -> Tuple[int, int]:
+        """Bounds of a whole day, used to place activities of a report without a valid shift."""
+        start = day.toordinal() * MINUTES_PER_DAY
+        return start, start + MINUTES_PER_DAY
+
+    @staticmethod
+    def to_timeline(shift: Tuple[int, int], start_time: str, end_time: str) -> Optional[Tuple[int, int]]:
+        """
+        Places a time span of a shift on the timeline.
+
+        Times are on the shift's day. If the shift crosses midnight, a time
+        before the entry time is on the next day when it is closer to the
+        exit time than to the entry time (e.g. 02:00 or 07:00 in a
+        22:00-06:00 shift, but not 21:00, an early start).
+
+        Args:
+            shift: Shift bounds from shift_bounds
+            start_time: Start time (HH:MM)
+            end_time: End time (HH:MM), next day if not after the start
+
+        Returns:
+            Optional[Tuple[int, int]]: (start, end) minutes, or None if a time is invalid
+        """
+        return ActivityIntervalIndex._to_timeline(shift, parse_time(start_time), parse_time(end_time))
+
+    @staticmethod
+    def _to_timeline(
+        shift: Tuple[int, int],
+        start_minutes: Optional[int],
+        end_minutes: Optional[int]
+    ) -> Optional[Tuple[int, int]]:
+        """to_timeline with the times already in minutes since midnight."""
+        if start_minutes is None or end_minutes is None:
+            return None
+        entry = shift[0] % MINUTES_PER_DAY
+        day_start = shift[0] - entry
+        start = day_start + start_minutes
+        exit_minutes = shift[1] - day_start - MINUTES_PER_DAY
+        if exit_minutes > 0 and start_minutes < entry and start_minutes - exit_minutes < entry - start_minutes:
+            start += MINUTES_PER_DAY
+        return start, start + span_minutes(start_minutes, end_minutes)
+
+    @staticmethod
+    def datetime_to_minute(moment: datetime) -> int:
+        """Converts a date and time to its minute on the timeline."""
+        return moment.date().toordinal() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+    @staticmethod
+    def _build(entries: List[Dict[str, Any]]) -> Optional[list]:
+        """
+        Builds the tree over entries sorted by start.
+
+        Each node is [center, entries containing center by start ascending,
+        the same by end descending, left child, right child]. The center is
+        the median start, so every node holds at least one entry and both
+        children get at most half of the rest.
+        """
+        if not entries:
+            return None
+
+        center = entries[len(entries) // 2]['start']
+        left, here, right = [], [], []
+        for entry in entries:
+            if entry['end'] <= center:
+                left.append(entry)
+            elif entry['start'] > center:
+                right.append(entry)
+            else:
+                here.append(entry)
+
+        by_end = sorted(here, key=lambda entry: entry['end'], reverse=True)
+        return [center, here, by_end, ActivityIntervalIndex._build(left), ActivityIntervalIndex._build(right)]
+
+    # ============================================================================
+    # QUERY METHODS
+    # ============================================================================
+
+    def overlapping(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Finds the activities that overlap a span of the timeline.
+
+        Args:
+            start: Start minute (included)
+            end: End minute (excluded)
+
+        Returns:
+            List[Dict]: Matching entries ordered by start
+        """
+        result = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, by_start, by_end, left, right = node
+            if end <= center:
+                # Entries here end after center; they overlap if they start before end
+                for entry in by_start:
+                    if entry['start'] >= end:
+                        break
+                    result.append(entry)
+                stack.append(left)
+            elif start > center:
+                # Entries here start at or before center; they overlap if they end after start
+                for entry in by_end:
+                    if entry['end'] <= start:
+                        break
+                    result.append(entry)
+                stack.append(right)
+            else:
+                result.extend(by_start)
+                stack.append(left)
+                stack.append(right)
+
+        result.sort(key=lambda entry: (entry['start'], entry['end']))
+        return result
+
+    def starting_between(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Finds the activities that start within a span of the timeline.
+
+        Args:
+            start: First minute (included)
+            end: Last minute (included)
+
+        Returns:
+            List[Dict]: Matching entries ordered by start
+        """
+        return self.entries[bisect_left(self._starts, start):bisect_right(self._starts, end)]
+
+    def at(self, moment: datetime) -> List[Dict[str, Any]]:
+        """
+        Finds the activities running at a moment.
+
+        Args:
+            moment: Date and time
+
+        Returns:
+            List[Dict]: Matching entries ordered by start
+        """
+        minute = self.datetime_to_minute(moment)
+        return self.overlapping(minute, minute + 1)
+
+    def between(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Finds the activities that overlap a period.
+
+        Args:
+            start: Start of the period
+            end: End of the period (excluded)
+
+        Returns:
+            List[Dict]: Matching entries ordered by start
+        """
+        return self.overlapping(self.datetime_to_minute(start), self.datetime_to_minute(end))
+
+    def find_overlaps(self) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Finds pairs of activities of the same report whose times overlap.
+
+        Sweeps each report's activities by start time, keeping the ones
+        still running in a heap, in O(n log n + k).
+
+        Returns:
+            List[Tuple[Dict, Dict]]: (earlier, later) entry pairs
+        """
+        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        for entry in self.entries:  # Sorted by start
+            groups.setdefault(entry.get('group'), []).append(entry)
+
+        pairs = []
+        for entries in groups.values():
+            running: List[Tuple[int, int]] = []  # (end, position) heap
+            for position, entry in enumerate(entries):
+                while running and running[0][0] <= entry['start']:
+                    heapq.heappop(running)
+                pairs.extend((entries[other], entry) for _, other in sorted(running, key=lambda item: item[1]))
+                heapq.heappush(running, (entry['end'], position))
+        return pairs
+
+    def outside_window(self) -> List[Dict[str, Any]]:
+        """
+        Finds the activities that start before their report's entry time
+        or end after its exit time.
+
+        Returns:
+            List[Dict]: Matching entries ordered by start
+        """
+        return list(self._outside)
+
+    def __len__(self) -> int:
+        return len(self.entries)
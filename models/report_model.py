@@ -1,8 +1,113 @@
-from typing import List, Tuple, Dict, Optional
-from datetime import datetime, date, timedelta
+from typing import List, Tuple, Dict, Optional, Callable, Iterable, Any
+from datetime import date
 import json
+import weakref
 
 from models.activity_model import Activity
+from models.interval_index import ActivityIntervalIndex
+from models.time_values import MINUTES_PER_DAY, parse_time, format_minutes, span_minutes, TIME_STRINGS
+
+
+class ActivityList(list):
+    """
+    List of a report's activities that counts its own changes.
+    
+    Report.activities is always an ActivityList, so changes made to the
+    list directly (not through the report's management methods), even
+    ones that keep its length, are noticed by the report. The list is the
+    owner of the activities it holds: an activity whose times or images
+    change tells its owners (see Activity._changed), which counts as a
+    change of the list.
+    """
+    
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+        self._owner = (weakref.ref(self),)  # Shared by every activity it holds
+        self._added(self)
+    
+    def _changed(self):
+        self.version += 1
+    
+    def _added(self, activities: Iterable[Activity]):
+        """Becomes an owner of activities that were added."""
+        for activity in activities:
+            activity._add_owner(self._owner)
+    
+    def _removed(self, activities: Iterable[Activity]):
+        """Stops being an owner of activities that were removed."""
+        for activity in activities:
+            activity._remove_owner(self._owner)
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            removed, added = self[index], value
+        else:
+            removed, added = [self[index]], [value]
+        super().__setitem__(index, value)
+        self._removed(removed)
+        self._added(added)
+        self._changed()
+    
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self._removed(removed)
+        self._changed()
+    
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+    
+    def __imul__(self, count):
+        copies = list(self)
+        result = super().__imul__(count)
+        if count <= 0:
+            self._removed(copies)
+        else:
+            self._added(copies * (count - 1))
+        self._changed()
+        return result
+    
+    def append(self, item):
+        super().append(item)
+        self._added([item])
+        self._changed()
+    
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self._added(items)
+        self._changed()
+    
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._added([item])
+        self._changed()
+    
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._removed([item])
+        self._changed()
+        return item
+    
+    def remove(self, item):
+        del self[self.index(item)]  # The element removed may be an equal copy of item
+    
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self._removed(removed)
+        self._changed()
+    
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+    
+    def reverse(self):
+        super().reverse()
+        self._changed()
 
 
 class Report:
@@ -17,8 +122,34 @@ class Report:
         exit_time (str): Exit time in 24h format (HH:MM)
         instance_hours (str): Total instance hours (automatically calculated)
         activities (List[Activity]): List of activities performed
+    
+    Listeners registered with add_listener are notified of every activity
+    change made through the management methods, so views can update only
+    the affected rows. Listeners that need to act before rows are
+    inserted, removed or moved (Qt item models) also get "about to"
+    notifications.
+    
+    The same changes keep the statistics aggregates (total minutes, image
+    counts, longest and shortest activity) up to date, so get_statistics()
+    doesn't scan the activities. Changes made around the management
+    methods (to the activities list directly, or to one of its activities'
+    times or images) are counted by ActivityList.version and trigger one
+    full recomputation of this report's aggregates only. Set
+    validate_aggregates (per report, or as a constructor argument) to
+    check them against a full recomputation on every call.
+    
+    Like Activity, entry and exit times are stored as minutes since
+    midnight (entry_minutes, exit_minutes) in slots.
     """
     
+    __slots__ = (
+        'responsible', 'student', 'date', '_activities',
+        '_entry', '_exit', '_entry_text', '_exit_text',
+        '_listeners', '_early_listeners', '_interval_index', '_interval_index_state',
+        '_aggregates', '_aggregates_state', '_longest', '_shortest', '_extremes_valid',
+        '_validate_aggregates'
+    )
+    
     def __init__(
         self,
         responsible: str = "",
@@ -26,7 +157,8 @@ class Report:
         report_date: Optional[date] = None,
         entry_time: str = "00:00",
         exit_time: str = "00:00",
-        activities: Optional[List[Activity]] = None
+        activities: Optional[List[Activity]] = None,
+        validate_aggregates: bool = False
     ):
         """
         Initializes a new report.
@@ -38,18 +170,72 @@ class Report:
             entry_time: Entry time in HH:MM format
             exit_time: Exit time in HH:MM format
             activities: Optional list of activities
+            validate_aggregates: Check the statistics aggregates on every get_statistics()
         """
         self.responsible = responsible
         self.student = student
         self.date = report_date if report_date is not None else date.today()
         self.entry_time = entry_time
         self.exit_time = exit_time
+        self._validate_aggregates = validate_aggregates
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._early_listeners: List[Callable[[Dict[str, Any]], None]] = []
         self.activities = activities if activities is not None else []
-        self._instance_hours = ""
-        
-        # Calculate instance hours if times are provided
-        if self.entry_time and self.exit_time:
-            self.calculate_instance_hours()
+    
+    # ============================================================================
+    # TIME PROPERTIES
+    # ============================================================================
+    
+    @property
+    def entry_time(self) -> str:
+        """Entry time in HH:MM format (the original text if it is invalid)."""
+        return TIME_STRINGS[self._entry] if self._entry is not None else self._entry_text
+    
+    @entry_time.setter
+    def entry_time(self, value: str):
+        self._entry = parse_time(value)
+        self._entry_text = None if self._entry is not None else value
+    
+    @property
+    def exit_time(self) -> str:
+        """Exit time in HH:MM format (the original text if it is invalid)."""
+        return TIME_STRINGS[self._exit] if self._exit is not None else self._exit_text
+    
+    @exit_time.setter
+    def exit_time(self, value: str):
+        self._exit = parse_time(value)
+        self._exit_text = None if self._exit is not None else value
+    
+    @property
+    def validate_aggregates(self) -> bool:
+        """Validation mode: get_statistics() raises ValueError if the aggregates are wrong."""
+        return self._validate_aggregates
+    
+    @validate_aggregates.setter
+    def validate_aggregates(self, value: bool):
+        self._validate_aggregates = bool(value)
+    
+    @property
+    def activities(self) -> ActivityList:
+        """Activities performed, in order."""
+        return self._activities
+    
+    @activities.setter
+    def activities(self, value: List[Activity]):
+        self._activities = ActivityList(value)
+        self._interval_index: Optional[ActivityIntervalIndex] = None
+        self._interval_index_state: Optional[Tuple] = None
+        self._reset_aggregates()
+    
+    @property
+    def entry_minutes(self) -> Optional[int]:
+        """Entry time in minutes since midnight, None if invalid."""
+        return self._entry
+    
+    @property
+    def exit_minutes(self) -> Optional[int]:
+        """Exit time in minutes since midnight, None if invalid."""
+        return self._exit
     
     # ============================================================================
     # CALCULATION METHODS
@@ -62,33 +248,14 @@ class Report:
         Returns:
             str: Instance hours in format "HH:MM" or error message
         """
-        try:
-            if not self._validate_format_hour(self.entry_time):
-                self._instance_hours = "Invalid entry time"
-                return self._instance_hours
-            
-            if not self._validate_format_hour(self.exit_time):
-                self._instance_hours = "Invalid exit time"
-                return self._instance_hours
-            
-            entry = datetime.strptime(self.entry_time, "%H:%M")
-            exit_dt = datetime.strptime(self.exit_time, "%H:%M")
-            
-            # If exit is before entry, assume next day
-            if exit_dt <= entry:
-                exit_dt += timedelta(days=1)
-            
-            difference = exit_dt - entry
-            
-            hours = int(difference.total_seconds() // 3600)
-            minutes = int((difference.total_seconds() % 3600) // 60)
-            
-            self._instance_hours = f"{hours:02d}:{minutes:02d}"
-            return self._instance_hours
-            
-        except Exception as e:
-            self._instance_hours = "Calculate Error"
-            return self._instance_hours
+        if self._entry is None:
+            return "Invalid entry time"
+        
+        if self._exit is None:
+            return "Invalid exit time"
+        
+        # If exit is before entry, assume next day
+        return format_minutes(span_minutes(self._entry, self._exit))
     
     @property
     def instance_hours(self) -> str:
@@ -98,9 +265,7 @@ class Report:
         Returns:
             str: Instance hours in HH:MM format
         """
-        if not self._instance_hours:
-            self.calculate_instance_hours()
-        return self._instance_hours
+        return self.calculate_instance_hours()
     
     def calculate_total_activity_hours(self) -> str:
         """
@@ -109,15 +274,16 @@ class Report:
         Returns:
             str: Total hours in HH:MM format
         """
-        total_minutes = sum(
-            activity.get_duration_in_minutes() 
-            for activity in self.activities
-        )
-        
-        hours = total_minutes // 60
-        minutes = total_minutes % 60
+        return format_minutes(self.get_total_activity_minutes())
+    
+    def get_total_activity_minutes(self) -> int:
+        """
+        Gets the total duration of all activities in minutes.
         
-        return f"{hours:02d}:{minutes:02d}"
+        Returns:
+            int: Total minutes
+        """
+        return self._get_aggregates()['total_minutes']
     
     def get_instance_hours_in_minutes(self) -> int:
         """
@@ -126,18 +292,9 @@ class Report:
         Returns:
             int: Total minutes
         """
-        try:
-            if not self._instance_hours or ":" not in self._instance_hours:
-                self.calculate_instance_hours()
-            
-            if ":" not in self._instance_hours:
-                return 0
-            
-            hours, minutes = self._instance_hours.split(":")
-            return int(hours) * 60 + int(minutes)
-            
-        except (ValueError, AttributeError):
+        if self._entry is None or self._exit is None:
             return 0
+        return span_minutes(self._entry, self._exit)
     
     def _validate_format_hour(self, hour: str) -> bool:
         """
@@ -149,14 +306,7 @@ class Report:
         Returns:
             bool: True if format is correct
         """
-        if not hour or not isinstance(hour, str):
-            return False
-        
-        try:
-            datetime.strptime(hour, "%H:%M")
-            return True
-        except ValueError:
-            return False
+        return parse_time(hour) is not None
     
     # ============================================================================
     # ACTIVITY MANAGEMENT METHODS
@@ -180,7 +330,9 @@ class Report:
         if not valid:
             return False, f"Invalid activity: {message}"
         
+        self._before_change('about_to_insert', len(self.activities), activity=activity)
         self.activities.append(activity)
+        self._notify('inserted', len(self.activities) - 1, activity=activity)
         return True, f"Activity added (Total: {len(self.activities)})"
     
     def remove_activity(self, index: int) -> Tuple[bool, str]:
@@ -194,7 +346,9 @@ class Report:
             Tuple[bool, str]: (success, message)
         """
         if 0 <= index < len(self.activities):
+            self._before_change('about_to_remove', index, activity=self.activities[index])
             removed = self.activities.pop(index)
+            self._notify('removed', index, activity=removed)
             return True, f"Activity '{removed.title}' removed"
         return False, "Invalid index"
     
@@ -220,9 +374,11 @@ class Report:
         if not valid:
             return False, f"Invalid activity: {message}"
         
-        old_title = self.activities[index].title
+        self._before_change()
+        old_activity = self.activities[index]
         self.activities[index] = updated_activity
-        return True, f"Activity '{old_title}' updated"
+        self._notify('updated', index, activity=updated_activity, old_activity=old_activity)
+        return True, f"Activity '{old_activity.title}' updated"
     
     def get_activity(self, index: int) -> Optional[Activity]:
         """
@@ -249,7 +405,9 @@ class Report:
     
     def clear_activities(self):
         """Removes all activities from the report."""
+        self._before_change('about_to_reset')
         self.activities.clear()
+        self._notify('reset')
     
     def move_activity(self, from_index: int, to_index: int) -> Tuple[bool, str]:
         """
@@ -268,10 +426,80 @@ class Report:
         if not (0 <= to_index < len(self.activities)):
             return False, "Invalid destination index"
         
+        self._before_change(
+            'about_to_move', from_index, activity=self.activities[from_index], to_index=to_index
+        )
         activity = self.activities.pop(from_index)
         self.activities.insert(to_index, activity)
+        self._notify('moved', from_index, activity=activity, to_index=to_index)
         return True, f"Activity '{activity.title}' moved"
     
+    # ============================================================================
+    # CHANGE NOTIFICATION METHODS
+    # ============================================================================
+    
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None], about_to: bool = False):
+        """
+        Registers a callback for activity changes.
+        
+        The callback receives a dict with 'change' ("inserted", "updated",
+        "removed", "moved" or "reset") and, except for "reset", 'index' and
+        'activity'. "updated" adds 'old_activity' and "moved" adds 'to_index'.
+        
+        With about_to, the callback is also called before the activities
+        change, with 'change' "about_to_insert", "about_to_remove",
+        "about_to_move" (same keys as after the change; 'index' is the row
+        the activity will be inserted at) or "about_to_reset".
+        
+        Args:
+            callback: Function called after each change
+            about_to: Also call it before insertions, removals, moves and resets
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+        if about_to and callback not in self._early_listeners:
+            self._early_listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Unregisters a change callback.
+        
+        Args:
+            callback: Function previously passed to add_listener
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+        if callback in self._early_listeners:
+            self._early_listeners.remove(callback)
+    
+    def _before_change(self, change: Optional[str] = None, index: Optional[int] = None, **details):
+        """
+        Prepares for a management method changing the activities: brings
+        derived data up to date and sends the "about to" notification.
+        """
+        self._get_aggregates()  # Incremental updates start from correct totals
+        if change is not None:
+            self._send(self._early_listeners, change, index, details)
+    
+    def _notify(self, change: str, index: Optional[int] = None, **details):
+        """Updates derived data and sends a change notification to every listener."""
+        self._interval_index = None  # Activities changed
+        self._update_aggregates(change, details.get('activity'), details.get('old_activity'))
+        self._send(self._listeners, change, index, details)
+    
+    @staticmethod
+    def _send(listeners: List[Callable[[Dict[str, Any]], None]], change: str,
+              index: Optional[int], details: Dict[str, Any]):
+        """Calls every listener with a change event."""
+        if not listeners:
+            return
+        
+        event = {'change': change, **details}
+        if index is not None:
+            event['index'] = index
+        for callback in list(listeners):
+            callback(event)
+    
     # ============================================================================
     # VALIDATION METHODS
     # ============================================================================
@@ -283,25 +511,13 @@ class Report:
         Returns:
             Tuple[bool, str]: (is_valid, error_message)
         """
-        if not self._validate_format_hour(self.entry_time):
+        # Parsing already checked format and range (00:00 - 23:59)
+        if self._entry is None:
             return False, f"Invalid entry time: '{self.entry_time}'. Use HH:MM format (00:00 - 23:59)"
         
-        if not self._validate_format_hour(self.exit_time):
+        if self._exit is None:
             return False, f"Invalid exit time: '{self.exit_time}'. Use HH:MM format (00:00 - 23:59)"
         
-        try:
-            h_entry, m_entry = map(int, self.entry_time.split(":"))
-            h_exit, m_exit = map(int, self.exit_time.split(":"))
-            
-            if not (0 <= h_entry <= 23 and 0 <= m_entry <= 59):
-                return False, "Entry time out of range (00:00 - 23:59)"
-            
-            if not (0 <= h_exit <= 23 and 0 <= m_exit <= 59):
-                return False, "Exit time out of range (00:00 - 23:59)"
-            
-        except ValueError:
-            return False, "Error processing times"
-        
         return True, "Valid times"
     
     def validate_required_fields(self) -> Tuple[bool, str]:
@@ -405,20 +621,78 @@ class Report:
         end_time: str
     ) -> List[Activity]:
         """
-        Finds activities within a time range.
+        Finds activities whose start time is within a time range.
+        
+        Both ends of the range are included, so equal times match the
+        activities starting at that instant. A range that ends before its
+        start crosses midnight (e.g. 22:00-02:00).
         
         Args:
             start_time: Start time in HH:MM format
             end_time: End time in HH:MM format
-            
+        
         Returns:
-            List[Activity]: List of activities in range
+            List[Activity]: List of activities in range, in report order
+            (empty if a time is invalid)
         """
-        result = []
-        for activity in self.activities:
-            if start_time <= activity.start_time <= end_time:
-                result.append(activity)
-        return result
+        start, end = parse_time(start_time), parse_time(end_time)
+        if start is None or end is None:
+            return []
+        
+        if start <= end:
+            ranges = [(start, end)]
+        else:
+            ranges = [(start, MINUTES_PER_DAY - 1), (0, end)]
+        
+        # Activities are on the report's day or, in night shifts, the next one
+        index = self.get_interval_index()
+        day_start = self.date.toordinal() * MINUTES_PER_DAY
+        entries = [
+            entry
+            for day in (day_start, day_start + MINUTES_PER_DAY)
+            for first, last in ranges
+            for entry in index.starting_between(day + first, day + last)
+        ]
+        entries.sort(key=lambda entry: entry['index'])
+        return [entry['activity'] for entry in entries]
+    
+    def find_overlapping_activities(self) -> List[Tuple[Activity, Activity]]:
+        """
+        Finds pairs of activities whose times overlap.
+        
+        Returns:
+            List[Tuple[Activity, Activity]]: (earlier, later) pairs
+        """
+        return [
+            (first['activity'], second['activity'])
+            for first, second in self.get_interval_index().find_overlaps()
+        ]
+    
+    def find_activities_outside_hours(self) -> List[Activity]:
+        """
+        Finds activities that are not within the entry and exit times.
+        
+        Returns:
+            List[Activity]: Activities starting before entry or ending after exit
+        """
+        entries = sorted(self.get_interval_index().outside_window(), key=lambda entry: entry['index'])
+        return [entry['activity'] for entry in entries]
+    
+    def get_interval_index(self) -> ActivityIntervalIndex:
+        """
+        Gets the time index over this report's activities.
+        
+        The index is rebuilt after any activity change (see the change
+        counters) or a change of date, entry or exit time.
+        
+        Returns:
+            ActivityIntervalIndex: Index over the activities
+        """
+        state = (self.date, self.entry_time, self.exit_time, self._change_state())
+        if self._interval_index is None or self._interval_index_state != state:
+            self._interval_index = ActivityIntervalIndex.from_report(self)
+            self._interval_index_state = state
+        return self._interval_index
     
     def get_activities_with_images(self) -> List[Activity]:
         """
@@ -439,7 +713,7 @@ class Report:
         Returns:
             int: Total image count
         """
-        return sum(len(activity.images) for activity in self.activities)
+        return self._get_aggregates()['total_images']
     
     # ============================================================================
     # STATISTICS METHODS
@@ -449,57 +723,176 @@ class Report:
         """
         Generates report statistics.
         
+        Uses the aggregates kept up to date by the management methods, so
+        this doesn't scan the activities.
+        
         Returns:
             Dict: Dictionary with statistics
+        
+        Raises:
+            ValueError: If validate_aggregates is set and an aggregate is wrong
         """
+        if self.validate_aggregates:
+            valid, message = self.check_aggregates()
+            if not valid:
+                raise ValueError(message)
+        
+        aggregates = self._get_aggregates()
+        count = len(self.activities)
+        longest, shortest = self._get_extremes()
         return {
-            'total_activities': len(self.activities),
+            'total_activities': count,
             'total_activity_hours': self.calculate_total_activity_hours(),
             'instance_hours': self.instance_hours,
-            'total_images': self.get_total_images_count(),
-            'activities_with_images': len(self.get_activities_with_images()),
-            'average_activity_duration': self._calculate_average_duration(),
-            'longest_activity': self._get_longest_activity(),
-            'shortest_activity': self._get_shortest_activity()
+            'total_images': aggregates['total_images'],
+            'activities_with_images': aggregates['activities_with_images'],
+            'average_activity_duration': format_minutes(
+                aggregates['total_minutes'] // count if count else 0
+            ),
+            'longest_activity': longest.title if longest else None,
+            'shortest_activity': shortest.title if shortest else None
         }
     
-    def _calculate_average_duration(self) -> str:
-        """Calculates average activity duration."""
-        if not self.activities:
-            return "00:00"
-        
-        total_minutes = sum(
-            activity.get_duration_in_minutes() 
-            for activity in self.activities
-        )
-        avg_minutes = total_minutes // len(self.activities)
+    def check_aggregates(self) -> Tuple[bool, str]:
+        """
+        Checks the statistics aggregates against a full recomputation.
         
-        hours = avg_minutes // 60
-        minutes = avg_minutes % 60
+        Returns:
+            Tuple[bool, str]: (are_correct, message listing wrong values)
+        """
+        expected = self._compute_statistics()
+        aggregates = self._get_aggregates()
+        longest, shortest = self._get_extremes()
+        actual = {
+            'total_minutes': aggregates['total_minutes'],
+            'total_images': aggregates['total_images'],
+            'activities_with_images': aggregates['activities_with_images'],
+            'longest_activity': longest.title if longest else None,
+            'shortest_activity': shortest.title if shortest else None
+        }
         
-        return f"{hours:02d}:{minutes:02d}"
+        errors = [
+            f"{name}: {actual[name]!r} (expected {expected[name]!r})"
+            for name in actual if actual[name] != expected[name]
+        ]
+        if errors:
+            return False, "Statistics aggregates out of date: " + "; ".join(errors)
+        return True, "Statistics aggregates are correct"
+    
+    def _compute_statistics(self) -> Dict:
+        """Computes the aggregates by scanning every activity."""
+        durations = [activity.get_duration_in_minutes() for activity in self.activities]
+        return {
+            'total_minutes': sum(durations),
+            'total_images': sum(len(activity.images) for activity in self.activities),
+            'activities_with_images': len(self.get_activities_with_images()),
+            'longest_activity': (
+                self.activities[durations.index(max(durations))].title if durations else None
+            ),
+            'shortest_activity': (
+                self.activities[durations.index(min(durations))].title if durations else None
+            )
+        }
+    
+    # ============================================================================
+    # AGGREGATE MAINTENANCE METHODS
+    # ============================================================================
     
-    def _get_longest_activity(self) -> Optional[str]:
-        """Gets the title of the longest activity."""
-        if not self.activities:
-            return None
+    def _reset_aggregates(self):
+        """Recomputes the aggregates from the activity list."""
+        self._aggregates = {'total_minutes': 0, 'total_images': 0, 'activities_with_images': 0}
+        self._longest: Optional[Activity] = None
+        self._shortest: Optional[Activity] = None
+        self._extremes_valid = True
+        for activity in self.activities:
+            self._add_totals(activity)
+            self._consider_extreme(activity)
+        self._aggregates_state = self._change_state()
+    
+    def _add_totals(self, activity: Activity, sign: int = 1):
+        """Adds (sign=1) or subtracts (sign=-1) an activity's totals."""
+        images = len(activity.images)
+        self._aggregates['total_minutes'] += sign * activity.get_duration_in_minutes()
+        self._aggregates['total_images'] += sign * images
+        self._aggregates['activities_with_images'] += sign * (images > 0)
+    
+    def _consider_extreme(self, activity: Activity):
+        """
+        Updates longest/shortest with an activity placed after the current ones.
         
-        longest = max(
-            self.activities, 
-            key=lambda a: a.get_duration_in_minutes()
-        )
-        return longest.title
+        Only a strictly longer/shorter activity replaces an extreme, like
+        max()/min() keep the first of equal activities.
+        """
+        minutes = activity.get_duration_in_minutes()
+        if self._longest is None or minutes > self._longest.get_duration_in_minutes():
+            self._longest = activity
+        if self._shortest is None or minutes < self._shortest.get_duration_in_minutes():
+            self._shortest = activity
     
-    def _get_shortest_activity(self) -> Optional[str]:
-        """Gets the title of the shortest activity."""
-        if not self.activities:
-            return None
+    def _update_aggregates(self, change: str, activity: Optional[Activity], old_activity: Optional[Activity]):
+        """
+        Applies an activity change to the aggregates in O(1).
         
-        shortest = min(
-            self.activities, 
-            key=lambda a: a.get_duration_in_minutes()
-        )
-        return shortest.title
+        Longest and shortest are marked for recomputation only when the
+        change can affect them (an extreme removed or replaced, or a tie
+        whose order changed).
+        
+        The aggregates must have been up to date before the change (see
+        _before_change).
+        """
+        if change == 'inserted':
+            self._add_totals(activity)
+            if self._extremes_valid:
+                self._consider_extreme(activity)  # Appended last
+        elif change == 'removed':
+            self._add_totals(activity, -1)
+            if activity is self._longest or activity is self._shortest:
+                self._extremes_valid = False
+        elif change == 'updated':
+            self._add_totals(old_activity, -1)
+            self._add_totals(activity)
+            if old_activity is self._longest or old_activity is self._shortest:
+                self._extremes_valid = False
+            elif self._extremes_valid:
+                minutes = activity.get_duration_in_minutes()
+                if (minutes == self._longest.get_duration_in_minutes()
+                        or minutes == self._shortest.get_duration_in_minutes()):
+                    self._extremes_valid = False  # Tie: the first in order wins
+                else:
+                    self._consider_extreme(activity)  # Strictly longer/shorter: position doesn't matter
+        elif change == 'moved':
+            minutes = activity.get_duration_in_minutes()
+            if self._extremes_valid and (
+                    minutes == self._longest.get_duration_in_minutes()
+                    or minutes == self._shortest.get_duration_in_minutes()):
+                self._extremes_valid = False  # Order of equal activities changed
+        else:
+            self._reset_aggregates()
+            return
+        self._aggregates_state = self._change_state()
+    
+    def _get_aggregates(self) -> Dict[str, int]:
+        """
+        Gets the aggregates, recomputing them if the activities changed
+        outside the management methods.
+        """
+        if self._aggregates_state != self._change_state():
+            self._reset_aggregates()
+        return self._aggregates
+    
+    def _change_state(self) -> int:
+        """Gets the change counter of the activity list (which includes its activities' changes)."""
+        return self._activities.version
+    
+    def _get_extremes(self) -> Tuple[Optional[Activity], Optional[Activity]]:
+        """Gets the (longest, shortest) activities, recomputing them if needed."""
+        self._get_aggregates()
+        if not self._extremes_valid:
+            self._longest = self._shortest = None
+            for activity in self.activities:
+                self._consider_extreme(activity)
+            self._extremes_valid = True
+        return self._longest, self._shortest
     
     # ============================================================================
     # SERIALIZATION METHODS
@@ -0,0 +1,684 @@
+from typing import List, Tuple, Dict, Optional, Iterable, Iterator, Any
+from datetime import date
+import glob
+import json
+import os
+import sqlite3
+import unicodedata
+
+from models.activity_model import Activity
+from models.report_model import Report
+
+
+def name_key(name: str) -> str:
+    """
+    Normalizes a person's name for matching.
+
+    SQLite's NOCASE only folds ASCII letters, so "ÁLVAREZ" and "álvarez"
+    would differ; this folds case and removes accents for every letter.
+
+    Args:
+        name: Student or responsible name
+
+    Returns:
+        str: Name without accents, case-folded and without surrounding spaces
+    """
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold().strip()
+
+
+class ReportRepository:
+    """
+    Stores reports and their activities in an indexed SQLite database.
+
+    Reports are saved as separate JSON files; the repository keeps a copy of
+    all of them in one database so questions like "all of Ana's reports in
+    March" are answered with an index lookup instead of opening every file.
+    Reports imported from a JSON file remember its path and modification
+    time, so importing the same folder again only reads new or changed files.
+
+    Activity titles and descriptions are kept in an FTS5 full-text index,
+    updated by triggers whenever activities are stored or replaced, so
+    search_activities() finds matching activities across every report.
+
+    Query methods return lightweight summary dicts; get_report() and
+    load_reports() rebuild full Report objects. Student and responsible
+    filters ignore case and accents (see name_key).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reports (
+            id INTEGER PRIMARY KEY,
+            report_date TEXT NOT NULL,              -- ISO format, sorts by date
+            student TEXT NOT NULL COLLATE NOCASE,
+            responsible TEXT NOT NULL COLLATE NOCASE,
+            student_key TEXT NOT NULL DEFAULT '',   -- name_key(student), for matching
+            responsible_key TEXT NOT NULL DEFAULT '',
+            entry_time TEXT NOT NULL,
+            exit_time TEXT NOT NULL,
+            activity_count INTEGER NOT NULL,
+            source_path TEXT UNIQUE,                -- JSON file it was imported from
+            source_mtime_ns INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS activities (
+            id INTEGER PRIMARY KEY,
+            report_id INTEGER NOT NULL REFERENCES reports(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            start_time TEXT NOT NULL,
+            end_time TEXT NOT NULL,
+            images TEXT NOT NULL                    -- JSON list of paths
+        );
+        CREATE INDEX IF NOT EXISTS idx_reports_date ON reports(report_date);
+        CREATE INDEX IF NOT EXISTS idx_reports_student_key ON reports(student_key, report_date);
+        CREATE INDEX IF NOT EXISTS idx_reports_responsible_key ON reports(responsible_key, report_date);
+        CREATE INDEX IF NOT EXISTS idx_activities_report ON activities(report_id, position);
+
+        -- Full-text index over the activities table (external content)
+        CREATE VIRTUAL TABLE IF NOT EXISTS activities_fts USING fts5(
+            title, description,
+            content='activities', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE TRIGGER IF NOT EXISTS activities_fts_insert AFTER INSERT ON activities BEGIN
+            INSERT INTO activities_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+        CREATE TRIGGER IF NOT EXISTS activities_fts_delete AFTER DELETE ON activities BEGIN
+            INSERT INTO activities_fts (activities_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END;
+        CREATE TRIGGER IF NOT EXISTS activities_fts_update AFTER UPDATE OF title, description ON activities BEGIN
+            INSERT INTO activities_fts (activities_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO activities_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+    """
+
+    # Search ranking: a match in the title counts more than one in the description
+    TITLE_WEIGHT = 5.0
+    DESCRIPTION_WEIGHT = 1.0
+
+    SUMMARY_COLUMNS = (
+        "id, report_date, student, responsible, entry_time, exit_time, activity_count, source_path"
+    )
+
+    def __init__(self, db_path: Optional[str] = None, check_same_thread: bool = True):
+        """
+        Opens (and creates if needed) a report database.
+
+        Args:
+            db_path: Database file, or ":memory:" (defaults to the user data folder)
+            check_same_thread: False to use the connection from other threads
+                (the caller must then use it from one thread at a time)
+        """
+        self.db_path = db_path or self.default_db_path()
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if self.db_path != ':memory:':
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")  # Safe with WAL
+
+        has_index = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'activities_fts'"
+        ).fetchone()
+        self._add_name_keys()
+        self.connection.executescript(self.SCHEMA)
+        if not has_index:
+            # Databases created before the full-text index: index existing activities
+            with self.connection:
+                self.connection.execute("INSERT INTO activities_fts (activities_fts) VALUES ('rebuild')")
+
+    def _add_name_keys(self):
+        """Adds and fills the name key columns in databases created without them."""
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(reports)")]
+        if not columns or 'student_key' in columns:
+            return  # New database (created by SCHEMA) or already up to date
+
+        self.connection.create_function('name_key', 1, name_key, deterministic=True)
+        with self.connection:
+            self.connection.execute("ALTER TABLE reports ADD COLUMN student_key TEXT NOT NULL DEFAULT ''")
+            self.connection.execute("ALTER TABLE reports ADD COLUMN responsible_key TEXT NOT NULL DEFAULT ''")
+            self.connection.execute(
+                "UPDATE reports SET student_key = name_key(student), responsible_key = name_key(responsible)"
+            )
+            self.connection.execute("DROP INDEX IF EXISTS idx_reports_student")
+            self.connection.execute("DROP INDEX IF EXISTS idx_reports_responsible")
+
+    @staticmethod
+    def default_db_path() -> str:
+        """Get the default per-user database path."""
+        base = (
+            os.environ.get('LOCALAPPDATA') or
+            os.environ.get('XDG_DATA_HOME') or
+            os.path.join(os.path.expanduser('~'), '.local', 'share')
+        )
+        return os.path.join(base, 'ReportApp', 'reports.db')
+
+    # ============================================================================
+    # WRITE METHODS
+    # ============================================================================
+
+    def add_report(self, report: Report, source_path: Optional[str] = None) -> Tuple[Optional[int], str]:
+        """
+        Stores a report.
+
+        A report with the same source_path is replaced, so calling this after
+        saving a report keeps the database (and search index) up to date.
+
+        Args:
+            report: Report to store
+            source_path: JSON file the report belongs to, if any
+
+        Returns:
+            Tuple[Optional[int], str]: (report id or None, message)
+        """
+        try:
+            mtime_ns = None
+            if source_path:
+                source_path = os.path.abspath(source_path)
+                if os.path.exists(source_path):
+                    mtime_ns = os.stat(source_path).st_mtime_ns  # Not re-imported by import_json
+            with self.connection:
+                report_id = self._insert_reports([(report, source_path, mtime_ns)])[0]
+            return report_id, "Report stored"
+        except sqlite3.Error as e:
+            return None, f"Error storing report: {str(e)}"
+
+    def add_reports(self, reports: Iterable[Report]) -> Tuple[bool, str]:
+        """
+        Stores many reports in a single transaction.
+
+        Args:
+            reports: Reports to store
+
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        try:
+            with self.connection:
+                ids = self._insert_reports((report, None, None) for report in reports)
+            return True, f"{len(ids)} reports stored"
+        except sqlite3.Error as e:
+            return False, f"Error storing reports: {str(e)}"
+
+    def import_json(self, inputs: Iterable[str], skip_unchanged: bool = True) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        Imports report JSON files written by Report.to_json.
+
+        Every file is stored (or replaced) in one transaction.
+
+        Args:
+            inputs: Folders (every *.json inside), glob patterns or file paths
+            skip_unchanged: Skip files already imported with the same modification time
+
+        Returns:
+            Tuple[int, List[Tuple[str, str]]]: (reports imported, [(path, error message)])
+        """
+        files = []
+        for item in inputs:
+            if os.path.isdir(item):
+                files.extend(sorted(glob.glob(os.path.join(item, '*.json'))))
+            else:
+                files.extend(sorted(glob.glob(item)) or [item])
+
+        known = {}
+        if skip_unchanged:
+            known = dict(self.connection.execute(
+                "SELECT source_path, source_mtime_ns FROM reports WHERE source_path IS NOT NULL"
+            ))
+
+        rows = []
+        failures = []
+        for path in dict.fromkeys(os.path.abspath(f) for f in files):  # Unique, in order
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError as e:
+                failures.append((path, f"Error reading report: {str(e)}"))
+                continue
+            if known.get(path) == mtime_ns:
+                continue
+
+            report, message = Report.from_json(path)
+            if report is None:
+                failures.append((path, message))
+                continue
+            rows.append((report, path, mtime_ns))
+
+        try:
+            with self.connection:
+                self._insert_reports(rows)
+        except sqlite3.Error as e:
+            return 0, failures + [(self.db_path, f"Error storing reports: {str(e)}")]
+
+        return len(rows), failures
+
+    def delete_report(self, report_id: int) -> Tuple[bool, str]:
+        """
+        Deletes a report and its activities.
+
+        Args:
+            report_id: Id of the report
+
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        try:
+            with self.connection:
+                deleted = self.connection.execute("DELETE FROM reports WHERE id = ?", (report_id,)).rowcount
+        except sqlite3.Error as e:
+            return False, f"Error deleting report: {str(e)}"
+        if not deleted:
+            return False, f"Report {report_id} not found"
+        return True, "Report deleted"
+
+    def _insert_reports(self, rows: Iterable[Tuple[Report, Optional[str], Optional[int]]]) -> List[int]:
+        """
+        Inserts reports inside the caller's transaction.
+
+        Args:
+            rows: (report, source_path, source_mtime_ns) tuples
+
+        Returns:
+            List[int]: Ids of the inserted reports
+        """
+        cursor = self.connection.cursor()
+        ids = []
+        activity_rows = []
+        for report, source_path, mtime_ns in rows:
+            if source_path:
+                cursor.execute("DELETE FROM reports WHERE source_path = ?", (source_path,))
+            cursor.execute(
+                "INSERT INTO reports (report_date, student, responsible, student_key, responsible_key,"
+                " entry_time, exit_time, activity_count, source_path, source_mtime_ns)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (report.date.isoformat(), report.student, report.responsible,
+                 name_key(report.student), name_key(report.responsible), report.entry_time,
+                 report.exit_time, len(report.activities), source_path, mtime_ns)
+            )
+            report_id = cursor.lastrowid
+            ids.append(report_id)
+            activity_rows.extend(
+                (report_id, position, activity.title, activity.description,
+                 activity.start_time, activity.end_time, json.dumps(activity.images))
+                for position, activity in enumerate(report.activities)
+            )
+
+        cursor.executemany(
+            "INSERT INTO activities (report_id, position, title, description, start_time, end_time, images)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            activity_rows
+        )
+        return ids
+
+    # ============================================================================
+    # QUERY METHODS
+    # ============================================================================
+
+    def find_reports(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        student: Optional[str] = None,
+        responsible: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds reports by date range, student and/or responsible.
+
+        Names match whole, ignoring case and accents (see name_key).
+        Results are ordered by date.
+
+        Args:
+            start_date: First date included
+            end_date: Last date included
+            student: Student name (ignoring case and accents)
+            responsible: Responsible name (ignoring case and accents)
+            limit: Maximum number of results
+
+        Returns:
+            List[Dict]: Report summaries (see _summary)
+        """
+        conditions, params = self._report_filters("", start_date, end_date, student, responsible)
+
+        sql = f"SELECT {self.SUMMARY_COLUMNS} FROM reports"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY report_date, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [self._summary(row) for row in self.connection.execute(sql, params)]
+
+    def find_by_date_range(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        Finds reports between two dates (both included).
+
+        Args:
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            List[Dict]: Report summaries ordered by date
+        """
+        return self.find_reports(start_date=start_date, end_date=end_date)
+
+    def find_by_student(
+        self, student: str, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds a student's reports, optionally within a date range.
+
+        Args:
+            student: Student name (ignoring case and accents)
+            start_date: First date included
+            end_date: Last date included
+
+        Returns:
+            List[Dict]: Report summaries ordered by date
+        """
+        return self.find_reports(start_date=start_date, end_date=end_date, student=student)
+
+    def find_by_responsible(
+        self, responsible: str, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds the reports of a responsible person, optionally within a date range.
+
+        Args:
+            responsible: Responsible name (ignoring case and accents)
+            start_date: First date included
+            end_date: Last date included
+
+        Returns:
+            List[Dict]: Report summaries ordered by date
+        """
+        return self.find_reports(start_date=start_date, end_date=end_date, responsible=responsible)
+
+    def get_report(self, report_id: int) -> Optional[Report]:
+        """
+        Loads a full report with its activities.
+
+        Args:
+            report_id: Id of the report
+
+        Returns:
+            Optional[Report]: Report or None if not found
+        """
+        reports = self.load_reports([report_id])
+        return reports[0] if reports else None
+
+    def load_reports(self, report_ids: Iterable[int]) -> List[Report]:
+        """
+        Loads full reports with their activities.
+
+        Args:
+            report_ids: Ids of the reports (e.g. from find_reports)
+
+        Returns:
+            List[Report]: Reports in the given order (missing ids are skipped)
+        """
+        ids = list(dict.fromkeys(report_ids))
+        if not ids:
+            return []
+
+        reports = {}
+        activities: Dict[int, List[Activity]] = {}
+        # Stay below SQLite's limit on query parameters
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self.connection.execute(
+                f"SELECT id, report_date, student, responsible, entry_time, exit_time"
+                f" FROM reports WHERE id IN ({placeholders})", chunk
+            ):
+                reports[row[0]] = row
+            for report_id, title, description, start_time, end_time, images in self.connection.execute(
+                f"SELECT report_id, title, description, start_time, end_time, images FROM activities"
+                f" WHERE report_id IN ({placeholders}) ORDER BY report_id, position", chunk
+            ):
+                activities.setdefault(report_id, []).append(
+                    Activity(title, description, start_time, end_time, json.loads(images))
+                )
+
+        return [
+            Report(
+                responsible=reports[report_id][3],
+                student=reports[report_id][2],
+                report_date=date.fromisoformat(reports[report_id][1]),
+                entry_time=reports[report_id][4],
+                exit_time=reports[report_id][5],
+                activities=activities.get(report_id, [])
+            )
+            for report_id in ids if report_id in reports
+        ]
+
+    def search_activities(
+        self,
+        text: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        student: Optional[str] = None,
+        responsible: Optional[str] = None,
+        limit: Optional[int] = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over the titles and descriptions of every stored activity.
+
+        Every word must appear (as a word prefix, ignoring case and accents),
+        so "inst red" matches "Instalación de la red". Results are ranked
+        with BM25, title matches first.
+
+        Args:
+            text: Words to search for
+            start_date: First report date included
+            end_date: Last report date included
+            student: Student name (ignoring case and accents)
+            responsible: Responsible name (ignoring case and accents)
+            limit: Maximum number of results (None = all)
+
+        Returns:
+            List[Dict]: Matches with report_id, position (activity index in
+            the report), title, description, snippet (matches in [brackets]),
+            date, student, responsible and score (higher is better)
+        """
+        query = self._fts_query(text)
+        if not query:
+            return []
+
+        conditions, params = self._report_filters("r.", start_date, end_date, student, responsible)
+        conditions.insert(0, "activities_fts MATCH ?")
+        params.insert(0, query)
+
+        sql = (
+            "SELECT a.report_id, a.position, a.title, a.description,"
+            " snippet(activities_fts, 1, '[', ']', '...', 12),"
+            " r.report_date, r.student, r.responsible,"
+            f" bm25(activities_fts, {self.TITLE_WEIGHT}, {self.DESCRIPTION_WEIGHT}) AS rank"
+            " FROM activities_fts"
+            " JOIN activities a ON a.id = activities_fts.rowid"
+            " JOIN reports r ON r.id = a.report_id"
+            " WHERE " + " AND ".join(conditions) +
+            " ORDER BY rank"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            {
+                'report_id': row[0],
+                'position': row[1],
+                'title': row[2],
+                'description': row[3],
+                'snippet': row[4],
+                'date': date.fromisoformat(row[5]),
+                'student': row[6],
+                'responsible': row[7],
+                'score': -row[8]  # BM25 is lower for better matches
+            }
+            for row in self.connection.execute(sql, params)
+        ]
+
+    def iter_activity_times(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        student: Optional[str] = None,
+        responsible: Optional[str] = None
+    ) -> Iterator[Tuple[int, date, str, str, int, str, str, str]]:
+        """
+        Streams the times of every stored activity, without building Report objects.
+
+        Used to build time indexes (see ActivityIntervalIndex.from_repository).
+
+        Args:
+            start_date: First report date included
+            end_date: Last report date included
+            student: Student name (ignoring case and accents)
+            responsible: Responsible name (ignoring case and accents)
+
+        Yields:
+            Tuple: (report_id, report date, entry_time, exit_time, position,
+            title, start_time, end_time)
+        """
+        conditions, params = self._report_filters("r.", start_date, end_date, student, responsible)
+        sql = (
+            "SELECT r.id, r.report_date, r.entry_time, r.exit_time,"
+            " a.position, a.title, a.start_time, a.end_time"
+            " FROM reports r JOIN activities a ON a.report_id = r.id"
+        )
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+
+        for row in self.connection.execute(sql, params):
+            yield (row[0], date.fromisoformat(row[1])) + tuple(row[2:])
+
+    def iter_activity_stats(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        student: Optional[str] = None,
+        responsible: Optional[str] = None
+    ) -> Iterator[Tuple[int, str, str, str, str, int]]:
+        """
+        Streams what analytics need of every stored activity, without
+        building Report objects.
+
+        Used to build columnar tables (see ActivityTable.from_repository).
+
+        Args:
+            start_date: First report date included
+            end_date: Last report date included
+            student: Student name (ignoring case and accents)
+            responsible: Responsible name (ignoring case and accents)
+
+        Yields:
+            Tuple: (report_id, report date in ISO format, student,
+            start_time, end_time, image count)
+        """
+        conditions, params = self._report_filters("r.", start_date, end_date, student, responsible)
+        sql = (
+            "SELECT r.id, r.report_date, r.student, a.start_time, a.end_time,"
+            " json_array_length(a.images)"
+            " FROM reports r JOIN activities a ON a.report_id = r.id"
+        )
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+
+        yield from self.connection.execute(sql, params)
+
+    @staticmethod
+    def _report_filters(
+        prefix: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        student: Optional[str],
+        responsible: Optional[str]
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        Builds WHERE conditions on the reports table.
+
+        Args:
+            prefix: Table alias prefix for the columns ("" or "r.")
+            start_date: First date included
+            end_date: Last date included
+            student: Student name
+            responsible: Responsible name
+
+        Returns:
+            Tuple[List[str], List[Any]]: (conditions, parameters)
+        """
+        conditions = []
+        params: List[Any] = []
+        if student is not None:
+            conditions.append(f"{prefix}student_key = ?")
+            params.append(name_key(student))
+        if responsible is not None:
+            conditions.append(f"{prefix}responsible_key = ?")
+            params.append(name_key(responsible))
+        if start_date is not None:
+            conditions.append(f"{prefix}report_date >= ?")
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            conditions.append(f"{prefix}report_date <= ?")
+            params.append(end_date.isoformat())
+        return conditions, params
+
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """
+        Turns user input into an FTS5 query of prefix terms.
+
+        Args:
+            text: Words typed by the user
+
+        Returns:
+            str: Query like '"inst"* "red"*' (empty if there are no words)
+        """
+        terms = [word.replace('"', '') for word in text.split()]
+        return " ".join(f'"{term}"*' for term in terms if term)
+
+    def count(self) -> int:
+        """Get the number of stored reports."""
+        return self.connection.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+    @staticmethod
+    def _summary(row: Tuple) -> Dict[str, Any]:
+        """
+        Converts a reports row (SUMMARY_COLUMNS) to a summary dict.
+
+        Returns:
+            Dict: id, date, student, responsible, entry_time, exit_time,
+            activity_count and source_path
+        """
+        return {
+            'id': row[0],
+            'date': date.fromisoformat(row[1]),
+            'student': row[2],
+            'responsible': row[3],
+            'entry_time': row[4],
+            'exit_time': row[5],
+            'activity_count': row[6],
+            'source_path': row[7]
+        }
+
+    # ============================================================================
+    # CONNECTION METHODS
+    # ============================================================================
+
+    def close(self):
+        """Closes the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> 'ReportRepository':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
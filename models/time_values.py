@@ -0,0 +1,90 @@
+from typing import Dict, Optional
+
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def _build_time_lookup() -> Dict[str, int]:
+    """
+    Builds the table of every valid time string and its minutes.
+
+    Accepts the same strings as datetime.strptime(value, "%H:%M"): hours
+    and minutes with one or two digits ("9:05", "09:5", "09:05").
+    """
+    lookup = {}
+    for hours in range(24):
+        for minutes in range(60):
+            value = hours * 60 + minutes
+            for hours_text in (str(hours), f"{hours:02d}"):
+                for minutes_text in (str(minutes), f"{minutes:02d}"):
+                    lookup[f"{hours_text}:{minutes_text}"] = value
+    return lookup
+
+
+_TIME_LOOKUP = _build_time_lookup()
+
+# Canonical "HH:MM" string of every minute of the day, shared by all instances
+TIME_STRINGS = tuple(f"{minutes // 60:02d}:{minutes % 60:02d}" for minutes in range(MINUTES_PER_DAY))
+
+
+def parse_time(value: str) -> Optional[int]:
+    """
+    Converts an HH:MM time to minutes since midnight.
+
+    A single dict lookup, so it is much cheaper than strptime when loading
+    large archives.
+
+    Args:
+        value: Time in 24h format
+
+    Returns:
+        Optional[int]: Minutes (0-1439), or None if the time is invalid
+    """
+    try:
+        return _TIME_LOOKUP.get(value)
+    except TypeError:  # Not hashable, so not a string
+        return None
+
+
+def format_time(minutes: int) -> str:
+    """
+    Converts minutes since midnight to an HH:MM time.
+
+    Args:
+        minutes: Minutes (0-1439)
+
+    Returns:
+        str: Time in HH:MM format
+    """
+    return TIME_STRINGS[minutes]
+
+
+def format_minutes(minutes: int) -> str:
+    """
+    Converts an amount of minutes to HH:MM (hours can exceed 23).
+
+    Args:
+        minutes: Amount of minutes
+
+    Returns:
+        str: Duration in HH:MM format
+    """
+    if 0 <= minutes < MINUTES_PER_DAY:
+        return TIME_STRINGS[minutes]
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def span_minutes(start: int, end: int) -> int:
+    """
+    Gets the length of a start-end time span in minutes.
+
+    An end at or before the start is on the next day.
+
+    Args:
+        start: Start in minutes since midnight
+        end: End in minutes since midnight
+
+    Returns:
+        int: Length in minutes (1-1440)
+    """
+    return (end - start) % MINUTES_PER_DAY or MINUTES_PER_DAY
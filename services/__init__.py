@@ -1,8 +1,29 @@
 """
 Services module for Daily Report System
 Contains PDF generation and other utility services
+
+Names are imported on first use, so importing a light submodule (the image
+cache, for example) doesn't load ReportLab and PIL at startup.
 """
 
-from .pdf_generator import PDFGenerator, CompressionLevel, generate_pdf
+import importlib
+
+_EXPORTS = {
+    'PDFGenerator': '.pdf_generator',
+    'CompressionLevel': '.compression',
+    'GenerationCancelled': '.pdf_generator',
+    'generate_pdf': '.pdf_generator',
+    'ImageCache': '.image_cache',
+    'get_default_cache': '.image_cache',
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = ['PDFGenerator', 'CompressionLevel', 'generate_pdf']
\ No newline at end of file
+def __getattr__(name):
+    """Import exported names lazily."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Compression levels for Daily Report System
+Kept apart from the PDF generator so the UI can use them without loading
+ReportLab and PIL
+"""
+
+
+class CompressionLevel:
+    """Compression levels for images in PDF."""
+    LOW = "low"      # High quality, larger file
+    MEDIUM = "medium"  # Balanced
+    HIGH = "high"    # Lower quality, smaller file
+    TARGET_SIZE = "target_size"  # Fit a total PDF size budget
@@ -0,0 +1,196 @@
+"""
+Image cache for Daily Report System
+Persistent on-disk cache of compressed report images
+"""
+
+from typing import Optional, Dict
+import hashlib
+import json
+import os
+import threading
+
+
+class ImageCache:
+    """
+    Stores compressed JPEG images on disk so repeated PDF generations
+    (preview followed by generate, for example) skip PIL work entirely.
+
+    Entries are keyed by the source path, modification time and size plus
+    the compression settings used. When the cache grows beyond max_bytes the
+    least recently used entries are evicted.
+    """
+
+    DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+    ENTRY_SUFFIX = '.jpg'
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize image cache.
+
+        Args:
+            cache_dir: Directory for cached images (defaults to the user cache folder)
+            max_bytes: Maximum total size of cached images
+        """
+        self.cache_dir = cache_dir or self.default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # Lazily computed
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        """Get the default per-user cache directory."""
+        base = (
+            os.environ.get('LOCALAPPDATA') or
+            os.environ.get('XDG_CACHE_HOME') or
+            os.path.join(os.path.expanduser('~'), '.cache')
+        )
+        return os.path.join(base, 'ReportApp', 'image_cache')
+
+    def make_key(self, image_path: str, settings: Dict) -> Optional[str]:
+        """
+        Build the cache key for an image and compression settings.
+
+        Args:
+            image_path: Path to original image
+            settings: Compression settings used to encode the image
+
+        Returns:
+            str: Hex digest key, or None if the image cannot be read
+        """
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+
+        payload = json.dumps({
+            'path': os.path.abspath(image_path),
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'settings': settings
+        }, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        """Get the file path for a cache entry."""
+        return os.path.join(self.cache_dir, key + self.ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached image.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            str: Path to cached image, or None on miss
+        """
+        path = self._entry_path(key)
+        try:
+            os.utime(path, None)  # Mark as recently used
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, data: bytes) -> Optional[str]:
+        """
+        Store a compressed image.
+
+        Args:
+            key: Cache key from make_key
+            data: Encoded JPEG bytes
+
+        Returns:
+            str: Path to cached image, or None if it could not be written
+        """
+        path = self._entry_path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+        except OSError:
+            self._remove_quietly(temp_path)
+            return None
+
+        with self._lock:
+            try:
+                old_size = os.stat(path).st_size  # Overwriting an entry replaces its bytes
+            except OSError:
+                old_size = 0
+            try:
+                os.replace(temp_path, path)
+            except OSError:
+                self._remove_quietly(temp_path)
+                return None
+
+            if self._total_bytes is not None:
+                self._total_bytes += len(data) - old_size
+            self._evict_if_needed()
+        return path
+
+    @staticmethod
+    def _remove_quietly(path: str):
+        """Remove a file, ignoring errors."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict_if_needed(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        if self._total_bytes is not None and self._total_bytes <= self.max_bytes:
+            return
+
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()  # Oldest access first
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass  # In use or already removed
+
+        self._total_bytes = total
+
+    def clear(self):
+        """Remove all cached images."""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(self.ENTRY_SUFFIX):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+            self._total_bytes = 0
+
+
+_default_cache: Optional[ImageCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ImageCache:
+    """
+    Get the shared application image cache.
+
+    Returns:
+        ImageCache: Cache in the default per-user directory
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ImageCache()
+        return _default_cache
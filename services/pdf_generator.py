@@ -14,19 +14,53 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 from PIL import Image as PILImage
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Dict, Set, Union, Iterable, Iterator, Callable, Any
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import io
 import os
 import tempfile
+import threading
+import time
 from models.report_model import Report
 from models.activity_model import Activity
+from services.compression import CompressionLevel
+from services.image_cache import ImageCache, get_default_cache
+from services.render_cache import RenderCache, get_default_render_cache
 
 
-class CompressionLevel:
-    """Compression levels for images in PDF."""
-    LOW = "low"      # High quality, larger file
-    MEDIUM = "medium"  # Balanced
-    HIGH = "high"    # Lower quality, smaller file
+class GenerationCancelled(Exception):
+    """Raised inside PDFGenerator when generation is cancelled."""
+
+
+class _FlowableStream(list):
+    """
+    List of flowables that refills itself from an iterator of sections.
+    
+    DocTemplate.build only works on the head of the list (len(), [0],
+    del [0] and inserts at the front), so topping the list up as it drains
+    lets ReportLab lay out a long story with only a few sections alive.
+    """
+    
+    LOOKAHEAD = 8  # Queued flowables, so keepWithNext can see what follows
+    
+    def __init__(self, sections: Iterable[List]):
+        super().__init__()
+        self._sections: Iterator[List] = iter(sections)
+        self._fill()
+    
+    def _fill(self):
+        """Pull sections until the lookahead is satisfied or input ends."""
+        while list.__len__(self) < self.LOOKAHEAD:
+            section = next(self._sections, None)
+            if section is None:
+                break
+            self.extend(section)
+    
+    def __len__(self) -> int:
+        self._fill()
+        return list.__len__(self)
 
 
 class PDFGenerator:
@@ -61,23 +95,93 @@ class PDFGenerator:
             'max_height': 135,     
             'quality': 40,         # Máxima compresión
             'dpi': 72              
+        },
+        CompressionLevel.TARGET_SIZE: {
+            'max_width': 350,      # Punto de partida (igual que LOW)
+            'max_height': 260,
+            'quality': 85,         # Calidad máxima de la búsqueda
+            'min_quality': 20,     # Calidad mínima antes de reducir tamaño
+            'min_width': 64,       # Ancho mínimo al reducir dimensiones
+            'dpi': 72
         }
     }
     
-    def __init__(self, report: Report, compression_level: str = CompressionLevel.MEDIUM, include_signatures: bool = False):
+    # TARGET_SIZE budget: default total and estimated non-image PDF bytes
+    DEFAULT_TARGET_SIZE = 100 * 1024
+    TARGET_BASE_OVERHEAD = 8 * 1024        # Fonts, info, general section
+    TARGET_ACTIVITY_OVERHEAD = 1024        # Text and table per activity
+    TARGET_MIN_IMAGE_BUDGET = 1024         # Below this images are unrecognizable
+    
+    # Attributes platypus sets on top-level flowables while building a document
+    LAYOUT_STATE_ATTRS = ('_postponed', '_frame')
+    
+    def __init__(
+        self,
+        report: Report,
+        compression_level: str = CompressionLevel.MEDIUM,
+        include_signatures: bool = False,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        image_cache: Optional[ImageCache] = None,
+        in_memory: bool = False,
+        streaming: bool = False,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        event_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        target_size_bytes: Optional[int] = None,
+        incremental: bool = False,
+        render_cache: Optional[RenderCache] = None
+    ):
         """
         Initialize PDF generator.
         
         Args:
             report: Report object to generate PDF from
-            compression_level: "low", "medium", or "high"
+            compression_level: "low", "medium", "high" or "target_size"
             include_signatures: Whether to include signature fields
+            max_workers: Threads used to compress images (None = CPU based default, 1 = serial)
+            use_cache: Whether to reuse compressed images from the on-disk cache
+            image_cache: Cache to use (defaults to the shared application cache)
+            in_memory: Keep compressed images in memory instead of temporary files.
+                Freshly compressed images are still written to the cache when
+                use_cache is on, but drawn from memory; cache hits are read from
+                the cache file
+            streaming: Build activity sections lazily while ReportLab lays out pages,
+                compressing each activity's images just before its section
+            progress_callback: Called as (stage, done, total) where stage is "image" or "activity"
+            cancel_event: When set, generation stops and generate() returns failure
+            event_callback: Receives instrumentation events as dicts (see generate())
+            target_size_bytes: Total PDF budget for "target_size" (default DEFAULT_TARGET_SIZE)
+            incremental: Reuse the rendered sections of activities unchanged since an
+                earlier generation (kept in memory), so only edited activities are redone
+            render_cache: Cache to use in incremental mode (defaults to the shared one)
         """
         self.report = report
         self.compression_level = compression_level
         self.compression_settings = self.COMPRESSION_SETTINGS[compression_level]
         self.include_signatures = include_signatures
+        self.max_workers = max_workers
+        self.image_cache = (image_cache or get_default_cache()) if use_cache else None
+        self.in_memory = in_memory
+        self.streaming = streaming
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self.event_callback = event_callback
+        self.target_size_bytes = target_size_bytes or self.DEFAULT_TARGET_SIZE
+        self.render_cache: Optional[RenderCache] = None
+        if incremental:
+            self.render_cache = render_cache if render_cache is not None else get_default_render_cache()
+        self.image_budget: Optional[int] = None  # Per-image bytes in target_size mode
+        self._story_seconds = 0.0
         self.temp_images = []  # Track temporary compressed images
+        self.compressed_images: Dict[str, Union[str, bytes]] = {}  # Original path -> compressed image
+        self.image_aliases: Optional[Dict[str, str]] = None  # Path -> first path with the same content
+        self._pending_images: Set[str] = set()  # Streaming mode: images not compressed yet
+        self._image_last_use: Dict[str, int] = {}  # Streaming mode: image -> last activity using it
+        self._image_progress = (0, 0)  # Streaming mode: (images compressed, images to compress)
+        self.section_keys: List[Optional[str]] = []  # Render cache key per activity (incremental mode)
+        self.rendered_sections: Dict[str, Tuple[List, List[str]]] = {}  # Render cache key -> (body, files)
+        self._used_sections: Set[str] = set()
         
         # Page setup
         self.pagesize = letter
@@ -187,7 +291,7 @@ class PDFGenerator:
         
         canvas_obj.restoreState()
     
-    def _compress_image(self, image_path: str) -> str:
+    def _compress_image(self, image_path: str) -> Union[str, bytes]:
         """
         Compress and resize image according to compression level.
         
@@ -195,11 +299,169 @@ class PDFGenerator:
             image_path: Path to original image
             
         Returns:
-            str: Path to compressed temporary image
+            Union[str, bytes]: Path to compressed image (cached or temporary),
+            or the JPEG data itself in in-memory mode
+        """
+        result, stats = self._compress_image_with_stats(image_path)
+        self._emit_event(stats)
+        return result
+    
+    def _compress_image_with_stats(self, image_path: str) -> Tuple[Union[str, bytes], Dict[str, Any]]:
+        """
+        Compress an image and collect its instrumentation event.
+        
+        Reuses the cached result when the image cache already holds this
+        image for the current settings.
+        
+        Args:
+            image_path: Path to original image
+            
+        Returns:
+            Tuple[Union[str, bytes], Dict]: (compressed image, "image" event)
         """
+        stats: Dict[str, Any] = {
+            'event': 'image',
+            'path': image_path,
+            'source': 'encoded',
+            'bytes_in': 0,
+            'bytes_out': 0,
+            'decode_seconds': 0.0,
+            'resize_seconds': 0.0,
+            'encode_seconds': 0.0
+        }
+        
         try:
-            # Open image
-            img = PILImage.open(image_path)
+            stats['bytes_in'] = os.path.getsize(image_path)
+            
+            cache_key = None
+            if self.image_cache:
+                cache_key = self.image_cache.make_key(image_path, self._image_settings())
+                if cache_key:
+                    cached_path = self.image_cache.get(cache_key)
+                    if cached_path:
+                        stats['source'] = 'cache'
+                        stats['bytes_out'] = os.path.getsize(cached_path)
+                        return cached_path, stats
+            
+            data = self._encode_image(image_path, stats)
+            stats['bytes_out'] = len(data)
+            
+            # Store in cache (cached files are not cleaned up); in-memory
+            # mode keeps drawing from the bytes instead of reading them back
+            if cache_key:
+                cached_path = self.image_cache.put(cache_key, data)
+                if cached_path and not self.in_memory:
+                    return cached_path, stats
+            
+            if self.in_memory:
+                return data, stats
+            
+            # Save to temporary file
+            temp_file = tempfile.NamedTemporaryFile(
+                delete=False,
+                suffix='.jpg'
+            )
+            temp_file.write(data)
+            temp_file.close()
+            self.temp_images.append(temp_file.name)
+            
+            return temp_file.name, stats
+            
+        except Exception as e:
+            if not self.event_callback:
+                print(f"Error compressing image {image_path}: {e}")
+            stats['source'] = 'original'
+            stats['error'] = str(e)
+            return image_path, stats  # Return original if compression fails
+    
+    def _image_settings(self) -> Dict[str, Any]:
+        """
+        Get the settings that determine a compressed image (used as cache key).
+        
+        Returns:
+            Dict: Compression settings, plus the per-image budget in target_size mode
+        """
+        if self.compression_level == CompressionLevel.TARGET_SIZE:
+            return {**self.compression_settings, 'budget_bytes': self._get_image_budget()}
+        return self.compression_settings
+    
+    def _get_image_budget(self) -> int:
+        """
+        Split the target size across the report's unique images.
+        
+        Returns:
+            int: Byte budget for each image
+        """
+        if self.image_budget is None:
+            unique_images = set(self._get_image_aliases().values())
+            available = (
+                self.target_size_bytes
+                - self.TARGET_BASE_OVERHEAD
+                - self.TARGET_ACTIVITY_OVERHEAD * len(self.report.activities)
+            )
+            self.image_budget = max(
+                self.TARGET_MIN_IMAGE_BUDGET,
+                available // max(1, len(unique_images))
+            )
+        return self.image_budget
+    
+    def _encode_image(self, image_path: str, stats: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Resize and JPEG-encode an image with the current compression settings.
+        
+        Args:
+            image_path: Path to original image
+            stats: Optional dict that receives decode/resize/encode timings
+            
+        Returns:
+            bytes: Encoded JPEG data
+        """
+        stats = stats if stats is not None else {}
+        settings = self.compression_settings
+        img = self._load_image(image_path, settings['max_width'], settings['max_height'], stats)
+        
+        started = time.perf_counter()
+        if self.compression_level == CompressionLevel.TARGET_SIZE:
+            data = self._encode_to_budget(img, self._get_image_budget())
+        else:
+            data = self._encode_jpeg(img, settings['quality'])
+        stats['encode_seconds'] = time.perf_counter() - started
+        return data
+    
+    def _load_image(self, image_path: str, max_w: int, max_h: int, stats: Dict[str, Any]) -> PILImage.Image:
+        """
+        Decode an image as RGB, resized to fit max_w x max_h.
+        
+        Args:
+            image_path: Path to original image
+            max_w: Maximum width
+            max_h: Maximum height
+            stats: Dict that receives decode/resize timings
+            
+        Returns:
+            PIL.Image.Image: Resized RGB image
+        """
+        started = time.perf_counter()
+        
+        with PILImage.open(image_path) as source:
+            img = source
+            target_size = self._fit_size(img.size, max_w, max_h)
+            
+            # Decode at reduced scale: JPEG DCT scaling for JPEG sources,
+            # integer box reduction otherwise. Both keep the image at least
+            # as large as the final thumbnail.
+            if img.format == 'JPEG':
+                img.draft(None, target_size)
+            elif img.mode == 'P':
+                img = img.convert('RGB')
+            img.load()
+            
+            decoded = time.perf_counter()
+            stats['decode_seconds'] = decoded - started
+            
+            factor = min(img.width // target_size[0], img.height // target_size[1])
+            if factor > 1:
+                img = img.reduce(factor)
             
             # Convert to RGB if necessary
             if img.mode in ('RGBA', 'P'):
@@ -210,33 +472,343 @@ class PDFGenerator:
                     background.paste(img)
                 img = background
             
-            # Resize maintaining aspect ratio
-            max_w = self.compression_settings['max_width']
-            max_h = self.compression_settings['max_height']
+            # Keep the pixels usable after the source file is closed
+            if img is source:
+                img = img.copy()
             
+            # Resize maintaining aspect ratio
             img.thumbnail((max_w, max_h), PILImage.Resampling.LANCZOS)
             
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix='.jpg'
-            )
+            stats['resize_seconds'] = time.perf_counter() - decoded
+            return img
+    
+    @staticmethod
+    def _encode_jpeg(img: PILImage.Image, quality: int) -> bytes:
+        """Encode an image as optimized JPEG."""
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=quality, optimize=True)
+        return buffer.getvalue()
+    
+    def _encode_to_budget(self, img: PILImage.Image, budget: int) -> bytes:
+        """
+        Encode an image in at most budget bytes.
+        
+        Binary-searches the highest JPEG quality that fits; if even the
+        minimum quality is too big, shrinks the image by 20% and retries.
+        
+        Args:
+            img: Resized RGB image
+            budget: Maximum encoded size in bytes
             
-            img.save(
-                temp_file.name,
-                'JPEG',
-                quality=self.compression_settings['quality'],
-                optimize=True
-            )
+        Returns:
+            bytes: Best JPEG data found (the smallest attempt if nothing fits)
+        """
+        settings = self.compression_settings
+        min_quality = settings['min_quality']
+        smallest = None
+        
+        while True:
+            low, high = min_quality, settings['quality']
+            best = None
+            while low <= high:
+                quality = (low + high) // 2
+                data = self._encode_jpeg(img, quality)
+                if len(data) <= budget:
+                    best, low = data, quality + 1
+                else:
+                    high = quality - 1
+                if smallest is None or len(data) < len(smallest):
+                    smallest = data
             
-            temp_file.close()
-            self.temp_images.append(temp_file.name)
+            if best is not None:
+                return best
             
-            return temp_file.name
+            new_size = (int(img.width * 0.8), int(img.height * 0.8))
+            if new_size[0] < settings['min_width'] or new_size[1] < 1:
+                return smallest
+            img = img.resize(new_size, PILImage.Resampling.LANCZOS)
+    
+    @staticmethod
+    def _fit_size(size: Tuple[int, int], max_w: int, max_h: int) -> Tuple[int, int]:
+        """
+        Calculate the size an image will have after thumbnail().
+        
+        Args:
+            size: Original (width, height)
+            max_w: Maximum width
+            max_h: Maximum height
             
-        except Exception as e:
-            print(f"Error compressing image {image_path}: {e}")
-            return image_path  # Return original if compression fails
+        Returns:
+            Tuple[int, int]: Final (width, height), never upscaled
+        """
+        width, height = size
+        scale = min(max_w / width, max_h / height, 1.0)
+        return max(1, int(width * scale)), max(1, int(height * scale))
+    
+    @staticmethod
+    def _content_hash(image_path: str) -> Optional[str]:
+        """
+        Hash an image file's bytes.
+        
+        Args:
+            image_path: Path to image
+            
+        Returns:
+            str: Hex digest, or None if the file cannot be read
+        """
+        digest = hashlib.sha1()
+        try:
+            with open(image_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    def _get_image_aliases(self) -> Dict[str, str]:
+        """
+        Map every report image to the first image with identical content.
+        
+        The same photo is often attached to several activities, sometimes
+        from different folders. Only files with the same size can be equal,
+        so just those are hashed.
+        
+        Returns:
+            Dict[str, str]: Image path -> representative path, in report order
+        """
+        if self.image_aliases is not None:
+            return self.image_aliases
+        
+        by_size: Dict[Optional[int], List[str]] = {}
+        for activity in self.report.activities:
+            for image_path in activity.images:
+                try:
+                    size = os.path.getsize(image_path)
+                except OSError:
+                    size = None
+                paths = by_size.setdefault(size, [])
+                if image_path not in paths:
+                    paths.append(image_path)
+        
+        aliases = {}
+        for size, paths in by_size.items():
+            if size is None or len(paths) == 1:
+                aliases.update((path, path) for path in paths)
+                continue
+            first_by_hash: Dict[str, str] = {}
+            for path in paths:
+                digest = self._content_hash(path)
+                aliases[path] = first_by_hash.setdefault(digest, path) if digest else path
+        
+        # Keep report order for deterministic compression and events
+        self.image_aliases = {
+            path: aliases[path]
+            for activity in self.report.activities
+            for path in activity.images
+        }
+        return self.image_aliases
+    
+    def _images_to_compress(self) -> List[str]:
+        """
+        Get the images this generation has to compress.
+        
+        Identical images are compressed once, so only representative paths
+        are listed. In incremental mode activities whose section comes from
+        the render cache already hold their images, so only the others are.
+        
+        Returns:
+            List[str]: Image paths, in report order
+        """
+        aliases = self._get_image_aliases()
+        needed = self._take_rendered_sections() if self.render_cache is not None else None
+        return [
+            path for path, original in aliases.items()
+            if path == original and path not in self.compressed_images
+            and (needed is None or path in needed)
+        ]
+    
+    def _compress_all_images(self):
+        """
+        Compress every image in the report before the story is built.
+        
+        PIL releases the GIL while decoding, resizing and encoding, so a
+        thread pool compresses the images concurrently. Identical images are
+        compressed once and share the result. Results are stored by original
+        path in report order, so the output is deterministic.
+        """
+        aliases = self._get_image_aliases()
+        try:
+            self._compress_paths(self._images_to_compress())
+        finally:
+            # Duplicates point at their original's compressed image
+            for path, original in aliases.items():
+                if original in self.compressed_images:
+                    self.compressed_images[path] = self.compressed_images[original]
+    
+    def _take_rendered_sections(self) -> Set[str]:
+        """
+        Take the sections of unchanged activities out of the render cache.
+        
+        Emits an "activity" event per activity with "cached" telling whether
+        its section was reused.
+        
+        Returns:
+            Set[str]: Images (representative paths) of the activities that
+            still have to be rendered
+        """
+        aliases = self._get_image_aliases()
+        settings = self._image_settings()
+        needed = set()
+        self.section_keys = []
+        for index, activity in enumerate(self.report.activities):
+            key = self.render_cache.make_key(activity, settings)
+            section = None
+            if key and key not in self.rendered_sections:
+                section = self.render_cache.take(key)
+                if section is not None:
+                    self.rendered_sections[key] = (section, self._section_files(section))
+            if section is None:
+                needed.update(aliases.get(path, path) for path in activity.images)
+            self.section_keys.append(key)
+            self._emit_event({
+                'event': 'activity',
+                'index': index,
+                'cached': section is not None,
+                'images': len(activity.images)
+            })
+        return needed
+    
+    def _return_rendered_sections(self):
+        """Put the sections used by this generation (back) into the render cache."""
+        for key, (section, files) in self.rendered_sections.items():
+            for flowable in section:
+                # Layout state of this build (the frame also references the document)
+                for attr in self.LAYOUT_STATE_ATTRS:
+                    flowable.__dict__.pop(attr, None)
+            self.render_cache.put(key, section, files)
+        self.rendered_sections.clear()
+    
+    @staticmethod
+    def _section_files(section: List) -> List[str]:
+        """Get the image files drawn by a section's image grids."""
+        return [
+            cell.filename
+            for flowable in section if isinstance(flowable, Table)
+            for row in flowable._cellvalues
+            for cell in row
+            if isinstance(cell, RLImage) and isinstance(cell._file, str)
+        ]
+    
+    def _prepare_streamed_images(self):
+        """
+        Plan image compression for streaming mode.
+        
+        Instead of compressing everything before the build, each activity's
+        images are compressed when its section is created and dropped from
+        compressed_images after the last activity using them, so only a few
+        activities' compressed images are held at a time.
+        """
+        aliases = self._get_image_aliases()
+        self._pending_images = set(self._images_to_compress())
+        self._image_progress = (0, len(self._pending_images))
+        self._image_last_use = {
+            aliases.get(path, path): index
+            for index, activity in enumerate(self.report.activities)
+            for path in activity.images
+        }
+    
+    def _compress_activity_images(self, activity: Activity):
+        """Compress the images of an activity not compressed yet (streaming mode)."""
+        aliases = self.image_aliases or {}
+        image_paths = [
+            path for path in dict.fromkeys(aliases.get(image, image) for image in activity.images)
+            if path in self._pending_images
+        ]
+        self._pending_images.difference_update(image_paths)
+        done, total = self._image_progress
+        self._compress_paths(image_paths, done, total)
+        self._image_progress = (done + len(image_paths), total)
+    
+    def _release_activity_images(self, activity: Activity, index: int):
+        """
+        Drop the compressed images no later activity uses (streaming mode).
+        
+        The section's image flowables keep what they need until ReportLab
+        has drawn them; temporary files are only deleted after the build.
+        """
+        aliases = self.image_aliases or {}
+        for image in activity.images:
+            path = aliases.get(image, image)
+            if self._image_last_use.get(path) == index:
+                self.compressed_images.pop(path, None)
+    
+    def _compress_paths(self, image_paths: List[str], done_before: int = 0, total: Optional[int] = None):
+        """
+        Compress images into compressed_images, in parallel when configured.
+        
+        Args:
+            image_paths: Unique image paths, in report order
+            done_before: Images already compressed by earlier calls (for progress)
+            total: Images to compress over all calls (defaults to len(image_paths))
+        """
+        if not image_paths:
+            return
+        
+        if total is None:
+            total = len(image_paths)
+        
+        if self.max_workers == 1 or len(image_paths) == 1:
+            for done, path in enumerate(image_paths, done_before + 1):
+                self._check_cancelled()
+                self.compressed_images[path], stats = self._compress_image_with_stats(path)
+                self._emit_event(stats)
+                self._report_progress('image', done, total)
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._compress_image_with_stats, path) for path in image_paths]
+            try:
+                # Events are emitted here, on the calling thread, in report order
+                for done, (path, future) in enumerate(zip(image_paths, futures), done_before + 1):
+                    self.compressed_images[path], stats = future.result()
+                    self._emit_event(stats)
+                    self._report_progress('image', done, total)
+                    self._check_cancelled()
+            except GenerationCancelled:
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def _report_progress(self, stage: str, done: int, total: int):
+        """Notify the progress callback and event stream."""
+        if self.progress_callback:
+            self.progress_callback(stage, done, total)
+        self._emit_event({'event': 'progress', 'stage': stage, 'done': done, 'total': total})
+    
+    def _emit_event(self, event: Dict[str, Any]):
+        """Send an instrumentation event to the event callback, if any."""
+        if self.event_callback:
+            self.event_callback(event)
+    
+    def _emit_phase(self, phase: str, seconds: float):
+        """Send a "phase" timing event."""
+        self._emit_event({'event': 'phase', 'phase': phase, 'seconds': seconds})
+    
+    def _timed_sections(self, sections: Iterable[List]) -> Iterator[List]:
+        """Yield sections while accumulating the time spent creating them."""
+        iterator = iter(sections)
+        while True:
+            started = time.perf_counter()
+            section = next(iterator, None)
+            self._story_seconds += time.perf_counter() - started
+            if section is None:
+                return
+            yield section
+    
+    def _check_cancelled(self):
+        """Raise GenerationCancelled if cancellation was requested."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise GenerationCancelled()
     
     def _create_image_grid(self, images: List[str], max_width: float) -> List:
         """
@@ -254,8 +826,16 @@ class PDFGenerator:
         
         elements = []
         
-        # Compress images
-        compressed_images = [self._compress_image(img) for img in images]
+        # Use images compressed up front, compress any missing one now.
+        # Copies of the same photo share one compressed image, so ReportLab
+        # embeds it once and references it from every grid.
+        aliases = self.image_aliases or {}
+        compressed_images = []
+        for img in images:
+            original = aliases.get(img, img)
+            if original not in self.compressed_images:
+                self.compressed_images[original] = self._compress_image(original)
+            compressed_images.append(self.compressed_images[original])
         
         # Calculate image size for 3-column grid
         # Account for spacing between images
@@ -270,10 +850,16 @@ class PDFGenerator:
             row_images = compressed_images[i:i+3]
             row = []
             
-            for img_path in row_images:
+            for img_path, img_source in zip(images[i:i+3], row_images):
                 try:
-                    # Create Image object
-                    img = RLImage(img_path, width=img_width, height=img_height)
+                    # Create Image object (in-memory data gets its own buffer)
+                    if isinstance(img_source, bytes):
+                        img_source = io.BytesIO(img_source)
+                    elif self.render_cache is not None and img_source in self.temp_images:
+                        # Cached sections outlive temporary files
+                        with open(img_source, 'rb') as f:
+                            img_source = io.BytesIO(f.read())
+                    img = RLImage(img_source, width=img_width, height=img_height)
                     row.append(img)
                 except Exception as e:
                     print(f"Error loading image {img_path}: {e}")
@@ -332,6 +918,9 @@ class PDFGenerator:
         """
         Create PDF elements for a single activity - Minimalist version.
         
+        In incremental mode everything below the numbered title comes from
+        the render cache when the activity is unchanged.
+        
         Args:
             activity: Activity object
             activity_num: Activity number (for display)
@@ -348,6 +937,34 @@ class PDFGenerator:
         )
         elements.append(activity_title)
         
+        # A section is laid out once per document; repeated activities get their own
+        index = activity_num - 1
+        key = self.section_keys[index] if index < len(self.section_keys) else None
+        body = None
+        if key and key not in self._used_sections and key in self.rendered_sections:
+            body = self.rendered_sections[key][0]
+        if body is None:
+            body = self._create_activity_body(activity)
+            if key and key not in self.rendered_sections:
+                self.rendered_sections[key] = (body, self._section_files(body))
+        if key:
+            self._used_sections.add(key)
+        
+        elements.extend(body)
+        return elements
+    
+    def _create_activity_body(self, activity: Activity) -> List:
+        """
+        Create the PDF elements of an activity below its title.
+        
+        Args:
+            activity: Activity object
+            
+        Returns:
+            List of PDF elements
+        """
+        elements = []
+        
         # Time and duration in one line
         time_info = Paragraph(
             f"⏰ <b>{activity.start_time} - {activity.end_time}</b> ({activity.duration})",
@@ -412,22 +1029,91 @@ class PDFGenerator:
         
         return elements
     
+    def warm_cache(self) -> Tuple[bool, str]:
+        """
+        Compress the report's images into the image cache without building a PDF.
+        
+        Run it in the background after a report is loaded or edited; a later
+        generate() with the same settings then only does layout work.
+        In incremental mode the activity sections are also rendered into the
+        render cache. Progress, image events and cancellation work as in
+        generate().
+        
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        if not self.image_cache and self.render_cache is None:
+            return False, "Image cache is disabled"
+        
+        try:
+            self._compress_all_images()
+            if self.render_cache is not None:
+                for index, activity in enumerate(self.report.activities):
+                    self._check_cancelled()
+                    key = self.section_keys[index]
+                    if key and key not in self.rendered_sections:
+                        body = self._create_activity_body(activity)
+                        self.rendered_sections[key] = (body, self._section_files(body))
+                self._return_rendered_sections()
+            return True, f"{len(self.compressed_images)} images cached"
+        except GenerationCancelled:
+            return False, "Cache warming cancelled"
+        finally:
+            self._cleanup_temp_images()
+    
     def generate(self, output_path: str) -> Tuple[bool, str]:
         """
         Generate the PDF report.
         
+        When an event_callback is set it receives dicts with an "event" key:
+        - "phase": {"phase", "seconds"} for validation, compression, story
+          (creating flowables) and build (ReportLab layout and writing); in
+          streaming mode images are compressed during the story phase
+        - "image": {"path", "source" (encoded/cache/original), "bytes_in",
+          "bytes_out", "decode_seconds", "resize_seconds", "encode_seconds"}
+          plus "error" if compression failed
+        - "activity": {"index", "cached", "images"} in incremental mode, telling
+          whether the activity's section came from the render cache
+        - "progress": {"stage", "done", "total"}
+        - "finished": {"success", "message", "seconds", "output_bytes"}
+        
         Args:
             output_path: Path where to save the PDF
             
         Returns:
             Tuple[bool, str]: (success, message)
         """
+        started = time.perf_counter()
+        success, message = self._generate(output_path)
+        
+        output_bytes = os.path.getsize(output_path) if success and os.path.exists(output_path) else 0
+        self._emit_event({
+            'event': 'finished',
+            'success': success,
+            'message': message,
+            'seconds': time.perf_counter() - started,
+            'output_bytes': output_bytes
+        })
+        return success, message
+    
+    def _generate(self, output_path: str) -> Tuple[bool, str]:
+        """Run the generation phases (see generate())."""
         try:
             # Validate report
+            phase_start = time.perf_counter()
             valid, message = self.report.complete_validate()
+            self._emit_phase('validation', time.perf_counter() - phase_start)
             if not valid:
                 return False, f"Invalid report: {message}"
             
+            # Compress all images concurrently (streaming mode: per activity, during the build)
+            phase_start = time.perf_counter()
+            if self.streaming:
+                self._prepare_streamed_images()
+            else:
+                self._compress_all_images()
+            self._emit_phase('compression', time.perf_counter() - phase_start)
+            
             # Create PDF document
             doc = SimpleDocTemplate(
                 output_path,
@@ -439,67 +1125,95 @@ class PDFGenerator:
             )
             
             # Build content
-            story = []
-            
-            # Title
-            title = Paragraph(
-                "Reporte Diario",
-                self.styles['CustomTitle']
-            )
-            story.append(title)
-            
-            # Subtitle with generation date
-            subtitle = Paragraph(
-                f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
-                self.styles['CustomSubtitle']
-            )
-            story.append(subtitle)
-            story.append(Spacer(1, 0.3 * inch))
-            
-            # General Information section
-            section_header = Paragraph(
-                "Informacion general",
-                self.styles['SectionHeader']
-            )
-            story.append(section_header)
-            story.append(Spacer(1, 0.1 * inch))
-            general_info_elements = self._create_general_info_simple()
-            story.extend(general_info_elements)
-            story.append(Spacer(1, 0.25 * inch))
-            
-            # Activities section
-            activities_header = Paragraph(
-                f"Actividades ({self.report.get_activity_count()})",
-                self.styles['SectionHeader']
-            )
-            story.append(activities_header)
-            story.append(Spacer(1, 0.15 * inch))
-            
-            # Add each activity
-            for i in range(self.report.get_activity_count()):
-                activity = self.report.get_activity(i)
-                if activity:
-                    activity_elements = self._create_activity_section(activity, i + 1)
-                    story.extend(activity_elements)
-            
-            
-            # Signature section (optional)
-            if self.include_signatures:
-                signature_elements = self._create_signature_section()
-                story.extend(signature_elements)
+            self._story_seconds = 0.0
+            sections = self._timed_sections(self._iter_story())
+            if self.streaming:
+                story = _FlowableStream(sections)
+            else:
+                story = [flowable for section in sections for flowable in section]
             
-            # Build PDF
+            # Build PDF (in streaming mode sections are created during the build)
+            phase_start = time.perf_counter()
+            story_before_build = self._story_seconds
             doc.build(story, onFirstPage=self._add_header_footer, onLaterPages=self._add_header_footer)
+            build_seconds = time.perf_counter() - phase_start
+            build_seconds -= self._story_seconds - story_before_build
+            self._emit_phase('story', self._story_seconds)
+            self._emit_phase('build', build_seconds)
+            
+            if self.render_cache is not None:
+                self._return_rendered_sections()
             
             # Cleanup temporary images
             self._cleanup_temp_images()
             
             return True, f"PDF generated successfully: {output_path}"
             
+        except GenerationCancelled:
+            self._cleanup_temp_images()
+            return False, "PDF generation cancelled"
+            
         except Exception as e:
             self._cleanup_temp_images()
             return False, f"Error generating PDF: {str(e)}"
     
+    def _iter_story(self) -> Iterator[List]:
+        """
+        Yield the report content section by section.
+        
+        Activity sections are only created when requested, so in streaming
+        mode the story never exists as a whole. In that mode each activity's
+        images are also compressed just before its section and released
+        after it.
+        
+        Yields:
+            List of PDF elements for each section
+        """
+        # Title and subtitle with generation date
+        yield [
+            Paragraph("Reporte Diario", self.styles['CustomTitle']),
+            Paragraph(
+                f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
+                self.styles['CustomSubtitle']
+            ),
+            Spacer(1, 0.3 * inch)
+        ]
+        
+        # General Information section
+        elements = [
+            Paragraph("Informacion general", self.styles['SectionHeader']),
+            Spacer(1, 0.1 * inch)
+        ]
+        elements.extend(self._create_general_info_simple())
+        elements.append(Spacer(1, 0.25 * inch))
+        yield elements
+        
+        # Activities section
+        yield [
+            Paragraph(
+                f"Actividades ({self.report.get_activity_count()})",
+                self.styles['SectionHeader']
+            ),
+            Spacer(1, 0.15 * inch)
+        ]
+        
+        # Add each activity
+        total = self.report.get_activity_count()
+        for i in range(total):
+            self._check_cancelled()
+            activity = self.report.get_activity(i)
+            if activity:
+                if self.streaming:
+                    self._compress_activity_images(activity)
+                yield self._create_activity_section(activity, i + 1)
+                if self.streaming:
+                    self._release_activity_images(activity, i)
+            self._report_progress('activity', i + 1, total)
+        
+        # Signature section (optional)
+        if self.include_signatures:
+            yield self._create_signature_section()
+    
     def _cleanup_temp_images(self):
         """Clean up temporary compressed images."""
         for temp_file in self.temp_images:
@@ -509,6 +1223,13 @@ class PDFGenerator:
             except:
                 pass
         self.temp_images.clear()
+        self.compressed_images.clear()
+        self.image_aliases = None
+        self._pending_images.clear()
+        self._image_last_use.clear()
+        self.section_keys = []
+        self.rendered_sections.clear()  # Sections of a failed generation are dropped
+        self._used_sections.clear()
 
 
 # Convenience function
@@ -516,7 +1237,14 @@ def generate_pdf(
     report: Report,
     output_path: str,
     compression_level: str = CompressionLevel.MEDIUM,
-    include_signatures: bool = False
+    include_signatures: bool = False,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    in_memory: bool = False,
+    streaming: bool = False,
+    event_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    target_size_bytes: Optional[int] = None,
+    incremental: bool = False
 ) -> Tuple[bool, str]:
     """
     Generate a PDF report.
@@ -524,11 +1252,23 @@ def generate_pdf(
     Args:
         report: Report object
         output_path: Where to save the PDF
-        compression_level: "low", "medium", or "high"
+        compression_level: "low", "medium", "high" or "target_size"
         include_signatures: Whether to include signature fields
+        max_workers: Threads used to compress images (None = CPU based default, 1 = serial)
+        use_cache: Whether to reuse compressed images from the on-disk cache
+        in_memory: Keep compressed images in memory instead of temporary files
+        streaming: Build activity sections lazily while ReportLab lays out pages
+        event_callback: Receives instrumentation events (see PDFGenerator.generate)
+        target_size_bytes: Total PDF budget for "target_size" (default 100KB)
+        incremental: Reuse sections of activities unchanged since the last generation
         
     Returns:
         Tuple[bool, str]: (success, message)
     """
-    generator = PDFGenerator(report, compression_level, include_signatures)
+    generator = PDFGenerator(
+        report, compression_level, include_signatures,
+        max_workers=max_workers, use_cache=use_cache, in_memory=in_memory,
+        streaming=streaming, event_callback=event_callback,
+        target_size_bytes=target_size_bytes, incremental=incremental
+    )
     return generator.generate(output_path)
\ No newline at end of file
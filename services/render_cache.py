@@ -0,0 +1,140 @@
+"""
+Render cache for Daily Report System
+In-memory cache of rendered activity sections for incremental PDF regeneration
+"""
+
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple, Iterable, Any
+import hashlib
+import json
+import os
+import threading
+
+from models.activity_model import Activity
+
+
+class RenderCache:
+    """
+    Keeps the flowables of recently rendered activity sections in memory.
+
+    Entries are keyed by the activity's content (title, description, times,
+    images with their modification time and size) plus the image settings,
+    so an edit, a replaced photo or another compression level gives a new
+    key. After a small edit, regeneration reuses every unchanged section
+    (parsed paragraphs, image tables with their decoded images) and only
+    builds and compresses the edited ones; the final layout pass still runs
+    over the whole report.
+
+    ReportLab flowables keep layout state while a document is built, so a
+    section is taken out of the cache for the duration of a generation and
+    put back afterwards; two generations never share one. Sections that
+    draw images from files (the image cache) are dropped when a file is gone.
+
+    When more than max_entries sections are cached the least recently used
+    are evicted.
+    """
+
+    DEFAULT_MAX_ENTRIES = 200  # A few reports; decoded images are the bulk
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize render cache.
+
+        Args:
+            max_entries: Maximum number of cached activity sections
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[List, Tuple[str, ...]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(activity: Activity, settings: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the cache key for an activity section.
+
+        Args:
+            activity: Activity to render
+            settings: Image settings used to render it
+
+        Returns:
+            str: Hex digest key, or None if an image cannot be read
+        """
+        images = []
+        for image_path in activity.images:
+            try:
+                stat = os.stat(image_path)
+            except OSError:
+                return None
+            images.append([os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size])
+
+        payload = json.dumps({
+            'title': activity.title,
+            'description': activity.description,
+            'start_time': activity.start_time,
+            'end_time': activity.end_time,
+            'images': images,
+            'settings': settings
+        }, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def take(self, key: str) -> Optional[List]:
+        """
+        Remove a section from the cache and return it.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            List: Section flowables, or None on miss
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        flowables, files = entry
+        if not all(os.path.exists(path) for path in files):
+            return None  # An image file was evicted from the image cache
+        return flowables
+
+    def put(self, key: str, flowables: List, files: Iterable[str] = ()):
+        """
+        Store (or return) a section after a generation.
+
+        Args:
+            key: Cache key from make_key
+            flowables: Section flowables
+            files: Image files the flowables read when drawn
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (flowables, tuple(files))  # Most recently used last
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached sections."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_render_cache: Optional[RenderCache] = None
+_default_render_cache_lock = threading.Lock()
+
+
+def get_default_render_cache() -> RenderCache:
+    """
+    Get the shared application render cache.
+
+    Returns:
+        RenderCache: Process-wide cache
+    """
+    global _default_render_cache
+    with _default_render_cache_lock:
+        if _default_render_cache is None:
+            _default_render_cache = RenderCache()
+        return _default_render_cache
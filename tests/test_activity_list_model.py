@@ -0,0 +1,103 @@
+"""
+Tests for the activity list model.
+Runs Qt's QAbstractItemModelTester over every kind of report change, so
+row insertions, removals, moves and resets follow the item model contract.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtCore import QtMsgType, qInstallMessageHandler
+from PySide6.QtWidgets import QApplication
+from PySide6.QtTest import QAbstractItemModelTester
+
+from models.activity_model import Activity
+from models.report_model import Report
+from ui.activity_list import ActivityListModel
+
+
+class ActivityListModelTest(unittest.TestCase):
+    """The model passes QAbstractItemModelTester for every report change."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.messages = []
+        self.previous_handler = qInstallMessageHandler(self._collect)
+
+        self.report = Report(entry_time="08:00", exit_time="17:00")
+        self.model = ActivityListModel(self.report)
+        self.tester = QAbstractItemModelTester(
+            self.model, QAbstractItemModelTester.FailureReportingMode.Warning
+        )
+
+    def tearDown(self):
+        qInstallMessageHandler(self.previous_handler)
+
+    def _collect(self, msg_type, context, message):
+        if msg_type != QtMsgType.QtDebugMsg:
+            self.messages.append(message)
+
+    def assertNoModelErrors(self):
+        self.assertEqual(self.messages, [])
+
+    def add(self, title: str):
+        success, message = self.report.add_activity(Activity(title, "desc", "08:00", "09:00"))
+        self.assertTrue(success, message)
+
+    def titles(self):
+        return [self.model.index(row).data() for row in range(self.model.rowCount())]
+
+    def test_insert(self):
+        self.add("A")
+        self.add("B")
+        self.assertNoModelErrors()
+        self.assertEqual(self.titles(), ["A", "B"])
+
+    def test_remove(self):
+        for title in "ABC":
+            self.add(title)
+        self.report.remove_activity(1)
+        self.report.remove_activity(0)
+        self.assertNoModelErrors()
+        self.assertEqual(self.titles(), ["C"])
+
+    def test_update(self):
+        self.add("A")
+        self.report.edit_activity(0, Activity("A2", "desc", "08:00", "10:00"))
+        self.assertNoModelErrors()
+        self.assertEqual(self.titles(), ["A2"])
+
+    def test_move(self):
+        for title in "ABCD":
+            self.add(title)
+        self.report.move_activity(0, 3)
+        self.report.move_activity(3, 1)
+        self.report.move_activity(2, 2)  # Stays in place
+        self.assertNoModelErrors()
+        self.assertEqual(self.titles(), ["B", "A", "C", "D"])
+
+    def test_clear(self):
+        for title in "AB":
+            self.add(title)
+        self.report.clear_activities()
+        self.assertNoModelErrors()
+        self.assertEqual(self.titles(), [])
+
+    def test_set_report(self):
+        self.add("A")
+        other = Report(activities=[Activity("X", "desc", "08:00", "09:00")])
+        self.model.set_report(other)
+        self.add("B")  # The old report no longer updates the model
+        self.assertNoModelErrors()
+        self.assertEqual(self.titles(), ["X"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Tests for the activity time index and the report queries built on it.
+"""
+
+import os
+import sys
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.activity_model import Activity
+from models.interval_index import ActivityIntervalIndex
+from models.report_model import Report
+
+
+def titles(activities):
+    return [activity.title for activity in activities]
+
+
+class TimeRangeTest(unittest.TestCase):
+    """find_activities_by_time_range matches start times within the range."""
+
+    def setUp(self):
+        self.report = Report(entry_time="08:00", exit_time="17:00", report_date=date(2025, 3, 10))
+        for title, start, end in [("A", "08:30", "09:30"), ("B", "12:00", "13:00"), ("C", "07:00", "07:45")]:
+            self.report.add_activity(Activity(title, "desc", start, end))
+
+    def find(self, start, end):
+        return titles(self.report.find_activities_by_time_range(start, end))
+
+    def test_whole_day(self):
+        self.assertEqual(self.find("00:00", "23:59"), ["A", "B", "C"])
+
+    def test_range_before_entry(self):
+        self.assertEqual(self.find("07:00", "09:00"), ["A", "C"])
+        self.assertEqual(self.find("06:00", "12:30"), ["A", "B", "C"])
+
+    def test_bounds_included(self):
+        self.assertEqual(self.find("08:30", "12:00"), ["A", "B"])
+        self.assertEqual(self.find("09:00", "11:59"), [])
+
+    def test_single_instant(self):
+        self.assertEqual(self.find("12:00", "12:00"), ["B"])
+
+    def test_range_crossing_midnight(self):
+        self.report.add_activity(Activity("D", "desc", "23:00", "01:00"))
+        self.assertEqual(self.find("22:00", "07:30"), ["C", "D"])
+
+    def test_invalid_shift(self):
+        self.report.entry_time = "8 am"
+        self.assertEqual(self.find("07:00", "09:00"), ["A", "C"])
+
+    def test_invalid_range(self):
+        self.assertEqual(self.find("7:00 am", "09:00"), [])
+
+    def test_night_shift(self):
+        report = Report(entry_time="22:00", exit_time="06:00")
+        for title, start, end in [("N1", "22:30", "23:30"), ("N2", "02:00", "03:00")]:
+            report.add_activity(Activity(title, "desc", start, end))
+        self.assertEqual(titles(report.find_activities_by_time_range("00:00", "03:00")), ["N2"])
+        self.assertEqual(titles(report.find_activities_by_time_range("22:00", "02:00")), ["N1", "N2"])
+
+
+class OutsideHoursTest(unittest.TestCase):
+    """find_activities_outside_hours checks both edges of the shift."""
+
+    def test_day_shift(self):
+        report = Report(entry_time="08:00", exit_time="17:00")
+        for title, start, end in [
+            ("early", "07:00", "07:45"),
+            ("inside", "08:00", "17:00"),
+            ("late", "16:30", "17:30"),
+            ("overnight", "16:00", "01:00")
+        ]:
+            report.add_activity(Activity(title, "desc", start, end))
+        self.assertEqual(titles(report.find_activities_outside_hours()), ["early", "late", "overnight"])
+
+        early = report.get_interval_index().outside_window()[0]
+        self.assertLess(early['start'], early['window_start'])
+        self.assertLess(early['end'], early['window_end'])  # Not a next-day overrun
+
+    def test_night_shift(self):
+        report = Report(entry_time="22:00", exit_time="06:00")
+        for title, start, end in [
+            ("early", "21:00", "22:30"),
+            ("inside", "23:00", "02:00"),
+            ("after midnight", "02:00", "05:00"),
+            ("late", "05:30", "07:00")
+        ]:
+            report.add_activity(Activity(title, "desc", start, end))
+        self.assertEqual(titles(report.find_activities_outside_hours()), ["early", "late"])
+        self.assertEqual(report.find_overlapping_activities(), [])
+
+    def test_invalid_shift(self):
+        report = Report(entry_time="", exit_time="17:00")
+        report.add_activity(Activity("A", "desc", "07:00", "08:00"))
+        self.assertEqual(report.find_activities_outside_hours(), [])
+        self.assertEqual(len(report.get_interval_index()), 1)
+
+
+class IndexQueryTest(unittest.TestCase):
+    """Direct queries on the timeline."""
+
+    def test_starting_between(self):
+        report = Report(entry_time="08:00", exit_time="17:00", report_date=date(2025, 3, 10))
+        for title, start, end in [("A", "08:00", "09:00"), ("B", "09:00", "10:00"), ("C", "10:00", "11:00")]:
+            report.add_activity(Activity(title, "desc", start, end))
+        index = ActivityIntervalIndex.from_report(report)
+        day = date(2025, 3, 10).toordinal() * 24 * 60
+        found = index.starting_between(day + 9 * 60, day + 10 * 60)
+        self.assertEqual([entry['activity'].title for entry in found], ["B", "C"])
+        found = index.overlapping(day + 9 * 60, day + 10 * 60)
+        self.assertEqual([entry['activity'].title for entry in found], ["B"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Tests for the incrementally maintained Report statistics.
+Every way of changing a report's activities must leave get_statistics()
+equal to a full recomputation.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.activity_model import Activity
+from models.report_model import Report
+
+
+class ReportAggregatesTest(unittest.TestCase):
+    """Statistics stay correct after every kind of activity change."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='reportapp_test_')
+        self.images = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f"img{i}.jpg")
+            with open(path, 'wb') as f:
+                f.write(b'\xff\xd8\xff\xd9')
+            self.images.append(path)
+
+        self.report = Report(entry_time="08:00", exit_time="17:00")
+        for title, start, end in [("A", "08:00", "10:00"), ("B", "10:00", "12:00"), ("C", "13:00", "15:00")]:
+            self.report.add_activity(Activity(title, "desc", start, end))
+        self.assertEqual(self.report.get_total_activity_minutes(), 360)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assertAggregatesCorrect(self, minutes=None):
+        valid, message = self.report.check_aggregates()
+        self.assertTrue(valid, message)
+        if minutes is not None:
+            self.assertEqual(self.report.get_total_activity_minutes(), minutes)
+
+    # Changes through the management methods
+
+    def test_management_methods(self):
+        self.report.add_activity(Activity("D", "desc", "15:00", "18:00", [self.images[0]]))
+        self.assertAggregatesCorrect(540)
+        self.report.edit_activity(0, Activity("A2", "desc", "08:00", "09:00"))
+        self.assertAggregatesCorrect(480)
+        self.report.move_activity(0, 3)
+        self.assertAggregatesCorrect(480)
+        self.report.remove_activity(1)
+        self.assertAggregatesCorrect(360)
+        self.report.clear_activities()
+        self.assertAggregatesCorrect(0)
+
+    # Changes to an activity through its own API
+
+    def test_start_time_setter(self):
+        self.report.activities[0].start_time = "07:00"
+        self.assertAggregatesCorrect(420)
+
+    def test_end_time_setter(self):
+        self.report.activities[2].end_time = "18:00"
+        self.assertAggregatesCorrect(540)
+        self.assertEqual(self.report.get_statistics()['longest_activity'], "C")
+
+    def test_add_image(self):
+        success, message = self.report.activities[1].add_image(self.images[0])
+        self.assertTrue(success, message)
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 1)
+        self.assertEqual(self.report.get_statistics()['activities_with_images'], 1)
+
+    def test_delete_image(self):
+        self.report.activities[1].add_image(self.images[0])
+        self.report.activities[1].add_image(self.images[1])
+        self.report.get_statistics()
+        self.report.activities[1].delete_image(0)
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 1)
+
+    def test_delete_image_by_path(self):
+        self.report.activities[1].add_image(self.images[0])
+        self.report.get_statistics()
+        self.report.activities[1].delete_image_by_path(self.images[0])
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 0)
+
+    def test_reorganize_images(self):
+        for path in self.images:
+            self.report.activities[0].add_image(path)
+        self.report.get_statistics()
+        self.report.activities[0].reorganize_images([2, 0, 1])
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 3)
+
+    def test_clean_images(self):
+        for path in self.images:
+            self.report.activities[0].add_image(path)
+        self.report.get_statistics()
+        self.report.activities[0].clean_images()
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 0)
+
+    def test_images_list_changes(self):
+        self.report.activities[0].images.append(self.images[0])
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 1)
+        self.report.activities[1].images = list(self.images)
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 4)
+        del self.report.activities[1].images[0]
+        self.assertAggregatesCorrect()
+        self.assertEqual(self.report.get_total_images_count(), 3)
+
+    # Only the reports holding a changed activity are affected
+
+    def test_other_reports_not_invalidated(self):
+        other = Report(activities=[Activity("X", "desc", "08:00", "09:00")])
+        other.get_statistics()
+        state = other._change_state()
+
+        self.report.activities[0].end_time = "11:00"
+        self.report.activities[1].add_image(self.images[0])
+        Activity("New", "desc", "08:00", "09:00").add_image(self.images[1])
+        self.assertEqual(other._change_state(), state)
+        self.assertAggregatesCorrect(420)
+
+    def test_removed_activity_not_tracked(self):
+        activity = self.report.activities[0]
+        self.report.remove_activity(0)
+        self.report.get_statistics()
+        state = self.report._change_state()
+        activity.end_time = "16:00"
+        self.assertEqual(self.report._change_state(), state)
+        self.assertAggregatesCorrect(240)
+
+    def test_activity_in_two_reports(self):
+        activity = self.report.activities[0]
+        other = Report(activities=[activity])
+        activity.end_time = "09:00"
+        self.assertAggregatesCorrect(300)
+        self.assertEqual(other.get_total_activity_minutes(), 60)
+
+    # Changes to the activity list itself
+
+    def test_replace_item_same_length(self):
+        self.report.activities[0] = Activity("X", "desc", "08:00", "13:00")
+        self.assertAggregatesCorrect(540)
+        self.assertEqual(self.report.get_statistics()['longest_activity'], "X")
+
+    def test_direct_list_methods(self):
+        self.report.activities.append(Activity("D", "desc", "15:00", "16:00"))
+        self.assertAggregatesCorrect(420)
+        self.report.activities.reverse()
+        self.assertAggregatesCorrect(420)
+        del self.report.activities[0]
+        self.assertAggregatesCorrect(360)
+        self.report.activities[0:2] = [Activity("E", "desc", "08:00", "08:30")]
+        self.assertAggregatesCorrect(150)
+
+    def test_replace_list(self):
+        self.report.activities = [Activity("X", "desc", "08:00", "09:00")]
+        self.assertAggregatesCorrect(60)
+
+    def test_change_then_management_method(self):
+        # An outside change followed by an incremental update must not be lost
+        self.report.activities[0].end_time = "11:00"
+        self.report.add_activity(Activity("D", "desc", "15:00", "16:00"))
+        self.assertAggregatesCorrect(480)
+
+    def test_saved_totals(self):
+        self.report.activities[0].end_time = "11:00"
+        self.assertEqual(self.report.to_dict()['statistics']['total_activity_hours'], "07:00")
+
+    # Validation mode
+
+    def test_validate_aggregates_per_report(self):
+        self.report.validate_aggregates = True
+        self.assertFalse(Report().validate_aggregates)
+        self.report.get_statistics()
+        self.report._aggregates['total_minutes'] += 1  # Simulate a missed update
+        with self.assertRaises(ValueError):
+            self.report.get_statistics()
+
+    def test_validate_aggregates_argument(self):
+        report = Report(validate_aggregates=True)
+        self.assertTrue(report.validate_aggregates)
+        report.add_activity(Activity("A", "desc", "08:00", "09:00"))
+        self.assertEqual(report.get_statistics()['total_activity_hours'], "01:00")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests for the SQLite report repository's name matching.
+Student and responsible names match ignoring case and accents.
+"""
+
+import os
+import sys
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.activity_model import Activity
+from models.report_model import Report
+from models.report_repository import ReportRepository, name_key
+
+
+class NameMatchingTest(unittest.TestCase):
+    """Names are matched through name_key."""
+
+    def setUp(self):
+        self.repository = ReportRepository(':memory:')
+        for student, responsible, day in [
+            ("Jose Alvarez", "Maria Nunez", 3),
+            ("JOSÉ ÁLVAREZ", "María Núñez", 4),
+            ("Ana Pérez", "Luis Gómez", 5)
+        ]:
+            report = Report(
+                responsible=responsible, student=student, report_date=date(2025, 3, day),
+                entry_time="08:00", exit_time="17:00",
+                activities=[Activity("Instalación de red", "Cableado del laboratorio", "08:00", "10:00")]
+            )
+            report_id, message = self.repository.add_report(report)
+            self.assertIsNotNone(report_id, message)
+
+    def tearDown(self):
+        self.repository.close()
+
+    def dates(self, results):
+        return [result['date'].day for result in results]
+
+    def test_name_key(self):
+        self.assertEqual(name_key("  José ÁLVAREZ "), "jose alvarez")
+        self.assertEqual(name_key(None), "")
+
+    def test_accented_query_finds_unaccented_name(self):
+        self.assertEqual(self.dates(self.repository.find_reports(student="José Álvarez")), [3, 4])
+        self.assertEqual(self.dates(self.repository.find_reports(responsible="MARÍA NÚÑEZ")), [3, 4])
+
+    def test_unaccented_query_finds_accented_name(self):
+        self.assertEqual(self.dates(self.repository.find_by_student("ana perez")), [5])
+        self.assertEqual(self.dates(self.repository.find_by_responsible("luis gomez")), [5])
+
+    def test_whole_name_only(self):
+        self.assertEqual(self.repository.find_reports(student="Jose"), [])
+
+    def test_search_filters(self):
+        results = self.repository.search_activities("red", student="josé álvarez")
+        self.assertEqual(sorted(result['date'].day for result in results), [3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Tests that the PDF pipeline stays off the startup path.
+Importing the main window must not import ReportLab, PIL or NumPy; they
+are loaded in the background once the window is up.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.startup_benchmark import FORBIDDEN_MODULES
+
+
+class StartupImportsTest(unittest.TestCase):
+    """import ui.main_window loads none of FORBIDDEN_MODULES."""
+
+    def test_main_window_import(self):
+        # A fresh interpreter: this one may have imported them for other tests
+        code = (
+            "import json, sys\n"
+            f"sys.path.insert(0, {PROJECT_ROOT!r})\n"
+            "import ui.main_window\n"
+            f"print(json.dumps([name for name in {FORBIDDEN_MODULES!r} if name in sys.modules]))\n"
+        )
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, env=env, timeout=120
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(json.loads(result.stdout.strip().splitlines()[-1]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,11 @@
 from PySide6.QtWidgets import ( QTextEdit, QTimeEdit, QPushButton, QScrollArea, QWidget,
     QGridLayout, QFrame, QMessageBox, QFileDialog, QVBoxLayout,QLabel,QDialog, QLineEdit, QHBoxLayout
 )
-from PySide6.QtCore import Qt, QTime, Signal
-from PySide6.QtGui import QPixmap, QIcon 
+from PySide6.QtCore import Qt, QTime, QSize, Signal
+from PySide6.QtGui import QPixmap, QIcon
 from models.activity_model import Activity
 from ui.styles import AppStyles
+from ui.thumbnail_loader import ThumbnailLoader
 from typing import Optional, List
 
 import os
@@ -15,6 +16,9 @@ class ImagePreviewWidget(QWidget):
     """Widget to display image preview with delete button."""
     
     remove_requested = Signal(int)  # Emits index when delete is clicked
+    move_requested = Signal(int, int)  # Emits (index, new index) when a move arrow is clicked
+    
+    THUMBNAIL_SIZE = 116
     
     def __init__(self, image_path: str, index: int, parent=None):
         super().__init__(parent)
@@ -30,48 +34,52 @@ class ImagePreviewWidget(QWidget):
         
         # Image container
         image_frame = QFrame()
-        image_frame.setProperty("card", True)
+        image_frame.setProperty("thumbnail", True)
         image_frame.setFixedSize(120, 120)
-        image_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {AppStyles.COLORS['bg_tertiary']};
-                border: 2px solid {AppStyles.COLORS['border']};
-                border-radius: {AppStyles.RADIUS['md']};
-            }}
-        """)
         
         image_layout = QVBoxLayout(image_frame)
         image_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Image label
-        image_label = QLabel()
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Image label (placeholder until the thumbnail is decoded in background)
+        self.image_label = QLabel("Loading...")
+        self.image_label.setProperty("caption", True)
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        try:
-            pixmap = QPixmap(self.image_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(
-                    116, 116,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                image_label.setPixmap(scaled_pixmap)
-            else:
-                image_label.setText("Invalid\nImage")
-                image_label.setProperty("caption", True)
-        except Exception as e:
-            image_label.setText("Error\nLoading")
-            image_label.setProperty("caption", True)
-        
-        image_layout.addWidget(image_label)
+        loader = ThumbnailLoader.instance()
+        pixmap = loader.thumbnail(self.image_path, QSize(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE))
+        if pixmap:
+            self.image_label.setPixmap(pixmap)
+        else:
+            loader.thumbnail_ready.connect(self.on_thumbnail_ready)
+        
+        image_layout.addWidget(self.image_label)
         layout.addWidget(image_frame)
         
-        # Delete button
+        # Move and delete buttons
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(4)
+        
+        move_left_btn = QPushButton("◀")
+        move_left_btn.setProperty("variant", "secondary")
+        move_left_btn.setFixedSize(28, 28)
+        move_left_btn.setToolTip("Move left")
+        move_left_btn.clicked.connect(lambda: self.move_requested.emit(self.index, self.index - 1))
+        buttons_layout.addWidget(move_left_btn)
+        
         delete_btn = QPushButton("✕ Remove")
         delete_btn.setProperty("variant", "danger")
         delete_btn.setFixedHeight(28)
         delete_btn.clicked.connect(lambda: self.remove_requested.emit(self.index))
-        layout.addWidget(delete_btn)
+        buttons_layout.addWidget(delete_btn)
+        
+        move_right_btn = QPushButton("▶")
+        move_right_btn.setProperty("variant", "secondary")
+        move_right_btn.setFixedSize(28, 28)
+        move_right_btn.setToolTip("Move right")
+        move_right_btn.clicked.connect(lambda: self.move_requested.emit(self.index, self.index + 1))
+        buttons_layout.addWidget(move_right_btn)
+        
+        layout.addLayout(buttons_layout)
         
         # Filename label
         filename = os.path.basename(self.image_path)
@@ -82,6 +90,17 @@ class ImagePreviewWidget(QWidget):
         filename_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         filename_label.setWordWrap(True)
         layout.addWidget(filename_label)
+    
+    def on_thumbnail_ready(self, image_path: str, pixmap: QPixmap):
+        """Show the thumbnail once the background loader has decoded it."""
+        if image_path != self.image_path:
+            return
+        ThumbnailLoader.instance().thumbnail_ready.disconnect(self.on_thumbnail_ready)
+        
+        if pixmap.isNull():
+            self.image_label.setText("Invalid\nImage")
+            return
+        self.image_label.setPixmap(pixmap)
 
 
 class ActivityDialog(QDialog):
@@ -216,16 +235,7 @@ class ActivityDialog(QDialog):
         duration_layout.addWidget(duration_label)
         
         self.duration_display = QLabel("03:00")
-        self.duration_display.setStyleSheet(f"""
-            QLabel {{
-                background-color: {AppStyles.COLORS['bg_tertiary']};
-                padding: 10px 12px;
-                border-radius: {AppStyles.RADIUS['md']};
-                font-size: {AppStyles.FONTS['size_lg']};
-                font-weight: 600;
-                color: {AppStyles.COLORS['primary']};
-            }}
-        """)
+        self.duration_display.setProperty("metric", True)
         duration_layout.addWidget(self.duration_display)
         
         time_layout.addWidget(duration_container, 1)
@@ -298,7 +308,13 @@ class ActivityDialog(QDialog):
     
     def apply_styles(self):
         """Apply stylesheet to dialog."""
-        self.setStyleSheet(AppStyles.get_main_stylesheet())
+        stylesheet = AppStyles.get_main_stylesheet()
+        
+        # Dialogs opened from the main window already inherit its stylesheet
+        parent = self.parentWidget()
+        if parent and parent.window().styleSheet() == stylesheet:
+            return
+        self.setStyleSheet(stylesheet)
     
     def load_activity_data(self):
         """Load existing activity data into form fields."""
@@ -376,40 +392,88 @@ class ActivityDialog(QDialog):
                     )
                     continue
                 
-                self.image_paths.append(file)
-            
-            self.refresh_image_grid()
+                self.insert_image(len(self.image_paths), file)
     
     def remove_image(self, index: int):
         """Remove image at index."""
         if 0 <= index < len(self.image_paths):
             self.image_paths.pop(index)
-            self.refresh_image_grid()
+            widget = self.image_widgets.pop(index)
+            self.images_grid.removeWidget(widget)
+            widget.deleteLater()
+            self._place_image_widgets(index)
+            self.update_image_count()
+    
+    def insert_image(self, index: int, image_path: str):
+        """
+        Insert an image preview without rebuilding the grid.
+        
+        Args:
+            index: Position in the image list
+            image_path: Path to image
+        """
+        widget = ImagePreviewWidget(image_path, index)
+        widget.remove_requested.connect(self.remove_image)
+        widget.move_requested.connect(self.move_image)
+        
+        self.image_paths.insert(index, image_path)
+        self.image_widgets.insert(index, widget)
+        self._place_image_widgets(index)
+        self.update_image_count()
+    
+    def move_image(self, index: int, new_index: int):
+        """
+        Move an image to another position, keeping its preview widget.
+        
+        Args:
+            index: Current position
+            new_index: Target position
+        """
+        if not (0 <= index < len(self.image_paths) and 0 <= new_index < len(self.image_paths)):
+            return
+        if index == new_index:
+            return
+        
+        self.image_paths.insert(new_index, self.image_paths.pop(index))
+        self.image_widgets.insert(new_index, self.image_widgets.pop(index))
+        self._place_image_widgets(min(index, new_index), max(index, new_index) + 1)
+    
+    def _place_image_widgets(self, start: int = 0, end: Optional[int] = None):
+        """
+        Re-position preview widgets whose index changed (3 per row).
+        
+        Args:
+            start: First index to place
+            end: Index after the last one to place (None = to the end)
+        """
+        end = len(self.image_widgets) if end is None else end
+        for i in range(start, end):
+            widget = self.image_widgets[i]
+            widget.index = i
+            self.images_grid.removeWidget(widget)
+            self.images_grid.addWidget(widget, i // 3, i % 3)
+    
+    def update_image_count(self):
+        """Update the image count label."""
+        self.image_count_label.setText(f"{len(self.image_paths)}/{Activity.MAX_IMAGES}")
     
     def refresh_image_grid(self):
-        """Refresh the image preview grid."""
+        """Rebuild the image preview grid from image_paths."""
         # Clear existing widgets
         for widget in self.image_widgets:
+            self.images_grid.removeWidget(widget)
             widget.deleteLater()
         self.image_widgets.clear()
         
         # Add image previews (3 per row)
-        row = 0
-        col = 0
         for i, image_path in enumerate(self.image_paths):
             widget = ImagePreviewWidget(image_path, i)
             widget.remove_requested.connect(self.remove_image)
-            
-            self.images_grid.addWidget(widget, row, col)
+            widget.move_requested.connect(self.move_image)
             self.image_widgets.append(widget)
-            
-            col += 1
-            if col >= 3:
-                col = 0
-                row += 1
         
-        # Update count label
-        self.image_count_label.setText(f"{len(self.image_paths)}/{Activity.MAX_IMAGES}")
+        self._place_image_widgets()
+        self.update_image_count()
     
     def validate_form(self) -> tuple[bool, str]:
         """Validate form data."""
@@ -0,0 +1,307 @@
+"""
+Activity list for Daily Report System.
+Model/view list of report activities painted by a delegate, so rows are
+cheap to create, scroll and update one at a time.
+"""
+
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem, QListView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from models.activity_model import Activity
+from models.report_model import Report
+from ui.styles import AppStyles
+from typing import Optional, Any, Dict, Tuple
+
+
+class ActivityListModel(QAbstractListModel):
+    """
+    List model over a report's activities (one row per activity).
+
+    The model listens to the report's change notifications and updates
+    only the affected rows.
+    """
+
+    ActivityRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, report: Optional[Report] = None, parent=None):
+        super().__init__(parent)
+        self.report: Optional[Report] = None
+        self._pending_change: Optional[str] = None  # Change begun by an "about to" notification
+        self.set_report(report)
+
+    def set_report(self, report: Optional[Report]):
+        """
+        Show another report (or reload the current one).
+
+        Args:
+            report: Report whose activities are listed
+        """
+        self.beginResetModel()
+        if self.report:
+            self.report.remove_listener(self.on_report_changed)
+        self.report = report
+        if self.report:
+            self.report.add_listener(self.on_report_changed, about_to=True)
+        self._pending_change = None
+        self.endResetModel()
+
+    def on_report_changed(self, event: Dict[str, Any]):
+        """
+        Apply a Report change notification to the affected row.
+
+        Qt requires begin* before the rows change and end* after, so the
+        "about to" notification begins the change and the one sent after
+        the change ends it.
+        """
+        change = event['change']
+        if change == 'about_to_insert':
+            self.beginInsertRows(QModelIndex(), event['index'], event['index'])
+            self._pending_change = 'inserted'
+        elif change == 'about_to_remove':
+            self.beginRemoveRows(QModelIndex(), event['index'], event['index'])
+            self._pending_change = 'removed'
+        elif change == 'about_to_move':
+            if self._begin_move(event['index'], event['to_index']):
+                self._pending_change = 'moved'
+        elif change == 'about_to_reset':
+            self.beginResetModel()
+            self._pending_change = 'reset'
+        elif change == 'updated':
+            index = self.index(event['index'])
+            self.dataChanged.emit(index, index)
+        elif change == self._pending_change:
+            self._pending_change = None
+            if change == 'inserted':
+                self.endInsertRows()
+            elif change == 'removed':
+                self.endRemoveRows()
+            elif change == 'moved':
+                self.endMoveRows()
+            else:
+                self.endResetModel()
+        elif change != 'moved':  # A move to the same row changes nothing
+            self.beginResetModel()  # Change without a matching "about to"
+            self.endResetModel()
+
+    def _begin_move(self, from_row: int, to_row: int) -> bool:
+        """Begin moving the row at from_row to to_row (False if it stays in place)."""
+        # Qt's destination is the row the item is inserted before, before removal
+        destination = to_row + 1 if to_row > from_row else to_row
+        return self.beginMoveRows(QModelIndex(), from_row, from_row, QModelIndex(), destination)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid() or not self.report:
+            return 0
+        return self.report.get_activity_count()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not self.report:
+            return None
+
+        activity = self.report.get_activity(index.row())
+        if not activity:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return activity.title
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return activity.description
+        if role == self.ActivityRole:
+            return activity
+        return None
+
+
+class ActivityItemDelegate(QStyledItemDelegate):
+    """
+    Paints activity rows as cards with edit and delete buttons.
+
+    Colors are read from AppStyles.COLORS at paint time, so a theme change
+    only needs a repaint of the view.
+    """
+
+    edit_requested = Signal(int)
+    delete_requested = Signal(int)
+
+    CARD_MARGIN = 6        # Vertical gap between cards
+    PADDING = 16
+    SPACING = 10
+    BUTTON_SIZE = QSize(100, 40)
+    BADGE_HEIGHT = 25
+    DESCRIPTION_PREVIEW = 100  # Characters
+    DESCRIPTION_LINES = 2
+
+    @staticmethod
+    def _font(base: QFont, size: str, bold: bool = False) -> QFont:
+        """Build a font with a pixel size from AppStyles.FONTS ("14px")."""
+        font = QFont(base)
+        font.setPixelSize(int(size.rstrip('px')))
+        font.setWeight(QFont.Weight.DemiBold if bold else QFont.Weight.Normal)
+        return font
+
+    def _fonts(self, base: QFont) -> Tuple[QFont, QFont, QFont, QFont]:
+        """Get (title, badge, description, meta) fonts."""
+        f = AppStyles.FONTS
+        return (
+            self._font(base, f['size_xl'], bold=True),
+            self._font(base, f['size_base'], bold=True),
+            self._font(base, f['size_base']),
+            self._font(base, f['size_sm'])
+        )
+
+    def _layout(self, rect: QRect, has_description: bool, base: QFont) -> dict:
+        """
+        Compute the rectangles of a row.
+
+        Args:
+            rect: Row rectangle
+            has_description: Whether the description block is shown
+            base: View font
+
+        Returns:
+            dict: Rectangles for card, title, description, meta, edit and delete
+        """
+        title_font, _, desc_font, meta_font = self._fonts(base)
+        card = rect.adjusted(0, self.CARD_MARGIN, 0, -self.CARD_MARGIN)
+        content = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        button_w, button_h = self.BUTTON_SIZE.width(), self.BUTTON_SIZE.height()
+        button_y = content.top() + (content.height() - button_h) // 2
+        delete_rect = QRect(content.right() - button_w + 1, button_y, button_w, button_h)
+        edit_rect = QRect(delete_rect.left() - self.SPACING - button_w, button_y, button_w, button_h)
+
+        info_width = edit_rect.left() - self.PADDING - content.left()
+        y = content.top()
+        title_h = max(QFontMetrics(title_font).height(), 30)
+        title_rect = QRect(content.left(), y, info_width, title_h)
+        y += title_h + self.SPACING
+
+        desc_rect = QRect()
+        if has_description:
+            desc_h = QFontMetrics(desc_font).lineSpacing() * self.DESCRIPTION_LINES
+            desc_rect = QRect(content.left(), y, info_width, desc_h)
+            y += desc_h + self.SPACING
+
+        meta_rect = QRect(content.left(), y, info_width, QFontMetrics(meta_font).height())
+
+        return {
+            'card': card,
+            'title': title_rect,
+            'description': desc_rect,
+            'meta': meta_rect,
+            'edit': edit_rect,
+            'delete': delete_rect
+        }
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        activity: Activity = index.data(ActivityListModel.ActivityRole)
+        rects = self._layout(QRect(0, 0, max(option.rect.width(), 600), 1000),
+                             bool(activity and activity.description), option.font)
+        height = rects['meta'].bottom() + 1 + self.PADDING + self.CARD_MARGIN
+        return QSize(rects['card'].width(), height)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        activity: Activity = index.data(ActivityListModel.ActivityRole)
+        if not activity:
+            return
+
+        c = AppStyles.COLORS
+        title_font, badge_font, desc_font, meta_font = self._fonts(option.font)
+        rects = self._layout(option.rect, bool(activity.description), option.font)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card
+        painter.setPen(QPen(QColor(c['primary_light'] if hovered else c['border']), 1))
+        painter.setBrush(QColor(c['bg_secondary'] if hovered else c['bg_primary']))
+        painter.drawRoundedRect(rects['card'].adjusted(0, 0, -1, -1), 8, 8)
+
+        # Title, elided to leave room for the duration badge
+        badge_metrics = QFontMetrics(badge_font)
+        badge_w = min(max(badge_metrics.horizontalAdvance(activity.duration) + 28, 80), 100)
+        title_rect = rects['title']
+        painter.setFont(title_font)
+        painter.setPen(QColor(c['text_primary']))
+        title = QFontMetrics(title_font).elidedText(
+            activity.title, Qt.TextElideMode.ElideRight, max(0, title_rect.width() - badge_w - 12)
+        )
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+
+        # Duration badge (right after the title)
+        title_w = QFontMetrics(title_font).horizontalAdvance(title)
+        badge_rect = QRect(
+            title_rect.left() + title_w + 12,
+            title_rect.top() + (title_rect.height() - self.BADGE_HEIGHT) // 2,
+            badge_w, self.BADGE_HEIGHT
+        )
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(c['primary_light']))
+        painter.drawRoundedRect(badge_rect, self.BADGE_HEIGHT / 2, self.BADGE_HEIGHT / 2)
+        painter.setFont(badge_font)
+        painter.setPen(QColor(c['text_white']))
+        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, activity.duration)
+
+        # Description preview (first 100 chars)
+        if activity.description:
+            desc_preview = activity.description[:self.DESCRIPTION_PREVIEW]
+            if len(activity.description) > self.DESCRIPTION_PREVIEW:
+                desc_preview += "..."
+            painter.setFont(desc_font)
+            painter.setPen(QColor(c['text_secondary']))
+            painter.drawText(
+                rects['description'],
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+                desc_preview
+            )
+
+        # Metadata (time and images)
+        meta = f"⏰ {activity.start_time} - {activity.end_time}"
+        if activity.images:
+            meta += f"    🖼️ {len(activity.images)} image(s)"
+        painter.setFont(meta_font)
+        painter.setPen(QColor(c['text_tertiary']))
+        painter.drawText(rects['meta'], Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, meta)
+
+        # Buttons
+        self._paint_button(painter, rects['edit'], "✏️ Editar", c['bg_primary'], c['text_primary'], c['border_dark'])
+        self._paint_button(painter, rects['delete'], "🗑️ Eliminar", c['danger'], c['text_white'], None)
+
+        painter.restore()
+
+    def _paint_button(self, painter: QPainter, rect: QRect, text: str, background: str, foreground: str,
+                      border: Optional[str]):
+        """Paint a flat button like the "secondary" and "danger" button variants."""
+        painter.setPen(QPen(QColor(border), 1) if border else Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 6, 6)
+        painter.setPen(QColor(foreground))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        """Turn clicks on the painted buttons (or a double click) into requests."""
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            activity: Activity = index.data(ActivityListModel.ActivityRole)
+            rects = self._layout(option.rect, bool(activity and activity.description), option.font)
+            pos = event.position().toPoint()
+            if rects['edit'].contains(pos):
+                self.edit_requested.emit(index.row())
+                return True
+            if rects['delete'].contains(pos):
+                self.delete_requested.emit(index.row())
+                return True
+        elif event.type() == QEvent.Type.MouseButtonDblClick:
+            self.edit_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ActivityListView(QListView):
+    """List view configured for ActivityItemDelegate rows."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(True)  # Hover highlight
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
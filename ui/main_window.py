@@ -1,221 +1,48 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QDateEdit, QTimeEdit, QPushButton, QListWidget,
-    QListWidgetItem, QMessageBox, QComboBox, QFrame, QFileDialog,
-    QApplication, QScrollArea, QGroupBox
+    QLineEdit, QDateEdit, QTimeEdit, QPushButton,
+    QMessageBox, QComboBox, QFrame, QFileDialog,
+    QApplication, QScrollArea, QGroupBox, QProgressDialog
 )
-from PySide6.QtCore import Qt, QDate, QTime, Signal
+from PySide6.QtCore import Qt, QDate, QTime, QThreadPool, QTimer
 from PySide6.QtGui import QIcon
 from datetime import date
-from models.activity_model import Activity
 from models.report_model import Report
+from models.report_repository import ReportRepository
+from services.compression import CompressionLevel
 from ui.activity_dialog import ActivityDialog
+from ui.activity_list import ActivityListModel, ActivityItemDelegate, ActivityListView
+from ui.pdf_worker import PdfGenerationWorker, PdfPrewarmWorker, PdfCacheWarmWorker
+from ui.report_index_worker import ReportIndexWorker
 from ui.styles import AppStyles
-from typing import Optional
+from typing import Optional, Callable, Dict, List, Any
 import sys
 import os
 
 
-class ActivityListItem(QWidget):
-    """Custom widget for activity list items."""
-    
-    edit_requested = Signal(int)
-    delete_requested = Signal(int)
-    
-    def __init__(self, activity: Activity, index: int, parent=None):
-        super().__init__(parent)
-        self.activity = activity
-        self.index = index
-        self.title_label = None
-        self.duration_badge = None
-        self.setup_ui()
-    
-    def update_theme(self):
-        """Update widget styles when theme changes."""
-        # Update card styling
-        self.setStyleSheet(f"""
-            ActivityListItem {{
-                background-color: {AppStyles.COLORS['bg_primary']};
-                border: 1px solid {AppStyles.COLORS['border']};
-                border-radius: {AppStyles.RADIUS['lg']};
-                padding: 4px;
-            }}
-            ActivityListItem:hover {{
-                border-color: {AppStyles.COLORS['primary_light']};
-                background-color: {AppStyles.COLORS['bg_secondary']};
-            }}
-        """)
-        
-        if self.title_label:
-            self.title_label.setStyleSheet(f"""
-                QLabel {{
-                    font-weight: 600;
-                    font-size: {AppStyles.FONTS['size_xl']};
-                    color: {AppStyles.COLORS['text_primary']};
-                }}
-            """)
-            self.title_label.setMinimumHeight(30)
-        
-        if self.duration_badge:
-            self.duration_badge.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-            self.duration_badge.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {AppStyles.COLORS['primary_light']};
-                    color: {AppStyles.COLORS['text_white']};
-                    padding: 6px 14px;
-                    border-radius: {AppStyles.RADIUS['full']};
-                    font-size: {AppStyles.FONTS['size_base']};
-                    font-weight: 600;
-                }}
-            """)
-            self.duration_badge.setMinimumWidth(80)
-            self.duration_badge.setMaximumWidth(100)
-            self.duration_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.duration_badge.setFixedHeight(25)
-            # Forzar actualización de geometría
-            self.duration_badge.updateGeometry()
-    
-    def setup_ui(self):
-        """Setup the list item UI."""
-        # Add card-like styling with more padding
-        self.setStyleSheet(f"""
-            ActivityListItem {{
-                background-color: {AppStyles.COLORS['bg_primary']};
-                border: 1px solid {AppStyles.COLORS['border']};
-                border-radius: {AppStyles.RADIUS['lg']};
-                padding: 4px;
-            }}
-            ActivityListItem:hover {{
-                border-color: {AppStyles.COLORS['primary_light']};
-                background-color: {AppStyles.COLORS['bg_secondary']};
-            }}
-        """)
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(20)
-        
-        # Left side - Activity info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(23)
-        
-        # Title and duration row
-        title_row = QHBoxLayout()
-        title_row.setSpacing(12)
-        
-        # Title
-        self.title_label = QLabel(self.activity.title)
-        self.title_label.setStyleSheet(f"""
-            QLabel {{
-                font-weight: 600;
-                font-size: {AppStyles.FONTS['size_xl']};
-                color: {AppStyles.COLORS['text_primary']};
-            }}
-        """)
-        self.title_label.setWordWrap(False)
-        self.title_label.setMinimumHeight(30)  # Asegurar altura suficiente
-        title_row.addWidget(self.title_label)
-        
-        # Duration badge (sin stretch, pegado al título)
-        self.duration_badge = QLabel(self.activity.duration)
-        self.duration_badge.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)  # Mantener estilos
-        self.duration_badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {AppStyles.COLORS['primary_light']};
-                color: {AppStyles.COLORS['text_white']};
-                padding: 6px 14px;
-                border-radius: {AppStyles.RADIUS['full']};
-                font-size: {AppStyles.FONTS['size_base']};
-                font-weight: 600;
-            }}
-        """)
-        self.duration_badge.setMinimumWidth(80)
-        self.duration_badge.setMaximumWidth(100)
-        self.duration_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.duration_badge.setFixedHeight(25)  # Altura fija para evitar cambios
-        title_row.addWidget(self.duration_badge)
-        
-        # Stretch después del badge (empuja todo a la izquierda)
-        title_row.addStretch()
-        
-        info_layout.addLayout(title_row)
-        
-        # Description preview (first 100 chars)
-        if self.activity.description:
-            desc_preview = self.activity.description[:100]
-            if len(self.activity.description) > 100:
-                desc_preview += "..."
-            desc_label = QLabel(desc_preview)
-            desc_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {AppStyles.COLORS['text_secondary']};
-                    font-size: {AppStyles.FONTS['size_base']};
-                    line-height: 1.5;
-                }}
-            """)
-            desc_label.setWordWrap(True)
-            info_layout.addWidget(desc_label)
-        
-        # Metadata row (time and images)
-        meta_layout = QHBoxLayout()
-        meta_layout.setSpacing(2)
-        
-        # Time range
-        time_label = QLabel(f"⏰ {self.activity.start_time} - {self.activity.end_time}")
-        time_label.setStyleSheet(f"""
-            QLabel {{
-                color: {AppStyles.COLORS['text_tertiary']};
-                font-size: {AppStyles.FONTS['size_sm']};
-            }}
-        """)
-        meta_layout.addWidget(time_label)
-        
-        # Images count if any
-        if len(self.activity.images) > 0:
-            images_label = QLabel(f"🖼️ {len(self.activity.images)} image(s)")
-            images_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {AppStyles.COLORS['text_tertiary']};
-                    font-size: {AppStyles.FONTS['size_sm']};
-                }}
-            """)
-            meta_layout.addWidget(images_label)
-        
-        meta_layout.addStretch()
-        info_layout.addLayout(meta_layout)
-        
-        layout.addLayout(info_layout, 1)
-        
-        # Right side - Action buttons (HORIZONTAL)
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(10)
-        
-        edit_btn = QPushButton("✏️ Editar")
-        edit_btn.setProperty("variant", "secondary")
-        edit_btn.setMinimumWidth(100)
-        edit_btn.setMinimumHeight(40)
-        edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        edit_btn.clicked.connect(lambda: self.edit_requested.emit(self.index))
-        actions_layout.addWidget(edit_btn)
-        
-        delete_btn = QPushButton("🗑️ Eliminar")
-        delete_btn.setProperty("variant", "danger")
-        delete_btn.setMinimumWidth(100)
-        delete_btn.setMinimumHeight(40)
-        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.clicked.connect(lambda: self.delete_requested.emit(self.index))
-        actions_layout.addWidget(delete_btn)
-        
-        layout.addLayout(actions_layout)
-
-
 class MainWindow(QMainWindow):
     """Main application window for Daily Report System."""
     
+    PREWARM_DELAY_MS = 300  # Let the first frames paint before importing the PDF pipeline
+    CACHE_WARM_DELAY_MS = 1000  # Idle time after a load or edit before pre-compressing images
+    
     def __init__(self):
         super().__init__()
         self.report: Optional[Report] = None
         self.current_file: Optional[str] = None
+        self.pdf_worker: Optional[PdfGenerationWorker] = None
+        self.pdf_progress: Optional[QProgressDialog] = None
+        self.pdf_progress_counts = {}
+        self._prewarm_started = False
+        self.cache_warm_worker: Optional[PdfCacheWarmWorker] = None
+        self.report_repository: Optional[ReportRepository] = None  # Opened on the first save
+        self.index_workers: List[ReportIndexWorker] = []
+        
+        # Restarted on every load/edit, so images are compressed once editing pauses
+        self.cache_warm_timer = QTimer(self)
+        self.cache_warm_timer.setSingleShot(True)
+        self.cache_warm_timer.setInterval(self.CACHE_WARM_DELAY_MS)
+        self.cache_warm_timer.timeout.connect(self.start_cache_warm)
         
         # Force proper rendering
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
@@ -397,16 +224,7 @@ class MainWindow(QMainWindow):
         instance_layout.addWidget(instance_label)
         
         self.instance_hours_display = QLabel("09:00")
-        self.instance_hours_display.setStyleSheet(f"""
-            QLabel {{
-                background-color: {AppStyles.COLORS['bg_tertiary']};
-                padding: 10px 12px;
-                border-radius: {AppStyles.RADIUS['md']};
-                font-size: {AppStyles.FONTS['size_lg']};
-                font-weight: 600;
-                color: {AppStyles.COLORS['primary']};
-            }}
-        """)
+        self.instance_hours_display.setProperty("metric", True)
         instance_layout.addWidget(self.instance_hours_display)
         
         row2.addWidget(instance_container, 1)
@@ -440,8 +258,15 @@ class MainWindow(QMainWindow):
         
         activities_layout.addLayout(activities_header)
         
-        # Activities list
-        self.activities_list = QListWidget()
+        # Activities list (rows are painted by the delegate, not per-row widgets)
+        self.activities_model = ActivityListModel(self.report, self)
+        self.activities_delegate = ActivityItemDelegate(self)
+        self.activities_delegate.edit_requested.connect(self.edit_activity)
+        self.activities_delegate.delete_requested.connect(self.delete_activity)
+        
+        self.activities_list = ActivityListView()
+        self.activities_list.setModel(self.activities_model)
+        self.activities_list.setItemDelegate(self.activities_delegate)
         self.activities_list.setMinimumHeight(300)
         activities_layout.addWidget(self.activities_list)
         
@@ -475,9 +300,10 @@ class MainWindow(QMainWindow):
         bottom_layout.addWidget(compression_label)
         
         self.compression_combo = QComboBox()
-        self.compression_combo.addItems(["Bajo", "Medio", "Alto"])
+        self.compression_combo.addItems(["Bajo", "Medio", "Alto", "Objetivo 100KB"])
         self.compression_combo.setCurrentIndex(1)
         self.compression_combo.setFixedWidth(150)
+        self.compression_combo.currentIndexChanged.connect(self.schedule_cache_warm)
         bottom_layout.addWidget(self.compression_combo)
         
         # Signature checkbox
@@ -494,14 +320,14 @@ class MainWindow(QMainWindow):
         
         bottom_layout.addStretch()
         
-        preview_btn = QPushButton("👁️ Previsualizar PDF")
-        preview_btn.setProperty("variant", "secondary")
-        preview_btn.clicked.connect(self.preview_pdf)
-        bottom_layout.addWidget(preview_btn)
+        self.preview_btn = QPushButton("👁️ Previsualizar PDF")
+        self.preview_btn.setProperty("variant", "secondary")
+        self.preview_btn.clicked.connect(self.preview_pdf)
+        bottom_layout.addWidget(self.preview_btn)
         
-        generate_btn = QPushButton("📄 Generar PDF")
-        generate_btn.clicked.connect(self.generate_pdf)
-        bottom_layout.addWidget(generate_btn)
+        self.generate_btn = QPushButton("📄 Generar PDF")
+        self.generate_btn.clicked.connect(self.generate_pdf)
+        bottom_layout.addWidget(self.generate_btn)
         
         main_layout.addLayout(bottom_layout)
         
@@ -537,12 +363,8 @@ class MainWindow(QMainWindow):
         # Reapply styles
         self.apply_styles()
         
-        # Update all activity list items
-        for i in range(self.activities_list.count()):
-            item = self.activities_list.item(i)
-            widget = self.activities_list.itemWidget(item)
-            if isinstance(widget, ActivityListItem):
-                widget.update_theme()
+        # Activity rows read the theme colors when painted
+        self.activities_list.viewport().update()
     
     def new_report(self):
         """Create a new report."""
@@ -557,7 +379,7 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.No:
                 return
         
-        self.report = Report()
+        self.set_report(Report())
         self.current_file = None
         
         # Reset form if UI is ready
@@ -583,7 +405,19 @@ class MainWindow(QMainWindow):
             self.exit_time_input.blockSignals(False)
             
             self.refresh_activities_list()
-            self.update_summary()
+            self.show_summary()
+    
+    def set_report(self, report: Report):
+        """
+        Make a report the current one and follow its activity changes.
+        
+        Args:
+            report: Report to edit
+        """
+        if self.report:
+            self.report.remove_listener(self.on_report_changed)
+        self.report = report
+        self.report.add_listener(self.on_report_changed)
     
     def load_report(self):
         """Load report from JSON file."""
@@ -597,7 +431,7 @@ class MainWindow(QMainWindow):
         if file_path:
             report, message = Report.from_json(file_path)
             if report:
-                self.report = report
+                self.set_report(report)
                 self.current_file = file_path
                 self.load_report_data()
                 QMessageBox.information(self, "Success", f"Report loaded successfully!\n\n{file_path}")
@@ -623,6 +457,7 @@ class MainWindow(QMainWindow):
         # Save to current file
         success, message = self.report.to_json(self.current_file)
         if success:
+            self.index_saved_report(self.current_file)
             QMessageBox.information(self, "Success", f"Report saved!\n\n{self.current_file}")
         else:
             QMessageBox.critical(self, "Error", message)
@@ -658,10 +493,45 @@ class MainWindow(QMainWindow):
             success, message = self.report.to_json(file_path)
             if success:
                 self.current_file = file_path
+                self.index_saved_report(file_path)
                 QMessageBox.information(self, "Success", f"Report saved successfully!\n\n{file_path}")
             else:
                 QMessageBox.critical(self, "Error", message)
     
+    def index_saved_report(self, file_path: str):
+        """
+        Update the report database and its search index in the background.
+        
+        Args:
+            file_path: JSON file the report was saved to
+        """
+        if not self.report_repository:
+            try:
+                self.report_repository = ReportRepository(check_same_thread=False)
+            except Exception as e:
+                self.on_report_indexed(None, False, f"Error opening report database: {str(e)}")
+                return
+        
+        worker = ReportIndexWorker(self.report_repository, self.report.copy(), file_path)
+        worker.signals.finished.connect(
+            lambda success, message: self.on_report_indexed(worker, success, message)
+        )
+        self.index_workers.append(worker)
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_report_indexed(self, worker: Optional[ReportIndexWorker], success: bool, message: str):
+        """Forget a finished indexing worker and report a failure."""
+        if worker in self.index_workers:
+            self.index_workers.remove(worker)
+        
+        if not success:
+            # The JSON file is saved either way
+            QMessageBox.warning(
+                self,
+                "Report Database",
+                f"The report was saved, but it could not be added to the report database.\n\n{message}"
+            )
+    
     def load_report_data(self):
         """Load report data into form."""
         if not self.report:
@@ -701,7 +571,8 @@ class MainWindow(QMainWindow):
         
         # Refresh activities
         self.refresh_activities_list()
-        self.update_summary()
+        self.show_summary()
+        self.schedule_cache_warm()
     
     def update_report_data(self):
         """Update report object from form data."""
@@ -735,10 +606,7 @@ class MainWindow(QMainWindow):
             activity = dialog.get_activity()
             if activity:
                 success, message = self.report.add_activity(activity)
-                if success:
-                    self.refresh_activities_list()
-                    self.update_summary()
-                else:
+                if not success:
                     QMessageBox.warning(self, "Error", message)
     
     def edit_activity(self, index: int):
@@ -752,10 +620,7 @@ class MainWindow(QMainWindow):
             updated_activity = dialog.get_activity()
             if updated_activity:
                 success, message = self.report.edit_activity(index, updated_activity)
-                if success:
-                    self.refresh_activities_list()
-                    self.update_summary()
-                else:
+                if not success:
                     QMessageBox.warning(self, "Error", message)
     
     def delete_activity(self, index: int):
@@ -773,44 +638,31 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             success, message = self.report.remove_activity(index)
-            if success:
-                self.refresh_activities_list()
-                self.update_summary()
-            else:
+            if not success:
                 QMessageBox.warning(self, "Error", message)
     
     def refresh_activities_list(self):
-        """Refresh the activities list widget."""
-        self.activities_list.clear()
-        
-        if not self.report:
-            return
-        
-        for i in range(self.report.get_activity_count()):
-            activity = self.report.get_activity(i)
-            if activity:
-                item = QListWidgetItem(self.activities_list)
-                item_widget = ActivityListItem(activity, i)
-                item_widget.edit_requested.connect(self.edit_activity)
-                item_widget.delete_requested.connect(self.delete_activity)
-                
-                item.setSizeHint(item_widget.sizeHint())
-                self.activities_list.addItem(item)
-                self.activities_list.setItemWidget(item, item_widget)
-    
-    def update_summary(self):
-        """Update activity summary labels."""
+        """Show the current report's activities in the list."""
+        self.activities_model.set_report(self.report)
+    
+    def on_report_changed(self, event: Dict[str, Any]):
+        """Refresh the summary after a report change."""
+        if event['change'] in ('inserted', 'updated'):
+            self.schedule_cache_warm()  # New images to pre-compress
+        if event['change'] != 'moved':  # Totals don't depend on order
+            self.show_summary()
+    
+    def show_summary(self):
+        """Update activity summary labels from the report's statistics."""
         if not self.report:
             return
         
-        count = self.report.get_activity_count()
+        # The report keeps these aggregates up to date, no scan needed
+        statistics = self.report.get_statistics()
+        count = statistics['total_activities']
         self.activity_count_label.setText(f"{count} {'activity' if count == 1 else 'activities'}")
-        
-        total_time = self.report.calculate_total_activity_hours()
-        self.total_time_label.setText(f"Tiempo Total de Actividades: {total_time}")
-        
-        total_images = self.report.get_total_images_count()
-        self.total_images_label.setText(f"Total de Imágenes: {total_images}")
+        self.total_time_label.setText(f"Tiempo Total de Actividades: {statistics['total_activity_hours']}")
+        self.total_images_label.setText(f"Total de Imágenes: {statistics['total_images']}")
     
     def preview_pdf(self):
         """Preview PDF before saving."""
@@ -823,82 +675,17 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Validation Error", message)
             return
         
-        try:
-            from services.pdf_generator import generate_pdf, CompressionLevel
-            import tempfile
-            import subprocess
-            import platform
-            
-            # Map combo text to compression level
-            compression_map = {
-                "Bajo": CompressionLevel.LOW,
-                "Medio": CompressionLevel.MEDIUM,
-                "Alto": CompressionLevel.HIGH
-            }
-            compression = compression_map.get(
-                self.compression_combo.currentText(),
-                CompressionLevel.MEDIUM
-            )
-            
-            # Get signature preference
-            include_signatures = self.signatures_checkbox.isChecked()
-            
-            # Generate preview in temp file
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix='.pdf',
-                prefix='preview_'
-            )
-            temp_file.close()
-            
-            # Show progress
-            QMessageBox.information(
-                self,
-                "Generating Preview",
-                "Generating PDF preview...\nThis may take a moment."
-            )
-            
-            # Generate PDF
-            success, msg = generate_pdf(self.report, temp_file.name, compression, include_signatures)
-            
-            if success:
-                # Open with default PDF viewer
-                system = platform.system()
-                try:
-                    if system == 'Darwin':  # macOS
-                        subprocess.call(['open', temp_file.name])
-                    elif system == 'Windows':
-                        os.startfile(temp_file.name)
-                    else:  # Linux
-                        subprocess.call(['xdg-open', temp_file.name])
-                    
-                    QMessageBox.information(
-                        self,
-                        "Preview Ready",
-                        "PDF preview opened in your default viewer."
-                    )
-                except Exception as e:
-                    QMessageBox.information(
-                        self,
-                        "Preview Generated",
-                        f"Preview saved to:\n{temp_file.name}\n\nPlease open it manually."
-                    )
-            else:
-                QMessageBox.critical(self, "Error", msg)
-                
-        except ImportError:
-            QMessageBox.critical(
-                self,
-                "Missing Dependency",
-                "ReportLab is required for PDF generation.\n\n"
-                "Install it with:\npip install reportlab"
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error generating preview:\n{str(e)}"
-            )
+        import tempfile
+        
+        # Generate preview in temp file
+        temp_file = tempfile.NamedTemporaryFile(
+            delete=False,
+            suffix='.pdf',
+            prefix='preview_'
+        )
+        temp_file.close()
+        
+        self.start_pdf_generation(temp_file.name, "Generating Preview", self._show_preview)
     
     def generate_pdf(self):
         """Generate and save PDF."""
@@ -911,82 +698,210 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Validation Error", message)
             return
         
-        try:
-            from services.pdf_generator import generate_pdf, CompressionLevel
-            
-            # Get save location
-            default_name = f"report_{self.report.date.strftime('%Y-%m-%d')}_{self.report.student.replace(' ', '_')}.pdf"
-            
-            file_path, _ = QFileDialog.getSaveFileName(
+        # Get save location
+        default_name = f"report_{self.report.date.strftime('%Y-%m-%d')}_{self.report.student.replace(' ', '_')}.pdf"
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save PDF Report",
+            default_name,
+            "PDF Files (*.pdf)"
+        )
+        
+        if not file_path:
+            return  # User cancelled
+        
+        self.start_pdf_generation(file_path, "Generating PDF", self._offer_open_pdf)
+    
+    def get_compression_level(self) -> str:
+        """Map compression combo text to a compression level."""
+        compression_map = {
+            "Bajo": CompressionLevel.LOW,
+            "Medio": CompressionLevel.MEDIUM,
+            "Alto": CompressionLevel.HIGH,
+            "Objetivo 100KB": CompressionLevel.TARGET_SIZE
+        }
+        return compression_map.get(
+            self.compression_combo.currentText(),
+            CompressionLevel.MEDIUM
+        )
+    
+    def start_pdf_generation(self, output_path: str, title: str, on_success: Callable[[str], None]):
+        """
+        Generate a PDF in the background while showing a progress dialog.
+        
+        Args:
+            output_path: Where to save the PDF
+            title: Progress dialog title
+            on_success: Called with output_path when the PDF is ready
+        """
+        if self.pdf_worker:
+            return  # Already generating
+        
+        # The generator compresses whatever the background pass hasn't cached yet
+        self.cache_warm_timer.stop()
+        if self.cache_warm_worker:
+            self.cache_warm_worker.cancel()
+        
+        # Work on a snapshot so the form can't change the report mid-generation
+        self.pdf_worker = PdfGenerationWorker(
+            self.report.copy(),
+            output_path,
+            self.get_compression_level(),
+            self.signatures_checkbox.isChecked()
+        )
+        self.pdf_progress_counts = {}
+        
+        self.pdf_progress = QProgressDialog("Preparing PDF...", "Cancelar", 0, 0, self)
+        self.pdf_progress.setWindowTitle(title)
+        self.pdf_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.pdf_progress.setMinimumDuration(0)
+        self.pdf_progress.setAutoClose(False)
+        self.pdf_progress.setAutoReset(False)
+        self.pdf_progress.canceled.connect(self.cancel_pdf_generation)
+        
+        self.pdf_worker.signals.progress.connect(self.on_pdf_progress)
+        self.pdf_worker.signals.finished.connect(
+            lambda success, message: self.on_pdf_finished(success, message, output_path, on_success)
+        )
+        
+        self.preview_btn.setEnabled(False)
+        self.generate_btn.setEnabled(False)
+        self.pdf_progress.show()
+        QThreadPool.globalInstance().start(self.pdf_worker)
+    
+    def cancel_pdf_generation(self):
+        """Request cancellation of the running PDF generation."""
+        if self.pdf_worker:
+            self.pdf_worker.cancel()
+            self.pdf_progress.setLabelText("Cancelling...")
+    
+    def on_pdf_progress(self, stage: str, done: int, total: int):
+        """Update the progress dialog from worker progress."""
+        if not self.pdf_progress or (self.pdf_worker and self.pdf_worker.is_cancelled()):
+            return
+        
+        self.pdf_progress_counts[stage] = (done, total)
+        self.pdf_progress.setMaximum(sum(t for _, t in self.pdf_progress_counts.values()))
+        self.pdf_progress.setValue(sum(d for d, _ in self.pdf_progress_counts.values()))
+        
+        if stage == "image":
+            self.pdf_progress.setLabelText(f"Compressing images ({done}/{total})...")
+        else:
+            self.pdf_progress.setLabelText(f"Building activities ({done}/{total})...")
+    
+    def on_pdf_finished(self, success: bool, message: str, output_path: str, on_success: Callable[[str], None]):
+        """Handle the end of a background PDF generation."""
+        cancelled = self.pdf_worker.is_cancelled() if self.pdf_worker else False
+        self.pdf_worker = None
+        
+        if self.pdf_progress:
+            self.pdf_progress.close()
+            self.pdf_progress = None
+        
+        self.preview_btn.setEnabled(True)
+        self.generate_btn.setEnabled(True)
+        
+        if success:
+            on_success(output_path)
+        elif not cancelled:
+            QMessageBox.critical(self, "Error", message)
+    
+    def schedule_cache_warm(self):
+        """Pre-compress the report's images once the user stops editing for a moment."""
+        if self.report and self.report.get_total_images_count() > 0:
+            self.cache_warm_timer.start()
+    
+    def start_cache_warm(self):
+        """Fill the image cache for the selected compression level in the background."""
+        if self.pdf_worker or not self.report:
+            return  # Generation compresses the images itself
+        
+        if self.cache_warm_worker:
+            # Stop the pass for the old report state and retry once it has stopped
+            self.cache_warm_worker.cancel()
+            self.cache_warm_timer.start()
+            return
+        
+        self.cache_warm_worker = PdfCacheWarmWorker(self.report.copy(), self.get_compression_level())
+        self.cache_warm_worker.signals.finished.connect(self.on_cache_warm_finished)
+        QThreadPool.globalInstance().start(self.cache_warm_worker)
+    
+    def on_cache_warm_finished(self, success: bool, message: str):
+        """Forget the finished background compression pass."""
+        self.cache_warm_worker = None
+    
+    def _show_preview(self, file_path: str):
+        """Open a generated preview with the default viewer."""
+        if self.open_file(file_path):
+            QMessageBox.information(
                 self,
-                "Save PDF Report",
-                default_name,
-                "PDF Files (*.pdf)"
+                "Preview Ready",
+                "PDF preview opened in your default viewer."
             )
-            
-            if not file_path:
-                return  # User cancelled
-            
-            # Map combo text to compression level
-            compression_map = {
-                "Bajo": CompressionLevel.LOW,
-                "Medio": CompressionLevel.MEDIUM,
-                "Alto": CompressionLevel.HIGH
-            }
-            compression = compression_map.get(
-                self.compression_combo.currentText(),
-                CompressionLevel.MEDIUM
-            )
-            
-            # Get signature preference
-            include_signatures = self.signatures_checkbox.isChecked()
-            
-            # Generate PDF
-            success, msg = generate_pdf(self.report, file_path, compression, include_signatures)
-            
-            if success:
-                reply = QMessageBox.question(
-                    self,
-                    "PDF Generated",
-                    f"PDF saved successfully!\n\n{file_path}\n\nWould you like to open it?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    import subprocess
-                    import platform
-                    
-                    system = platform.system()
-                    try:
-                        if system == 'Darwin':  # macOS
-                            subprocess.call(['open', file_path])
-                        elif system == 'Windows':
-                            os.startfile(file_path)
-                        else:  # Linux
-                            subprocess.call(['xdg-open', file_path])
-                    except Exception as e:
-                        QMessageBox.information(
-                            self,
-                            "File Saved",
-                            f"PDF saved to:\n{file_path}\n\nPlease open it manually."
-                        )
-            else:
-                QMessageBox.critical(self, "Error", msg)
-                
-        except ImportError:
-            QMessageBox.critical(
+        else:
+            QMessageBox.information(
                 self,
-                "Missing Dependency",
-                "ReportLab is required for PDF generation.\n\n"
-                "Install it with:\npip install reportlab"
+                "Preview Generated",
+                f"Preview saved to:\n{file_path}\n\nPlease open it manually."
             )
-        except Exception as e:
-            QMessageBox.critical(
+    
+    def _offer_open_pdf(self, file_path: str):
+        """Ask to open a generated PDF."""
+        reply = QMessageBox.question(
+            self,
+            "PDF Generated",
+            f"PDF saved successfully!\n\n{file_path}\n\nWould you like to open it?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes and not self.open_file(file_path):
+            QMessageBox.information(
                 self,
-                "Error",
-                f"Error generating PDF:\n{str(e)}"
+                "File Saved",
+                f"PDF saved to:\n{file_path}\n\nPlease open it manually."
             )
-
+    
+    def open_file(self, file_path: str) -> bool:
+        """Open a file with the system default application."""
+        import subprocess
+        import platform
+        
+        system = platform.system()
+        try:
+            if system == 'Darwin':  # macOS
+                subprocess.call(['open', file_path])
+            elif system == 'Windows':
+                os.startfile(file_path)
+            else:  # Linux
+                subprocess.call(['xdg-open', file_path])
+            return True
+        except Exception:
+            return False
+    
+    def showEvent(self, event):
+        """Pre-warm the PDF pipeline the first time the window is shown."""
+        super().showEvent(event)
+        if not self._prewarm_started:
+            self._prewarm_started = True
+            QTimer.singleShot(self.PREWARM_DELAY_MS, self.prewarm_pdf_pipeline)
+    
+    def prewarm_pdf_pipeline(self):
+        """Import ReportLab and PIL in the background, off the startup path."""
+        QThreadPool.globalInstance().start(PdfPrewarmWorker())
+    
+    def closeEvent(self, event):
+        """Stop background work and close the report database before closing."""
+        self.cache_warm_timer.stop()
+        workers = [worker for worker in (self.pdf_worker, self.cache_warm_worker) if worker]
+        for worker in workers:
+            worker.cancel()
+        if workers or self.index_workers:
+            QThreadPool.globalInstance().waitForDone()  # Pending saves are finished
+        if self.report_repository:
+            self.report_repository.close()
+            self.report_repository = None
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
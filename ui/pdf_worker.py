@@ -0,0 +1,151 @@
+"""
+Background PDF generation for Daily Report System.
+Runs PDFGenerator in a QThreadPool so the window stays responsive.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+from models.report_model import Report
+from typing import Dict, Optional, Any
+import threading
+
+
+class PdfWorkerSignals(QObject):
+    """Signals emitted by PdfGenerationWorker (delivered on the GUI thread)."""
+
+    progress = Signal(str, int, int)  # stage ("image"/"activity"), done, total
+    event = Signal(dict)              # Raw PDFGenerator instrumentation event
+    finished = Signal(bool, str)      # success, message
+
+
+class PdfGenerationWorker(QRunnable):
+    """Generates a PDF on a QThreadPool thread with progress and cancel support."""
+
+    def __init__(
+        self,
+        report: Report,
+        output_path: str,
+        compression_level: str,
+        include_signatures: bool = False,
+        target_size_bytes: Optional[int] = None
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            report: Report to render (copy it first if the UI keeps editing it)
+            output_path: Where to save the PDF
+            compression_level: "low", "medium", "high" or "target_size"
+            include_signatures: Whether to include signature fields
+            target_size_bytes: Total PDF budget for "target_size" (default 100KB)
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.report = report
+        self.output_path = output_path
+        self.compression_level = compression_level
+        self.include_signatures = include_signatures
+        self.target_size_bytes = target_size_bytes
+        self.signals = PdfWorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation; finished is emitted once the generator stops."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """Check if cancellation was requested."""
+        return self._cancel_event.is_set()
+
+    def run(self):
+        """Generate the PDF (runs on a pool thread)."""
+        try:
+            from services.pdf_generator import PDFGenerator
+
+            generator = PDFGenerator(
+                self.report,
+                self.compression_level,
+                self.include_signatures,
+                target_size_bytes=self.target_size_bytes,
+                cancel_event=self._cancel_event,
+                event_callback=self._on_event,
+                incremental=True  # Regenerating after an edit only redoes the edited activities
+            )
+            success, message = generator.generate(self.output_path)
+        except ImportError:
+            success, message = False, (
+                "ReportLab is required for PDF generation.\n\n"
+                "Install it with:\npip install reportlab"
+            )
+        except Exception as e:
+            success, message = False, f"Error generating PDF: {str(e)}"
+
+        self.signals.finished.emit(success, message)
+
+    def _on_event(self, event: Dict[str, Any]):
+        """Forward generator events to the GUI thread."""
+        if event['event'] == 'progress':
+            self.signals.progress.emit(event['stage'], event['done'], event['total'])
+        self.signals.event.emit(event)
+
+
+class PdfPrewarmWorker(QRunnable):
+    """
+    Imports the PDF pipeline (ReportLab, PIL) on a pool thread.
+
+    Started once the window is shown, so the first preview or generation
+    doesn't pay the import cost and startup doesn't either.
+    """
+
+    def run(self):
+        """Import the PDF modules (runs on a pool thread)."""
+        try:
+            import services.pdf_generator  # noqa: F401 (imported for its side effect)
+        except ImportError:
+            pass  # Reported when the user actually generates a PDF
+
+
+class PdfCacheWarmWorker(QRunnable):
+    """Pre-compresses a report's images into the image cache on a pool thread."""
+
+    MAX_WORKERS = 2  # Background work: leave cores for the GUI
+
+    def __init__(self, report: Report, compression_level: str, target_size_bytes: Optional[int] = None):
+        """
+        Initialize worker.
+
+        Args:
+            report: Report whose images are compressed (copy it first if the UI keeps editing it)
+            compression_level: Compression level the cache is filled for:
+                "low", "medium", "high" or "target_size"
+            target_size_bytes: Total PDF budget for "target_size" (default 100KB)
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.report = report
+        self.compression_level = compression_level
+        self.target_size_bytes = target_size_bytes
+        self.signals = PdfWorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation; finished is emitted once compression stops."""
+        self._cancel_event.set()
+
+    def run(self):
+        """Compress the images (runs on a pool thread)."""
+        try:
+            from services.pdf_generator import PDFGenerator
+
+            generator = PDFGenerator(
+                self.report,
+                self.compression_level,
+                target_size_bytes=self.target_size_bytes,
+                max_workers=self.MAX_WORKERS,
+                cancel_event=self._cancel_event,
+                incremental=True
+            )
+            success, message = generator.warm_cache()
+        except Exception as e:
+            success, message = False, f"Error warming image cache: {str(e)}"
+
+        self.signals.finished.emit(success, message)
@@ -0,0 +1,50 @@
+"""
+Background report indexing for Daily Report System.
+Stores saved reports in the report database (and its search index) on a
+QThreadPool thread.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+from models.report_model import Report
+from models.report_repository import ReportRepository
+import threading
+
+
+class ReportIndexWorkerSignals(QObject):
+    """Signals emitted by ReportIndexWorker (delivered on the GUI thread)."""
+
+    finished = Signal(bool, str)  # success, message
+
+
+class ReportIndexWorker(QRunnable):
+    """Stores a saved report in the report database on a pool thread."""
+
+    # Workers share the window's connection: one save at a time
+    lock = threading.Lock()
+
+    def __init__(self, repository: ReportRepository, report: Report, source_path: str):
+        """
+        Initialize worker.
+
+        Args:
+            repository: Repository to store into, opened with check_same_thread=False
+            report: Report that was saved (copy it first if the UI keeps editing it)
+            source_path: JSON file the report was saved to
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.repository = repository
+        self.report = report
+        self.source_path = source_path
+        self.signals = ReportIndexWorkerSignals()
+
+    def run(self):
+        """Store the report (runs on a pool thread)."""
+        try:
+            with self.lock:
+                report_id, message = self.repository.add_report(self.report, self.source_path)
+            success = report_id is not None
+        except Exception as e:
+            success, message = False, f"Error indexing report: {str(e)}"
+
+        self.signals.finished.emit(success, message)
@@ -3,6 +3,8 @@ Modern stylesheet for Daily Report System.
 Professional design with clean aesthetics.
 """
 
+from typing import Dict
+
 
 class AppStyles:
     """Centralized styles for the application."""
@@ -87,6 +89,9 @@ class AppStyles:
     # Track current theme
     CURRENT_THEME = "light"
     
+    # Main stylesheet by theme, built on first use
+    _STYLESHEET_CACHE: Dict[str, str] = {}
+    
     # Fonts
     FONTS = {
         'family': '"Segoe UI", "SF Pro Display", -apple-system, system-ui, sans-serif',
@@ -155,8 +160,23 @@ class AppStyles:
     
     @classmethod
     def get_main_stylesheet(cls) -> str:
-        """Returns the main application stylesheet."""
-        c = cls.COLORS
+        """
+        Returns the main application stylesheet for the current theme.
+        
+        Each theme's stylesheet is built once and cached, so theme toggles
+        and new dialogs don't rebuild it.
+        """
+        stylesheet = cls._STYLESHEET_CACHE.get(cls.CURRENT_THEME)
+        if stylesheet is None:
+            colors = cls.COLORS_DARK if cls.CURRENT_THEME == "dark" else cls.COLORS_LIGHT
+            stylesheet = cls._build_main_stylesheet(colors)
+            cls._STYLESHEET_CACHE[cls.CURRENT_THEME] = stylesheet
+        return stylesheet
+    
+    @classmethod
+    def _build_main_stylesheet(cls, colors: Dict[str, str]) -> str:
+        """Builds the main application stylesheet for a color palette."""
+        c = colors
         f = cls.FONTS
         r = cls.RADIUS
         
@@ -429,26 +449,26 @@ class AppStyles:
             color: {c['text_primary']};
         }}
         
-        /* List Widget */
-        QListWidget {{
+        /* List View */
+        QListView {{
             border: 1px solid {c['border']};
             border-radius: {r['md']};
             background-color: {c['bg_secondary']};
             padding: 8px;
         }}
         
-        QListWidget::item {{
+        QListView::item {{
             padding: 8px;
             border-radius: {r['sm']};
             margin: 6px 0px;
             background-color: transparent;
         }}
         
-        QListWidget::item:selected {{
+        QListView::item:selected {{
             background-color: transparent;
         }}
         
-        QListWidget::item:hover {{
+        QListView::item:hover {{
             background-color: transparent;
         }}
         
@@ -637,6 +657,22 @@ class AppStyles:
             max-height: 1px;
             border: none;
         }}
+        
+        QFrame[thumbnail="true"] {{
+            background-color: {c['bg_tertiary']};
+            border: 2px solid {c['border']};
+            border-radius: {r['md']};
+        }}
+        
+        /* Read-only values (durations, instance hours) */
+        QLabel[metric="true"] {{
+            background-color: {c['bg_tertiary']};
+            padding: 10px 12px;
+            border-radius: {r['md']};
+            font-size: {f['size_lg']};
+            font-weight: 600;
+            color: {c['primary']};
+        }}
         """
     
     @classmethod
@@ -0,0 +1,132 @@
+"""
+Background thumbnail loading for Daily Report System.
+Decodes image previews off the GUI thread at reduced size and keeps them
+in an application-wide cache.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+from typing import Optional, Set
+import os
+
+
+class ThumbnailTask(QRunnable):
+    """Decodes one thumbnail on a pool thread."""
+
+    def __init__(self, loader: 'ThumbnailLoader', key: str, image_path: str, size: QSize):
+        """
+        Initialize task.
+
+        Args:
+            loader: Loader that receives the result
+            key: Cache key of the thumbnail
+            image_path: Path to image
+            size: Bounding box for the thumbnail
+        """
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.image_path = image_path
+        self.size = size
+
+    def run(self):
+        """Decode the image (runs on a pool thread)."""
+        reader = QImageReader(self.image_path)
+        reader.setAutoTransform(True)
+
+        # Let the decoder scale (JPEG DCT scaling) so the full image is never decoded
+        original = reader.size()
+        if original.isValid():
+            reader.setScaledSize(original.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatio))
+
+        image = reader.read()  # Null QImage if the file can't be read
+        try:
+            self.loader.image_decoded.emit(self.key, self.image_path, image)
+        except RuntimeError:
+            pass  # Loader already destroyed (application shutting down)
+
+
+class ThumbnailLoader(QObject):
+    """
+    Loads image thumbnails on a background thread pool.
+
+    Decoded thumbnails are kept in QPixmapCache keyed by path, modification
+    time and size, so every dialog and grid shares them and an unchanged
+    image is never decoded twice while it stays in the cache.
+
+    QImage (unlike QPixmap) can be created outside the GUI thread, so tasks
+    decode to QImage and the loader converts to QPixmap on the GUI thread.
+    """
+
+    thumbnail_ready = Signal(str, QPixmap)  # image path, thumbnail (null on error)
+    image_decoded = Signal(str, str, QImage)  # Internal: cache key, image path, image
+
+    MAX_THREADS = 2  # Leave cores for the GUI and PDF generation
+    CACHE_LIMIT_KB = 32 * 1024  # ~800 thumbnails of 116x87
+
+    _instance: Optional['ThumbnailLoader'] = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self.MAX_THREADS)
+        self._pending: Set[str] = set()
+        self.image_decoded.connect(self._on_image_decoded)
+
+        if QPixmapCache.cacheLimit() < self.CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.CACHE_LIMIT_KB)
+
+    @classmethod
+    def instance(cls) -> 'ThumbnailLoader':
+        """Get the shared application loader."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def cache_key(image_path: str, size: QSize) -> str:
+        """
+        Build the cache key for a thumbnail.
+
+        Args:
+            image_path: Path to image
+            size: Bounding box for the thumbnail
+
+        Returns:
+            str: Key that changes when the file is modified
+        """
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        return f"thumb:{os.path.abspath(image_path)}:{mtime}:{size.width()}x{size.height()}"
+
+    def thumbnail(self, image_path: str, size: QSize) -> Optional[QPixmap]:
+        """
+        Get a cached thumbnail, or queue it for background decoding.
+
+        Args:
+            image_path: Path to image
+            size: Bounding box for the thumbnail
+
+        Returns:
+            QPixmap: Cached thumbnail, or None if thumbnail_ready will deliver it
+        """
+        key = self.cache_key(image_path, size)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        if key not in self._pending:  # Otherwise its result reaches every receiver
+            self._pending.add(key)
+            self.thread_pool.start(ThumbnailTask(self, key, image_path, size))
+        return None
+
+    def _on_image_decoded(self, key: str, image_path: str, image: QImage):
+        """Cache a decoded thumbnail and deliver it (runs on the GUI thread)."""
+        self._pending.discard(key)
+
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+        self.thumbnail_ready.emit(image_path, pixmap)